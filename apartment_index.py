@@ -0,0 +1,98 @@
+"""
+아파트 단지 공간 검색
+데이터셋을 준비할 때 단지 좌표로 GeoIndex(KD-tree + 위도 정렬 배열)를 만들어 두고,
+반경/사각 영역/최근접 검색 결과를 데이터프레임 행 위치로 돌려줍니다.
+"""
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from dataset_schema import as_float64
+from geo_index import GeoIndex
+
+
+class ApartmentSpatialIndex:
+    """단지 좌표 공간 인덱스 (좌표가 없거나 0인 단지는 검색 대상에서 제외)"""
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Args:
+            df: 위도/경도 컬럼이 있는 앱 데이터프레임
+        """
+        if "위도" in df.columns and "경도" in df.columns:
+            lats = as_float64(df["위도"]).to_numpy(dtype=float, na_value=np.nan)
+            lons = as_float64(df["경도"]).to_numpy(dtype=float, na_value=np.nan)
+        else:
+            lats = lons = np.full(len(df), np.nan)
+        valid = np.isfinite(lats) & np.isfinite(lons) & (lats != 0) & (lons != 0)
+        self.positions = np.flatnonzero(valid)
+        self.geo = GeoIndex(lats[valid], lons[valid])
+
+    def __len__(self):
+        return len(self.positions)
+
+    def within_radius(self, lat: float, lon: float, km: float) -> np.ndarray:
+        """
+        중심에서 km 이내 단지 (대원 거리)
+
+        Args:
+            lat: 중심 위도
+            lon: 중심 경도
+            km: 반경 (km)
+
+        Returns:
+            np.ndarray: 행 위치 배열 (오름차순)
+        """
+        if len(self) == 0:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(self.positions[self.geo.query_radius(lat, lon, km)])
+
+    def within_radius_of_any(self, lats, lons, km: float) -> np.ndarray:
+        """
+        여러 중심 중 하나라도 km 이내인 단지 (노선 역세권 등)
+
+        Args:
+            lats: 중심 위도 배열
+            lons: 중심 경도 배열
+            km: 반경 (km)
+
+        Returns:
+            np.ndarray: 행 위치 배열 (오름차순)
+        """
+        if len(self) == 0 or len(lats) == 0:
+            return np.empty(0, dtype=np.int64)
+        matches = [self.geo.query_radius(lat, lon, km) for lat, lon in zip(lats, lons)]
+        return np.sort(self.positions[np.unique(np.concatenate(matches))])
+
+    def within_bbox(self, south: float, west: float, north: float, east: float) -> np.ndarray:
+        """
+        사각 영역 내 단지 (지도 화면 범위 등)
+
+        Args:
+            south: 남쪽 위도
+            west: 서쪽 경도
+            north: 북쪽 위도
+            east: 동쪽 경도
+
+        Returns:
+            np.ndarray: 행 위치 배열 (오름차순)
+        """
+        if len(self) == 0:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(self.positions[self.geo.query_bbox(south, west, north, east)])
+
+    def k_nearest(self, lat: float, lon: float, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        가까운 단지 k개
+
+        Args:
+            lat: 기준 위도
+            lon: 기준 경도
+            k: 개수
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (행 위치 배열, 거리(km) 배열) - 가까운 순
+        """
+        distances, idx = self.geo.query(lat, lon, k)
+        return self.positions[idx[0]], distances[0]
@@ -1,177 +1,276 @@
 """
 서울 아파트 검색 앱 (Streamlit)
 """
+import json
 import os
-import re
-from difflib import SequenceMatcher
+import uuid
 
+import numpy as np
 import pandas as pd
 import streamlit as st
-import folium
+import streamlit.components.v1 as components
 from streamlit_folium import st_folium
 
+from apartment_index import ApartmentSpatialIndex
+from apt_matcher import enrich_with_main_apt
+from config import (
+    APP_DATA_COLUMNS,
+    LIST_PAGE_SIZES,
+    MAP_RAW_MIN_ZOOM,
+    MAP_RAW_POINT_LIMIT,
+    METADATA_FILE,
+    WALK_NETWORK_EDGES_FILE,
+    WALK_NETWORK_NODES_FILE,
+)
 from crawler import SeoulApartmentCrawler
-from utils import extract_dong
-
-# 새로 수집한 데이터를 세션에 넣어두는 키 (Cloud에서 파일 저장이 안 돼도 새로고침 반영)
+from dataset_schema import apply_schema, drop_passthrough_columns, memory_usage_mb
+from district_stats import (
+    compute_distribution_charts,
+    compute_district_stats,
+    load_district_stats,
+    save_district_stats,
+    stats_to_csv_bytes,
+)
+from export import EXPORT_FORMATS, ExportCache, available_formats, export_cache_key
+from filter_engine import FacetTable, FilterEngine
+from list_view import DEFAULT_SORT_COLUMN, DISPLAY_COLUMNS, ListView, page_count
+from map_view import MapHtmlCache, build_apartment_map, map_cache_key
+from shared_dataset import open_dataset, publish, read_pointer
+from spatial_tiles import TileIndex
+from storage import dataset_path, find_dataset
+from subway_stations import STATIONS
+from utils import add_subway_accessibility, extract_dong, preprocess_apartment_df
+from walk_network import add_walking_distance
+
+# 새로 수집한 데이터를 세션에 넣어두는 키 (공유 데이터셋 게시에 실패했을 때만 사용)
+# 값: (데이터프레임, 포인터, 데이터셋 키). 데이터셋 키는 새로고침마다 새로 만든 고유값이어야 함
+# (데이터셋 키로만 구분하는 프로세스 공용 캐시를 다른 세션과 함께 쓰므로)
 SESSION_KEY_APARTMENT_DATA = "apartment_data"
-# 메인 아파트(실거래가) 단지명 유사도 매칭 임계값 (0~1). 0.75로 완화해 매칭률 상승
-MAIN_APT_SIMILARITY_THRESHOLD = 0.75
+# 지도 화면 범위를 돌려받는 지도 위젯 키 (지도 영역 필터 사용 시)
+VIEWPORT_MAP_KEY = "viewport_map"
+# 역 반경/노선 역세권 검색 미사용 옵션
+NO_RADIUS_STATION = "사용 안 함"
 
 
-def normalize_dong(dong):
-    """동 표기 정규화: '역삼2동' → '역삼동', '삼성1동' → '삼성동' (숫자 제거)."""
-    if dong is None or (isinstance(dong, float) and pd.isna(dong)):
-        return ""
-    s = str(dong).strip()
-    if not s:
-        return ""
-    return re.sub(r"\d+동$", "동", s)
+# 페이지 설정
+st.set_page_config(
+    page_title="서울 아파트 검색",
+    page_icon="🏢",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
 
+# 제목
+# st.title("🏢 서울 아파트 검색 시스템")
+# st.markdown("---")
 
-def normalize_apt(name):
-    """단지명 정규화: 공백 collapse, 앞뒤 공백 제거."""
-    if name is None or (isinstance(name, float) and pd.isna(name)):
-        return ""
-    return " ".join(str(name).strip().split())
+# 메인 아파트(실거래가) CSV 경로 (실행 위치에 없으면 앱 파일 옆에서 찾기)
+MAIN_APT_FILE = "seoul_disrict_main_apt.csv"
+if not os.path.exists(MAIN_APT_FILE):
+    try:
+        _alt = os.path.join(os.path.dirname(os.path.abspath(__file__)), MAIN_APT_FILE)
+        if os.path.exists(_alt):
+            MAIN_APT_FILE = _alt
+    except NameError:
+        pass
 
 
-def normalize_apt_strong(name):
-    """단지명 강화 정규화(유사도 비교용): 1차/2차, 아파트, 단지, 괄호 안 내용 제거 후 공백 제거."""
-    t = normalize_apt(name)
-    t = re.sub(r"\s*[\(\（].*?[\)\）]\s*", "", t)
-    t = re.sub(r"\s*[1-3]차\s*", "", t)
-    t = re.sub(r"\s*아파트\s*", "", t, flags=re.IGNORECASE)
-    t = re.sub(r"\s*단지\s*", "", t)
-    t = re.sub(r"\s+", "", t)
-    return t
+def _file_signature(path):
+    """파일 변경 여부 판단용 (경로, 수정 시각, 크기). 파일이 없으면 None."""
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def data_source_signature():
+    """데이터 원본 파일들과 앱 컬럼 목록의 시그니처 (파일이나 컬럼 구성이 바뀌면 준비된 데이터셋 캐시 무효화)"""
+    return (
+        _file_signature(find_dataset(METADATA_FILE)),
+        _file_signature("seoul_apartments.csv"),
+        _file_signature(MAIN_APT_FILE),
+        _file_signature(find_dataset(WALK_NETWORK_NODES_FILE)),
+        _file_signature(find_dataset(WALK_NETWORK_EDGES_FILE)),
+        tuple(APP_DATA_COLUMNS),
+    )
 
 
-def enrich_with_main_apt(df: pd.DataFrame, main_path: str) -> pd.DataFrame:
+def _json_signature(signature):
+    """포인터 파일에 기록/비교하기 위한 JSON 형태 시그니처 (튜플 → 리스트)"""
+    return json.loads(json.dumps(signature))
+
+
+def prepare_dataset(session_df=None):
     """
-    메인 아파트 CSV와 동 정규화 + 단지명 유사도 매칭으로 left join.
-    - 1차: (자치구, norm_동) 일치 후보 중 단지명 유사도(강화 정규화) >= 임계값
-    - 2차(fallback): 동 후보 없으면 자치구만으로 후보 확대 후 동일 유사도 매칭
-    매칭되면 평수, 실거래가, 기준연월일 추가; 안 되면 공란.
-    파일 없어도 컬럼은 추가해 테이블에 항상 표시.
+    앱에서 바로 쓸 수 있는 데이터셋 준비 (로드 + 전처리 + 동 보완 + 실거래가 매칭 + 타입 스키마).
+    새로 수집한 데이터(session_df)가 있으면 그 데이터를 사용.
+
+    Returns:
+        Tuple[pd.DataFrame, str]: (데이터프레임, 데이터 종류)
+    """
+    if session_df is not None and not session_df.empty:
+        df, data_type = session_df, "metadata"
+    else:
+        crawler = SeoulApartmentCrawler()
+        # 저장된 메타데이터(Parquet, 없으면 CSV; 앱에서 쓰는 컬럼만) 또는 샘플
+        if find_dataset(METADATA_FILE):
+            df = crawler.load_dataset(METADATA_FILE, columns=APP_DATA_COLUMNS)
+            data_type = "metadata"
+        elif os.path.exists("seoul_apartments.csv"):
+            df = crawler.load_from_csv("seoul_apartments.csv")
+            data_type = "sample" if "아파트명" not in df.columns else "normal"
+        else:
+            df = crawler.generate_sample_data(num_samples=500)
+            crawler.save_to_csv(df, "seoul_apartments.csv")
+            data_type = "generated"
+        df = preprocess_apartment_df(df)
+
+    # 동 정보 추가 (없으면 생성)
+    if "동" not in df.columns:
+        df = df.copy()
+        df["동"] = df["주소"].apply(extract_dong)
+
+    # 지하철 접근성 지표 (이전에 저장된 데이터셋이면 좌표로 일괄 계산)
+    df = add_subway_accessibility(df)
+
+    # 도보 네트워크 거리 (도보 그래프 파일이 있을 때만, 노드별 최근접 역 라벨을 단지에 붙임)
+    df = add_walking_distance(df)
+
+    # 메인 아파트(실거래가) CSV와 동 정규화 + 단지명 유사도 매칭으로 평수/실거래가/기준연월일 추가
+    df = enrich_with_main_apt(df, MAIN_APT_FILE)
+
+    # 메모리 절감: 원본_* 필드 제외, 범주형/nullable 정수/float32 스키마 적용
+    before_mb = memory_usage_mb(df)
+    df = apply_schema(drop_passthrough_columns(df)).reset_index(drop=True)
+    print(f"📦 데이터셋 메모리: {before_mb:.2f} MB → {memory_usage_mb(df):.2f} MB")
+    return df, data_type
+
+
+def publish_dataset(df, data_type, origin):
+    """
+    준비된 데이터셋을 공유 데이터셋 새 버전으로 게시 (모든 세션이 다음 실행부터 새 버전 사용)
+
+    Returns:
+        Optional[Dict]: 새 포인터 (게시 실패 시 None)
     """
-    df = df.copy()
-    df["평수"] = None
-    df["실거래가"] = None
-    df["기준연월일"] = None
-    if not os.path.exists(main_path) or df.empty:
-        return df
     try:
-        main = pd.read_csv(main_path, encoding="utf-8-sig")
-        main = main[["구", "동", "아파트명", "평수", "실거래가", "기준연월일"]].drop_duplicates(
-            subset=["구", "동", "아파트명"], keep="first"
+        return publish(
+            df,
+            source_signature=_json_signature(data_source_signature()),
+            data_type=data_type,
+            origin=origin,
         )
-    except Exception:
-        return df
-    main["norm_동"] = main["동"].apply(normalize_dong)
-    main["norm_아파트명"] = main["아파트명"].apply(normalize_apt_strong)
-    # (구, norm_동)별 후보 + 구별 후보(fallback)
-    main_by_key = {}
-    main_by_gu = {}
-    for _, row in main.iterrows():
-        key = (row["구"], row["norm_동"])
-        if key not in main_by_key:
-            main_by_key[key] = []
-        main_by_key[key].append(row)
-        g = row["구"]
-        if g not in main_by_gu:
-            main_by_gu[g] = []
-        main_by_gu[g].append(row)
-
-    if "자치구" not in df.columns or "동" not in df.columns or "아파트명" not in df.columns:
-        return df
-    for i in df.index:
-        gu = df.at[i, "자치구"]
-        dong = df.at[i, "동"]
-        apt = df.at[i, "아파트명"]
-        norm_dong = normalize_dong(dong)
-        norm_apt = normalize_apt_strong(apt)
-        candidates = main_by_key.get((gu, norm_dong), [])
-        if not candidates:
-            candidates = main_by_gu.get(gu, [])
-        if not candidates:
-            continue
-        best = max(
-            candidates,
-            key=lambda c: SequenceMatcher(None, norm_apt, c["norm_아파트명"]).ratio(),
-        )
-        sim = SequenceMatcher(None, norm_apt, best["norm_아파트명"]).ratio()
-        if sim >= MAIN_APT_SIMILARITY_THRESHOLD:
-            df.at[i, "평수"] = best["평수"]
-            df.at[i, "실거래가"] = best["실거래가"]
-            df.at[i, "기준연월일"] = best["기준연월일"]
-    return df
-
-
-def preprocess_apartment_df(df: pd.DataFrame) -> pd.DataFrame:
-    """CSV/API에서 읽은 df에 동일한 전처리(동 추가, 임대·오피스텔 제외 등) 적용."""
-    if df.empty:
-        return df
-    df = df.copy()
-    if "동" not in df.columns:
-        if "원본_EMD_ADDR" in df.columns:
-            df["동"] = df["원본_EMD_ADDR"].apply(
-                lambda x: str(x).strip() if pd.notna(x) and str(x).strip() and str(x).strip() != "nan" else None
-            )
-        else:
-            df["동"] = df["주소"].apply(extract_dong)
-    if "아파트명" in df.columns:
-        df = df[~df["아파트명"].astype(str).str.contains("임대", na=False)]
-    if "원본_CMPX_CLSF" in df.columns:
-        df = df[df["원본_CMPX_CLSF"].astype(str).str.contains("아파트", na=False)]
-    if "아파트명" in df.columns:
-        df = df[~df["아파트명"].astype(str).str.contains("오피스텔", na=False, case=False)]
-    if "동" in df.columns:
-        df["동"] = df["동"].replace("답십리1동", "답십리동")
-    return df
+    except (OSError, ImportError) as e:
+        print(f"⚠️ 공유 데이터셋 게시 실패: {e}")
+        return None
 
 
-# 페이지 설정
-st.set_page_config(
-    page_title="서울 아파트 검색",
-    page_icon="🏢",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+# 원본 파일로 데이터셋을 준비해 게시 (원본 시그니처별로 프로세스당 한 번)
+@st.cache_resource(show_spinner="데이터 준비 중...", max_entries=2)
+def publish_from_sources(source_signature):
+    """게시된 포인터와, 게시에 실패하면 프로세스 메모리에 둘 데이터프레임 반환 (캐싱)"""
+    df, data_type = prepare_dataset()
+    pointer = publish_dataset(df, data_type, origin="files")
+    if pointer is None:
+        return {"version": None, "rows": len(df), "data_type": data_type, "origin": "files"}, df
+    return pointer, None
 
-# 제목
-# st.title("🏢 서울 아파트 검색 시스템")
-# st.markdown("---")
 
-# 데이터 로드 함수
-@st.cache_data
-def load_data():
-    """데이터 로드 (캐싱). 세션에 새로 수집한 데이터가 있으면 최우선 사용."""
-    # 1) 새로고침으로 수집한 데이터가 세션에 있으면 그대로 사용 (Cloud에서 파일 저장 안 돼도 동작)
-    if SESSION_KEY_APARTMENT_DATA in st.session_state:
-        df = st.session_state[SESSION_KEY_APARTMENT_DATA]
-        if df is not None and not df.empty:
-            return df, "metadata", len(df)
-
-    crawler = SeoulApartmentCrawler()
-    # 2) CSV 또는 샘플
-    if os.path.exists("seoul_apartments_metadata.csv"):
-        df = crawler.load_from_csv("seoul_apartments_metadata.csv")
-        data_type = "metadata"
-    elif os.path.exists("seoul_apartments.csv"):
-        df = crawler.load_from_csv("seoul_apartments.csv")
-        data_type = "sample" if "아파트명" not in df.columns else "normal"
-    else:
-        df = crawler.generate_sample_data(num_samples=500)
-        crawler.save_to_csv(df, "seoul_apartments.csv")
-        data_type = "generated"
+# 게시된 버전을 메모리 매핑으로 열기 (프로세스 안의 모든 세션이 같은 데이터프레임 사용)
+@st.cache_resource(show_spinner=False, max_entries=2)
+def open_shared_dataset(version):
+    """공유 데이터셋 버전 로드 (캐싱)"""
+    return open_dataset(version)
+
+
+def load_current_dataset():
+    """
+    현재 데이터셋 (포인터가 없거나 원본 파일이 바뀌었으면 다시 준비해 게시)
+
+    Returns:
+        Tuple[pd.DataFrame, Dict, str]: (데이터프레임, 포인터, 데이터셋 키)
+    """
+    # 공유 데이터셋 게시에 실패한 새로고침 데이터는 세션에만 보관 (Cloud에서 파일 저장이 안 돼도 반영)
+    session_data = st.session_state.get(SESSION_KEY_APARTMENT_DATA)
+    if session_data is not None:
+        return session_data
+
+    pointer = read_pointer()
+    if pointer is None or pointer.get("source_signature") != _json_signature(data_source_signature()):
+        pointer, local_df = publish_from_sources(data_source_signature())
+        if local_df is not None:
+            return local_df, pointer, f"local:{data_source_signature()}"
+        if read_pointer() is None:
+            # 게시한 파일이 지워졌으면 다시 준비
+            publish_from_sources.clear()
+            pointer, local_df = publish_from_sources(data_source_signature())
+            if local_df is not None:
+                return local_df, pointer, f"local:{data_source_signature()}"
+    try:
+        return open_shared_dataset(pointer["version"]), pointer, pointer["version"]
+    except FileNotFoundError:
+        # 포인터를 읽은 뒤 해당 버전 파일이 정리됐으면 현재 포인터로 한 번 더 시도
+        latest = read_pointer()
+        if latest is None:
+            publish_from_sources.clear()
+            latest, local_df = publish_from_sources(data_source_signature())
+            if local_df is not None:
+                return local_df, latest, f"local:{data_source_signature()}"
+        return open_shared_dataset(latest["version"]), latest, latest["version"]
+
+
+# 데이터 로드 (다른 세션이 새로고침해 버전이 바뀌면 다음 실행부터 새 버전 사용)
+df, dataset_pointer, dataset_key = load_current_dataset()
+data_type = dataset_pointer.get("data_type", "metadata")
+data_count = len(df)
+
+# 통계 탭 집계 (데이터셋이 바뀔 때만 다시 계산)
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_statistics(dataset_key, use_saved, _df):
+    """
+    분포 차트 데이터, 자치구별 통계 표, 통계 CSV 바이트 (캐싱)
+    저장된 메타데이터에서 준비한 데이터셋이면(use_saved) 데이터 파일 옆 통계 파일을 우선 사용하고, 없으면 계산해 저장합니다.
+    """
+    charts = compute_distribution_charts(_df)
+    data_path = find_dataset(METADATA_FILE) if use_saved else None
+    if data_path:
+        saved = load_district_stats(data_path)
+        if saved is not None:
+            return charts, saved[0], saved[1]
+
+    stats_df = compute_district_stats(_df)
+    if data_path and not stats_df.empty:
+        save_district_stats(stats_df, data_path)
+    return charts, stats_df, stats_to_csv_bytes(stats_df)
+
+
+# 사이드바 필터 인덱스, (자치구, 동)별 옵션 표, 목록 정렬 인덱스, 지도 격자 인덱스, 단지 공간 인덱스
+# (데이터셋이 바뀔 때만 새로 생성)
+@st.cache_resource(show_spinner=False, max_entries=4)
+def build_dataset_indexes(dataset_key, _df):
+    """데이터셋별 필터 엔진, 옵션 표, 목록 정렬 인덱스, 지도 격자 인덱스, 단지 공간 인덱스 생성 (캐싱)"""
+    engine = FilterEngine(_df)
+    return engine, FacetTable(engine), ListView(_df), TileIndex(_df), ApartmentSpatialIndex(_df)
+
+
+# 지도 HTML 캐시 (같은 데이터셋/필터 결과면 모든 세션이 같은 HTML을 쓰므로 세션 대신 공용 캐시)
+@st.cache_resource(show_spinner=False)
+def get_map_cache():
+    """데이터셋/필터 결과별 지도 HTML 캐시"""
+    return MapHtmlCache()
 
-    df = preprocess_apartment_df(df)
-    return df, data_type, len(df)
 
+# 목록 탭 다운로드 파일 캐시 (다운로드 요청은 스크립트 실행과 다른 스레드에서 처리되므로 세션 대신 공용 캐시)
+@st.cache_resource(show_spinner=False)
+def get_export_cache():
+    """필터 결과/형식별 다운로드 파일 캐시"""
+    return ExportCache()
 
-# 데이터 로드
-df, data_type, data_count = load_data()
+
+filter_engine, facet_table, list_view, tile_index, apartment_index = build_dataset_indexes(dataset_key, df)
 
 # 데이터 로드 메시지 표시 (toast 비활성화)
 # if data_type == "metadata":
@@ -181,28 +280,13 @@ df, data_type, data_count = load_data()
 # elif data_type == "generated":
 #     st.toast("데이터 파일이 없습니다. 샘플 데이터를 생성합니다...", icon="ℹ️")
 
-# 동 정보 추가 (없으면 생성)
-if "동" not in df.columns:
-    df["동"] = df["주소"].apply(extract_dong)
-
-# 메인 아파트(실거래가) CSV와 동 정규화 + 단지명 유사도 매칭으로 평수/실거래가/기준연월일 추가
-_main_apt_file = "seoul_disrict_main_apt.csv"
-if not os.path.exists(_main_apt_file):
-    try:
-        _alt = os.path.join(os.path.dirname(os.path.abspath(__file__)), _main_apt_file)
-        if os.path.exists(_alt):
-            _main_apt_file = _alt
-    except NameError:
-        pass
-df = enrich_with_main_apt(df, _main_apt_file)
-
 # 사이드바 필터
 st.sidebar.header("🔍 검색 필터")
 
 # 초기화 버튼 (자치구 제외하고 모든 필터 초기화)
 if st.sidebar.button("🔄 필터 초기화", width="stretch"):
     # 필터 관련 session_state 키들 초기화 (자치구 제외)
-    filter_keys = ['dong', 'year_range', 'household', 'hallway', 'distance', 'subway']
+    filter_keys = ['dong', 'year_range', 'household', 'hallway', 'distance', 'subway', 'radius_station', 'radius_line', 'radius_m', 'viewport_filter']
     for key in filter_keys:
         if key in st.session_state:
             del st.session_state[key]
@@ -212,38 +296,26 @@ if st.sidebar.button("🔄 필터 초기화", width="stretch"):
 col_district, col_dong = st.sidebar.columns(2)
 
 with col_district:
-    districts_list = df["자치구"].dropna().unique().tolist()
-    districts = ["전체"] + sorted([str(x) for x in districts_list if pd.notna(x) and str(x).strip()])
+    districts = ["전체"] + facet_table.districts
     # 기본값을 동대문구로 설정 (동대문구가 있으면)
     default_district = "동대문구" if "동대문구" in districts else "전체"
     selected_district = st.selectbox("자치구", districts, index=districts.index(default_district) if default_district in districts else 0)
 
 with col_dong:
     # 동 필터 (자치구 선택 시 해당 자치구의 동만 표시) - 동적 갱신
-    if selected_district != "전체":
-        district_df = df[df["자치구"] == selected_district]
-        dong_list = district_df["동"].dropna().unique().tolist()
-        dongs = ["전체"] + sorted([str(x) for x in dong_list if pd.notna(x) and str(x).strip()])
-    else:
-        dong_list = df["동"].dropna().unique().tolist()
-        dongs = ["전체"] + sorted([str(x) for x in dong_list if pd.notna(x) and str(x).strip()])
+    dongs = ["전체"] + facet_table.dongs(selected_district)
     
     # 초기화 시 동은 "전체"로
     selected_dong = st.selectbox("동", dongs, index=0, key="dong")
 
-# 필터링된 데이터 기준으로 슬라이더 범위 계산 (자치구 > 동 순서로 동적 갱신)
-if selected_district != "전체":
-    filter_base = df[df["자치구"] == selected_district]
-    if selected_dong != "전체":
-        filter_base = filter_base[filter_base["동"] == selected_dong]
-else:
-    filter_base = df.copy()
+# 선택된 자치구 > 동 기준 옵션/슬라이더 범위 (미리 계산된 표에서 조회)
+facet = facet_table.get(selected_district, selected_dong)
 
 # 건축연도 필터 (필터링된 데이터 기준) - 동적 갱신
-year_data = filter_base["건축연도"].dropna()
-if len(year_data) > 0:
-    min_year = int(year_data.min())
-    max_year = int(year_data.max())
+year_data = facet["건축연도"]
+if year_data is not None:
+    min_year = int(year_data[0])
+    max_year = int(year_data[1])
     # 초기화 시 전체 범위로
     default_year_range = (min_year, max_year)
     year_range = st.sidebar.slider(
@@ -258,10 +330,10 @@ else:
     year_range = (1900, 2025)
 
 # 세대수 필터 (슬라이더) - 동적 갱신, 기본 최소 300세대 이상
-household_data = filter_base["세대수"].dropna()
-if len(household_data) > 0:
-    min_household = int(household_data.min())
-    max_household = int(household_data.max())
+household_data = facet["세대수"]
+if household_data is not None:
+    min_household = int(household_data[0])
+    max_household = int(household_data[1])
     default_household_low = min(max(300, min_household), max_household)
     default_household_range = (default_household_low, max_household)
     household_range = st.sidebar.slider(
@@ -276,18 +348,17 @@ else:
     household_range = (0, 10000)
 
 # 복도/계단식 필터 - 동적 갱신
-hallway_types_list = filter_base["복도계단식"].dropna().unique().tolist()
-hallway_types = ["전체"] + sorted([str(x) for x in hallway_types_list if pd.notna(x)])
+hallway_types = ["전체"] + facet["복도계단식"]
 # 초기화 시 "전체"로
 selected_hallway = st.sidebar.selectbox("복도/계단식", hallway_types, index=0, key="hallway")
 
 # 평형 필터 제거 (사용자 요청)
 
 # 지하철역 거리 필터 (슬라이더) - 동적 갱신
-distance_data = filter_base["지하철역거리_km"].dropna()
-if len(distance_data) > 0:
-    min_distance = float(distance_data.min())
-    max_distance = float(distance_data.max())
+distance_data = facet["지하철역거리_km"]
+if distance_data is not None:
+    min_distance = float(distance_data[0])
+    max_distance = float(distance_data[1])
     # 초기화 시 전체 범위로
     default_distance_range = (min_distance, max_distance)
     distance_range = st.sidebar.slider(
@@ -303,70 +374,82 @@ else:
     distance_range = (0.0, 10.0)
 
 # 지하철역 선택 필터 (자치구/동 선택 시 해당 지역 내 지하철역만 표시) - 동적 갱신
-if selected_district != "전체":
-    # 선택된 자치구에 해당하는 데이터만 필터링
-    district_df = df[df["자치구"] == selected_district]
-    if selected_dong != "전체":
-        district_df = district_df[district_df["동"] == selected_dong]
-    subway_stations_list = district_df["가장가까운지하철역"].dropna().unique().tolist()
-else:
-    # 전체 데이터에서 지하철역 목록 가져오기
-    subway_stations_list = df["가장가까운지하철역"].dropna().unique().tolist()
-
-# 가나다순 정렬 (한글 정렬)
-subway_stations = ["전체"] + sorted(
-    [str(x) for x in subway_stations_list if pd.notna(x) and str(x).strip()],
-    key=lambda x: x  # 한글은 기본 정렬로 가나다순 정렬됨
-)
+# (자치구 미선택 시 전체 데이터의 지하철역, 가나다순 정렬)
+subway_stations = ["전체"] + facet["가장가까운지하철역"]
 # 초기화 시 "전체"로
 selected_subway = st.sidebar.selectbox("가장 가까운 지하철역", subway_stations, index=0, key="subway")
 
-# 필터 적용
-filtered_df = df.copy()
-
-if selected_district != "전체":
-    filtered_df = filtered_df[filtered_df["자치구"] == selected_district]
-
-# 동 필터 적용
-if selected_dong != "전체":
-    filtered_df = filtered_df[filtered_df["동"] == selected_dong]
-
-# 건축연도 필터 (NaN 값 처리)
-if len(year_data) > 0:
-    filtered_df = filtered_df[
-        (filtered_df["건축연도"].notna()) &
-        (filtered_df["건축연도"] >= year_range[0]) &
-        (filtered_df["건축연도"] <= year_range[1])
-    ]
-
-# 세대수 필터 (NaN 값 처리) - 슬라이더 범위 적용
-if len(household_data) > 0:
-    filtered_df = filtered_df[
-        (filtered_df["세대수"].notna()) &
-        (filtered_df["세대수"] >= household_range[0]) &
-        (filtered_df["세대수"] <= household_range[1])
-    ]
-
-if selected_hallway != "전체":
-    filtered_df = filtered_df[filtered_df["복도계단식"] == selected_hallway]
-
-# 평형 필터 제거 (사용자 요청)
-
-# 지하철역 거리 필터 (NaN 값 처리) - 슬라이더 범위 적용
-if len(distance_data) > 0:
-    filtered_df = filtered_df[
-        (filtered_df["지하철역거리_km"].notna()) &
-        (filtered_df["지하철역거리_km"] >= distance_range[0]) &
-        (filtered_df["지하철역거리_km"] <= distance_range[1])
-    ]
+# 위치 검색: 지하철역 반경 / 노선 역세권 (단지 공간 인덱스로 검색)
+st.sidebar.subheader("📍 위치 검색")
+radius_station = st.sidebar.selectbox(
+    "역 반경 검색", [NO_RADIUS_STATION] + sorted(STATIONS.names), index=0, key="radius_station"
+)
+radius_line = st.sidebar.selectbox(
+    "노선 역세권",
+    [NO_RADIUS_STATION] + STATIONS.lines,
+    index=0,
+    key="radius_line",
+    help="앱의 지하철역 목록(주요 역) 중 해당 호선 역 기준입니다.",
+)
+spatial_subsets = []
+if radius_station != NO_RADIUS_STATION or radius_line != NO_RADIUS_STATION:
+    radius_m = st.sidebar.slider("반경 (m)", min_value=100, max_value=3000, value=500, step=100, key="radius_m")
+if radius_station != NO_RADIUS_STATION:
+    station = STATIONS.get(radius_station)
+    radius_positions = apartment_index.within_radius(station.lat, station.lon, radius_m / 1000)
+    spatial_subsets.append(radius_positions)
+    nearest_positions, nearest_km = apartment_index.k_nearest(station.lat, station.lon, 1)
+    if len(nearest_positions) > 0:
+        station_label = f"{radius_station}({', '.join(station.lines)})" if station.lines else radius_station
+        st.sidebar.caption(
+            f"{station_label} {radius_m:,}m 이내 {len(radius_positions)}개 단지 · "
+            f"가장 가까운 단지: {df['아파트명'].iloc[nearest_positions[0]]} ({nearest_km[0] * 1000:,.0f}m)"
+        )
+if radius_line != NO_RADIUS_STATION:
+    line_ids = STATIONS.line_ids(radius_line)
+    line_positions = apartment_index.within_radius_of_any(STATIONS.lats[line_ids], STATIONS.lons[line_ids], radius_m / 1000)
+    spatial_subsets.append(line_positions)
+    st.sidebar.caption(f"{radius_line} {len(line_ids)}개 역 {radius_m:,}m 이내 {len(line_positions)}개 단지")
+
+# 지도 영역 필터: 지도 탭에서 보고 있는 화면 범위 안의 단지만 목록/지표에 표시
+viewport_only = st.sidebar.checkbox(
+    "지도에 보이는 영역만",
+    key="viewport_filter",
+    help="지도 탭에서 이동/확대한 화면 범위 안의 단지만 목록과 지표에 표시합니다.",
+)
 
-if selected_subway != "전체":
-    filtered_df = filtered_df[filtered_df["가장가까운지하철역"] == selected_subway]
+# 필터 적용 (인덱스 교집합으로 행 위치 계산 후 한 번만 추출)
+map_positions = filter_engine.positions(
+    equals={
+        "자치구": selected_district if selected_district != "전체" else None,
+        "동": selected_dong if selected_dong != "전체" else None,
+        "복도계단식": selected_hallway if selected_hallway != "전체" else None,
+        "가장가까운지하철역": selected_subway if selected_subway != "전체" else None,
+    },
+    ranges={
+        # 건축연도/세대수/지하철역 거리는 결측값 제외
+        "건축연도": year_range if year_data is not None else None,
+        "세대수": household_range if household_data is not None else None,
+        "지하철역거리_km": distance_range if distance_data is not None else None,
+    },
+    subsets=spatial_subsets,
+)
+# 지도는 화면 범위 필터 전 결과를 표시하고, 목록/지표는 마지막으로 받은 화면 범위로 한 번 더 거름
+filtered_positions = map_positions
+viewport_bounds = (st.session_state.get(VIEWPORT_MAP_KEY) or {}).get("bounds") if viewport_only else None
+if viewport_bounds and viewport_bounds.get("_southWest") and viewport_bounds.get("_northEast"):
+    south_west, north_east = viewport_bounds["_southWest"], viewport_bounds["_northEast"]
+    viewport_positions = apartment_index.within_bbox(
+        south_west["lat"], south_west["lng"], north_east["lat"], north_east["lng"]
+    )
+    filtered_positions = np.intersect1d(map_positions, viewport_positions, assume_unique=True)
+filtered_df = df.iloc[filtered_positions]
 
 # 결과 표시
 st.write(f"📊 검색 결과: {len(filtered_df)}개")
 
-if len(filtered_df) > 0:
+# 지도 화면 범위 밖이라 목록이 비어도 지도는 계속 표시 (다시 이동할 수 있도록)
+if len(map_positions) > 0:
     # 통계 정보
     col1, col2, col3, col4, col5 = st.columns(5)
     
@@ -439,108 +522,34 @@ if len(filtered_df) > 0:
     tab1, tab2, tab3 = st.tabs(["📋 목록", "🗺️ 지도", "📈 통계"])
     
     with tab1:
-        # 기본 정렬: 건축연도 오름차순 (오래된순)
-        if "건축연도" in filtered_df.columns:
-            sorted_df = filtered_df.sort_values(
-                by="건축연도",
-                ascending=True,
-                na_position='last'  # NaN 값은 맨 뒤로
-            )
-        else:
-            sorted_df = filtered_df.copy()
-        
-        # 데이터프레임 표시 (화면 출력용 컬럼만 필터링)
-        # 원본 데이터는 모두 저장되어 있지만, 화면에는 필요한 컬럼만 표시
-        display_columns = []
-        
-        # 기본 정보
-        if "자치구" in sorted_df.columns:
-            display_columns.append("자치구")
-        if "동" in sorted_df.columns:
-            display_columns.append("동")
-        if "아파트명" in sorted_df.columns:
-            display_columns.append("아파트명")
-        if "건축연도" in sorted_df.columns:
-            display_columns.append("건축연도")
-        if "세대수" in sorted_df.columns:
-            display_columns.append("세대수")
-        if "복도계단식" in sorted_df.columns:
-            display_columns.append("복도계단식")
-        
-        # 면적 정보 (세대당 평균만 표시)
-        if "세대당평균평형" in sorted_df.columns:
-            display_columns.append("세대당평균평형")
-        # 메인 아파트 실거래가 (동·단지명 정규화+유사도 매칭, 없으면 공란)
-        if "평수" in sorted_df.columns:
-            display_columns.append("평수")
-        if "실거래가" in sorted_df.columns:
-            display_columns.append("실거래가")
-        if "기준연월일" in sorted_df.columns:
-            display_columns.append("기준연월일")
-        # 전용면적별 세대현황 (평형별 세대수 분포)
-        if "전용면적60㎡이하_세대수" in sorted_df.columns:
-            display_columns.append("전용면적60㎡이하_세대수")
-        if "전용면적60_85㎡_세대수" in sorted_df.columns:
-            display_columns.append("전용면적60_85㎡_세대수")
-        if "전용면적85_135㎡_세대수" in sorted_df.columns:
-            display_columns.append("전용면적85_135㎡_세대수")
-        
-        # 주차 정보
-        if "주차대수" in sorted_df.columns:
-            display_columns.append("주차대수")
-        if "세대당주차면수" in sorted_df.columns:
-            display_columns.append("세대당주차면수")
-        
-        # 지하철 정보
-        if "가장가까운지하철역" in sorted_df.columns:
-            display_columns.append("가장가까운지하철역")
-        if "지하철역거리_km" in sorted_df.columns:
-            display_columns.append("지하철역거리_km")
-        
-        # 주소는 맨 우측에 배치
-        if "주소" in sorted_df.columns:
-            display_columns.append("주소")
-        
-        # 존재하는 컬럼만 필터링
-        display_columns = [col for col in display_columns if col in sorted_df.columns]
-        
-        # 표시용 데이터프레임 생성 (컬럼명 간략화 및 포맷팅)
-        display_df = sorted_df[display_columns].copy()
-        
-        # 컬럼명 간략화 매핑
-        column_mapping = {
-            "자치구": "자치구",
-            "동": "동",
-            "아파트명": "아파트명",
-            "주소": "주소",
-            "건축연도": "연도",
-            "세대수": "세대수",
-            "복도계단식": "복도/계단",
-            "세대당평균평형": "평형",
-            "평수": "평수",
-            "실거래가": "실거래가",
-            "기준연월일": "기준연월일",
-            "전용면적60㎡이하_세대수": "60㎡이하",
-            "전용면적60_85㎡_세대수": "60~85㎡",
-            "전용면적85_135㎡_세대수": "85~135㎡",
-            "주차대수": "주차",
-            "세대당주차면수": "세대당주차",
-            "가장가까운지하철역": "지하철역",
-            "지하철역거리_km": "역거리"
-        }
-        
-        # 컬럼명 변경
-        display_df = display_df.rename(columns=column_mapping)
-        # 매칭 안 된 행: 평수/실거래가/기준연월일 공란 처리
-        for _col in ["평수", "실거래가", "기준연월일"]:
-            if _col in display_df.columns:
-                display_df[_col] = display_df[_col].apply(lambda x: "" if pd.isna(x) else x)
-        # 건축연도 포맷팅 (콤마 제거, 정수로 표시)
-        if "연도" in display_df.columns:
-            display_df["연도"] = display_df["연도"].apply(
-                lambda x: str(int(x)) if pd.notna(x) else ""
+        # 정렬/페이지 선택 (정렬은 행 위치 배열로, 서식은 보이는 페이지에만 적용)
+        sort_columns = list_view.columns
+        default_sort = sort_columns.index(DEFAULT_SORT_COLUMN) if DEFAULT_SORT_COLUMN in sort_columns else 0
+        col_sort, col_order, col_size, col_page = st.columns([3, 2, 2, 2])
+        with col_sort:
+            sort_column = st.selectbox(
+                "정렬 기준",
+                sort_columns,
+                index=default_sort,
+                format_func=lambda col: DISPLAY_COLUMNS[col],
+                key="list_sort_column",
             )
+        with col_order:
+            sort_ascending = st.radio(
+                "정렬 순서", ["오름차순", "내림차순"], horizontal=True, key="list_sort_order"
+            ) == "오름차순"
+        with col_size:
+            page_size = st.selectbox("페이지당 행 수", LIST_PAGE_SIZES, key="list_page_size")
+        sorted_positions = list_view.sort_positions(filtered_positions, sort_column, sort_ascending)
+        total_pages = page_count(len(sorted_positions), page_size)
+        # 필터가 바뀌어 페이지 수가 줄면 마지막 페이지로
+        if st.session_state.get("list_page", 1) > total_pages:
+            st.session_state["list_page"] = total_pages
+        with col_page:
+            page_number = st.number_input("페이지", min_value=1, max_value=total_pages, step=1, key="list_page")
         
+        display_df = list_view.page(sorted_positions, page_number, page_size)
+        st.caption(f"총 {len(sorted_positions):,}건 · {page_number}/{total_pages} 페이지")
         st.dataframe(
             display_df,
             width="stretch",
@@ -548,232 +557,121 @@ if len(filtered_df) > 0:
             hide_index=True
         )
         
-        # CSV 다운로드 버튼 (간략화된 컬럼명으로)
-        csv = display_df.to_csv(index=False, encoding='utf-8-sig')
-        st.download_button(
-            label="📥 CSV 다운로드",
-            data=csv,
-            file_name="seoul_apartments_filtered.csv",
-            mime="text/csv"
-        )
+        # 다운로드 버튼 (전체 결과, 간략화된 컬럼명으로, 파일은 버튼을 누를 때 생성하고 필터 결과/정렬/형식별로 캐시)
+        export_key = export_cache_key(sorted_positions, dataset_key)
+        formats = available_formats()
+        col_format, col_download = st.columns([2, 3])
+        with col_format:
+            export_format = st.selectbox(
+                "다운로드 형식",
+                formats,
+                format_func=lambda fmt: EXPORT_FORMATS[fmt][0],
+                key="export_format",
+                label_visibility="collapsed",
+            )
+        label, extension, mime = EXPORT_FORMATS[export_format]
+        export_cache = get_export_cache()
+        with col_download:
+            st.download_button(
+                label=f"📥 {label} 다운로드",
+                data=lambda: export_cache.get_or_build(
+                    export_key, lambda: list_view.format_rows(sorted_positions), export_format
+                ),
+                file_name=f"seoul_apartments_filtered.{extension}",
+                mime=mime,
+                on_click="ignore",
+            )
     
     with tab2:
-        # 지도 생성
-        if len(filtered_df) > 0:
-            # 필터링된 데이터의 유효한 좌표만 사용하여 중심점 계산
-            valid_coords = filtered_df[
-                (filtered_df["위도"].notna()) & 
-                (filtered_df["경도"].notna())
-            ]
-            
-            if len(valid_coords) > 0:
-                # 중심점 계산
-                center_lat = valid_coords["위도"].mean()
-                center_lon = valid_coords["경도"].mean()
-                
-                # 데이터 범위 계산
-                min_lat = valid_coords["위도"].min()
-                max_lat = valid_coords["위도"].max()
-                min_lon = valid_coords["경도"].min()
-                max_lon = valid_coords["경도"].max()
-                
-                # 범위에 따른 적절한 초기 줌 레벨 계산
-                lat_range = max_lat - min_lat
-                lon_range = max_lon - min_lon
-                max_range = max(lat_range, lon_range)
-                
-                # 범위에 따른 적절한 줌 레벨 계산
-                if max_range < 0.01:  # 매우 좁은 범위 (약 1km)
-                    zoom_start = 15
-                elif max_range < 0.05:  # 좁은 범위 (약 5km)
-                    zoom_start = 13
-                elif max_range < 0.1:  # 중간 범위 (약 10km)
-                    zoom_start = 12
-                elif max_range < 0.2:  # 넓은 범위 (약 20km)
-                    zoom_start = 11
-                else:  # 매우 넓은 범위
-                    zoom_start = 10
+        # 지도 생성 (좌표 배열 기반 마커 클러스터, 결과가 많으면 축소 화면은 격자 타일)
+        map_df = df.iloc[map_positions] if viewport_only else filtered_df
+        if len(map_df) > 0:
+            if viewport_only:
+                # 화면 범위를 돌려받아야 하므로 st_folium으로 표시 (같은 결과면 이동/확대 상태 유지)
+                viewport_map, map_mode = build_apartment_map(map_df, tile_index, map_positions)
             else:
-                # 유효한 좌표가 없으면 서울 중심 좌표 사용
-                center_lat = 37.5665
-                center_lon = 126.9780
-                zoom_start = 11
-                min_lat = max_lat = min_lon = max_lon = None
-            
-            m = folium.Map(
-                location=[center_lat, center_lon],
-                zoom_start=zoom_start,
-                tiles="OpenStreetMap"
-            )
-            
-            # 마커 추가 (유효한 좌표만)
-            for idx, row in filtered_df.iterrows():
-                # 좌표가 유효한 경우에만 마커 추가
-                if pd.notna(row.get("위도")) and pd.notna(row.get("경도")):
-                    # 아파트명이 있으면 포함
-                    apt_name = row.get('아파트명', '') or row.get('주소', '')
-                    popup_text = f"""
-                    <b>{apt_name}</b><br>
-                    주소: {row.get('주소', '')}<br>
-                    자치구: {row.get('자치구', '')}<br>
-                    건축연도: {row.get('건축연도', '')}년<br>
-                    세대수: {row.get('세대수', '')}세대<br>
-                    평형: {row.get('평형', '')}평<br>
-                    지하철역: {row.get('가장가까운지하철역', '')} ({row.get('지하철역거리_km', '')}km)
-                    """
-                    
-                    # 툴팁에 아파트명 또는 주소 표시
-                    tooltip_text = row.get('아파트명', '') or row.get('주소', '')
-                    folium.Marker(
-                        [row["위도"], row["경도"]],
-                        popup=folium.Popup(popup_text, max_width=300),
-                        tooltip=tooltip_text
-                    ).add_to(m)
-            
-            # 모든 마커가 보이도록 bounds 설정 (유효한 좌표가 있는 경우만)
-            if len(valid_coords) > 0 and min_lat is not None:
-                padding = 0.01  # 약 1km 여유 공간
-                m.fit_bounds(
-                    [[min_lat - padding, min_lon - padding],
-                     [max_lat + padding, max_lon + padding]],
-                    padding=(20, 20)  # 픽셀 단위 여유 공간
-                )
+                # 같은 데이터셋/필터 결과면 렌더링해 둔 지도 HTML 재사용 (프로세스 공용 LRU)
+                map_key = map_cache_key(filtered_positions, dataset_key)
+                map_html, map_mode = get_map_cache().get_or_render(map_key, filtered_df, tile_index, filtered_positions)
+            if map_mode == "tiles":
+                st.caption(f"💡 축소 화면에서는 격자별 단지 수를 표시합니다. {MAP_RAW_MIN_ZOOM}단계 이상 확대하면 개별 단지가 표시됩니다.")
+            elif map_mode == "tiles_only":
+                st.caption(f"💡 결과가 {MAP_RAW_POINT_LIMIT:,}개를 넘어 격자별 단지 수로 표시합니다. 필터를 좁히면 개별 단지가 표시됩니다.")
+            if viewport_only:
+                st.caption(f"📍 지도 화면 범위 안의 {len(filtered_positions):,}개 단지만 목록과 지표에 표시합니다.")
             
             # 지도 중앙 정렬을 위한 컬럼 사용
             col1, col2, col3 = st.columns([1, 10, 1])
             with col2:
-                st_folium(m, height=600, width="stretch")
+                if viewport_only:
+                    st_folium(
+                        viewport_map,
+                        key=VIEWPORT_MAP_KEY,
+                        height=600,
+                        use_container_width=True,
+                        returned_objects=["bounds"],
+                    )
+                # 렌더링된 HTML을 그대로 표시 (지도 이동/확대 시 앱이 다시 실행되지 않음)
+                elif hasattr(st, "iframe"):
+                    st.iframe(map_html, height=600)
+                else:
+                    components.html(map_html, height=600)
         else:
             st.info("표시할 데이터가 없습니다.")
     
     with tab3:
         st.info("💡 통계는 필터링과 무관하게 전체 데이터 기준으로 표시됩니다.")
         
+        # 전체 데이터 기준 (데이터셋마다 한 번만 계산)
+        charts, stats_df, csv_stats = load_statistics(
+            dataset_key,
+            data_type == "metadata" and dataset_pointer.get("origin") == "files",
+            df,
+        )
+        
         col1, col2 = st.columns(2)
         
         with col1:
             st.write("**자치구별 아파트 수**")
-            # 전체 데이터 기준
-            district_counts = df["자치구"].value_counts()
-            st.bar_chart(district_counts)
+            if "자치구" in charts:
+                st.bar_chart(charts["자치구"])
         
         with col2:
             st.write("**건축연도별 분포**")
-            # 전체 데이터 기준
-            year_data = df["건축연도"].dropna()
-            if len(year_data) > 0:
-                year_counts = year_data.value_counts().sort_index()
-                st.line_chart(year_counts)
+            if "건축연도" in charts:
+                st.line_chart(charts["건축연도"])
         
         col3, col4 = st.columns(2)
         
         with col3:
             st.write("**복도/계단식 분포**")
-            # 전체 데이터 기준
-            hallway_data = df["복도계단식"].dropna()
-            if len(hallway_data) > 0:
-                hallway_counts = hallway_data.value_counts()
-                st.bar_chart(hallway_counts)
+            if "복도계단식" in charts:
+                st.bar_chart(charts["복도계단식"])
         
         with col4:
             st.write("**세대당 평형 분포**")
-            # 전체 데이터 기준
-            if "세대당평균평형" in df.columns:
-                pyeong_data = df["세대당평균평형"].dropna()
-                if len(pyeong_data) > 0:
-                    pyeong_counts = pd.cut(
-                        pyeong_data,
-                        bins=10,
-                        labels=[f"{i*5}-{(i+1)*5}평" for i in range(10)]
-                    ).value_counts().sort_index()
-                    st.bar_chart(pyeong_counts)
+            if "세대당평균평형" in charts:
+                st.bar_chart(charts["세대당평균평형"])
         
         st.markdown("---")
         
-        # 자치구별 통계 계산 (전체 데이터 기준)
-        if "자치구" in df.columns:
-            district_stats = []
-            
-            for district in sorted(df["자치구"].dropna().unique()):
-                district_data = df[df["자치구"] == district]
-                
-                stats = {
-                    "자치구": district,
-                    "아파트 수": len(district_data)
-                }
-                
-                # 평균 건축연도
-                year_data = district_data["건축연도"].dropna()
-                if len(year_data) > 0:
-                    stats["평균 건축연도"] = f"{int(year_data.mean())}년"
-                else:
-                    stats["평균 건축연도"] = "N/A"
-                
-                # 평균 세대수
-                household_data = district_data["세대수"].dropna()
-                if len(household_data) > 0:
-                    stats["평균 세대수"] = f"{int(household_data.mean())}세대"
-                else:
-                    stats["평균 세대수"] = "N/A"
-                
-                # 평균 평형 (세대당)
-                if "세대당평균평형" in district_data.columns:
-                    pyeong_data = district_data["세대당평균평형"].dropna()
-                    if len(pyeong_data) > 0:
-                        stats["평균 평형 (세대당)"] = f"{pyeong_data.mean():.1f}평"
-                    else:
-                        stats["평균 평형 (세대당)"] = "N/A"
-                elif "평형" in district_data.columns:
-                    pyeong_data = district_data["평형"].dropna()
-                    if len(pyeong_data) > 0:
-                        stats["평균 평형"] = f"{pyeong_data.mean():.1f}평"
-                    else:
-                        stats["평균 평형"] = "N/A"
-                
-                # 평균 주차대수
-                if "주차대수" in district_data.columns:
-                    parking_data = district_data["주차대수"].dropna()
-                    if len(parking_data) > 0:
-                        stats["평균 주차대수"] = f"{int(parking_data.mean())}대"
-                    else:
-                        stats["평균 주차대수"] = "N/A"
-                
-                # 평균 세대당 주차면수
-                if "세대당주차면수" in district_data.columns:
-                    parking_per_hh_data = district_data["세대당주차면수"].dropna()
-                    if len(parking_per_hh_data) > 0:
-                        stats["평균 세대당 주차면수"] = f"{parking_per_hh_data.mean():.2f}면"
-                    else:
-                        stats["평균 세대당 주차면수"] = "N/A"
-                
-                # 평균 지하철 거리
-                distance_data = district_data["지하철역거리_km"].dropna()
-                if len(distance_data) > 0:
-                    stats["평균 지하철 거리"] = f"{distance_data.mean():.2f}km"
-                else:
-                    stats["평균 지하철 거리"] = "N/A"
-                
-                district_stats.append(stats)
+        # 자치구별 통계 테이블
+        if not stats_df.empty:
+            st.dataframe(
+                stats_df,
+                width="stretch",
+                height=910,
+                hide_index=True
+            )
             
-            # 통계 테이블 생성
-            if district_stats:
-                stats_df = pd.DataFrame(district_stats)
-                st.dataframe(
-                    stats_df,
-                    width="stretch",
-                    height=910,
-                    hide_index=True
-                )
-                
-                # CSV 다운로드
-                csv_stats = stats_df.to_csv(index=False, encoding='utf-8-sig')
-                st.download_button(
-                    label="📥 자치구별 통계 CSV 다운로드",
-                    data=csv_stats,
-                    file_name="district_statistics.csv",
-                    mime="text/csv",
-                    key="district_stats_download"
-                )
+            # CSV 다운로드 (미리 만들어 둔 바이트 사용)
+            st.download_button(
+                label="📥 자치구별 통계 CSV 다운로드",
+                data=csv_stats,
+                file_name="district_statistics.csv",
+                mime="text/csv",
+                key="district_stats_download"
+            )
 else:
     st.warning("조건에 맞는 아파트가 없습니다. 필터를 조정해주세요.")
 
@@ -813,10 +711,11 @@ password_ok = bool(required_stripped and input_stripped == required_stripped)
 # 비밀번호가 맞을 때만 오른쪽 영역에 '새 데이터 생성' 버튼 표시
 if password_ok:
     with _col_btn:
+        full_refresh = st.checkbox("전체 다시 수집", value=False, help="끄면 수정일자 기준으로 변경된 단지만 갱신합니다.")
         if st.button("새 데이터 생성", width="stretch"):
             with st.status("🌐 서울 열린데이터광장 API에서 데이터 수집 중...", expanded=True) as status:
                 try:
-                    crawler = SeoulApartmentCrawler()
+                    crawler = SeoulApartmentCrawler(revalidate_cache=True)  # 새로고침은 응답 캐시를 읽지 않음
                     
                     st.write("📡 API 연결 테스트 중... (1~100건)")
                     test_df = crawler.crawl_seoul_apartment_info(1, 100)
@@ -825,21 +724,41 @@ if password_ok:
                         st.write(f"API 테스트 성공! {len(test_df)}건 수집")
                         st.write("📥 전체 데이터 수집 시작 (1000개씩 배치)...")
                         
-                        all_df = crawler.crawl_seoul_apartment_info_all(max_records=5000)
+                        # 저장된 데이터가 있으면 변경된 단지만 갱신 (증분 동기화)
+                        stored_df = pd.DataFrame()
+                        if not full_refresh and find_dataset(METADATA_FILE):
+                            stored_df = crawler.load_dataset(METADATA_FILE)
+                        
+                        st.write("🔄 데이터 처리 중...")
+                        processed_df, sync_summary = crawler.sync_seoul_apartment_info(stored_df, max_records=5000)
                         
-                        if not all_df.empty:
-                            st.write("🔄 데이터 처리 중...")
-                            processed_df = crawler.process_seoul_apartment_info_data(all_df)
+                        if sync_summary and not processed_df.empty:
+                            if sync_summary["mode"] == "incremental":
+                                st.write(
+                                    f"신규 {sync_summary['new']}건, 수정 {sync_summary['updated']}건, "
+                                    f"삭제 {sync_summary['deleted']}건 반영"
+                                )
                             df_fresh = preprocess_apartment_df(processed_df)
 
-                            st.session_state[SESSION_KEY_APARTMENT_DATA] = df_fresh
-
                             try:
-                                crawler.save_to_csv(processed_df, "seoul_apartments_metadata.csv")
+                                saved_path = crawler.save_dataset(processed_df, dataset_path(METADATA_FILE))
+                                save_district_stats(compute_district_stats(df_fresh), saved_path)
+                                crawler.save_sync_state(sync_summary)
                             except Exception:
                                 pass
 
-                            load_data.clear()
+                            # 준비한 데이터셋을 새 버전으로 게시 (모든 세션이 다음 실행부터 새 데이터 사용)
+                            app_df, _ = prepare_dataset(df_fresh)
+                            if publish_dataset(app_df, "metadata", origin="refresh") is None:
+                                # 게시에 실패하면 이 세션에만 보관
+                                st.session_state[SESSION_KEY_APARTMENT_DATA] = (
+                                    app_df,
+                                    {"version": None, "rows": len(app_df), "data_type": "metadata", "origin": "refresh"},
+                                    f"session:{uuid.uuid4().hex}",
+                                )
+                            else:
+                                st.session_state.pop(SESSION_KEY_APARTMENT_DATA, None)
+
                             status.update(label=f"✅ 데이터 수집 완료! (총 {len(df_fresh)}건)", state="complete")
                             st.success(f"실제 아파트 메타데이터 {len(df_fresh)}건이 수집되었습니다!")
                             st.info("🔄 화면이 새로고침되며 새로 수집된 데이터가 표시됩니다.")
@@ -0,0 +1,266 @@
+"""
+메인 아파트(실거래가) 단지명 매칭
+기준 단지명을 한 번만 정규화하고, 글자 역색인으로 후보를 줄인 뒤 남은 후보만 유사도를 계산합니다.
+매칭 결과는 입력 파일/데이터 해시를 키로 디스크에 저장합니다.
+"""
+import hashlib
+import os
+import re
+from collections import Counter
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import MAIN_APT_SIMILARITY_THRESHOLD, MATCH_CACHE_DIR
+
+# 매칭 규칙이 바뀌면 올려서 저장된 결과를 무효화
+MATCHER_VERSION = 1
+MAIN_APT_COLUMNS = ["평수", "실거래가", "기준연월일"]
+
+
+def normalize_dong(dong):
+    """동 표기 정규화: '역삼2동' → '역삼동', '삼성1동' → '삼성동' (숫자 제거)."""
+    if dong is None or (isinstance(dong, float) and pd.isna(dong)):
+        return ""
+    s = str(dong).strip()
+    if not s:
+        return ""
+    return re.sub(r"\d+동$", "동", s)
+
+
+def normalize_apt(name):
+    """단지명 정규화: 공백 collapse, 앞뒤 공백 제거."""
+    if name is None or (isinstance(name, float) and pd.isna(name)):
+        return ""
+    return " ".join(str(name).strip().split())
+
+
+def normalize_apt_strong(name):
+    """단지명 강화 정규화(유사도 비교용): 1차/2차, 아파트, 단지, 괄호 안 내용 제거 후 공백 제거."""
+    t = normalize_apt(name)
+    t = re.sub(r"\s*[\(\（].*?[\)\）]\s*", "", t)
+    t = re.sub(r"\s*[1-3]차\s*", "", t)
+    t = re.sub(r"\s*아파트\s*", "", t, flags=re.IGNORECASE)
+    t = re.sub(r"\s*단지\s*", "", t)
+    t = re.sub(r"\s+", "", t)
+    return t
+
+
+@lru_cache(maxsize=65536)
+def name_similarity(a: str, b: str) -> float:
+    """단지명 유사도 (SequenceMatcher.ratio, 같은 쌍은 캐시)."""
+    return SequenceMatcher(None, a, b).ratio()
+
+
+class MainAptMatcher:
+    """(자치구, 동) 후보 안에서 단지명 유사도가 가장 높은 메인 아파트를 찾는 인덱스"""
+
+    def __init__(self, main: pd.DataFrame, threshold: float = MAIN_APT_SIMILARITY_THRESHOLD):
+        """
+        Args:
+            main: 메인 아파트 데이터 (구, 동, 아파트명 컬럼, 중복 제거 완료)
+            threshold: 유사도 임계값 (0~1)
+        """
+        self.threshold = threshold
+        self.names = [normalize_apt_strong(name) for name in main["아파트명"]]
+        self.name_counts = [Counter(name) for name in self.names]
+
+        # (구, norm_동)별 후보 + 구별 후보(fallback), 원본 순서 유지
+        self.by_key: Dict[Tuple, List[int]] = {}
+        self.by_gu: Dict[object, List[int]] = {}
+        for pos, (gu, dong) in enumerate(zip(main["구"], main["동"])):
+            self.by_key.setdefault((gu, normalize_dong(dong)), []).append(pos)
+            self.by_gu.setdefault(gu, []).append(pos)
+
+        # 글자 → 단지 위치 역색인 (공통 글자가 없으면 유사도 0)
+        self.char_index: Dict[str, set] = {}
+        for pos, name in enumerate(self.names):
+            for char in set(name):
+                self.char_index.setdefault(char, set()).add(pos)
+        self.empty_names = {pos for pos, name in enumerate(self.names) if not name}
+
+    def _shortlist(self, norm_apt: str, candidates: List[int]) -> List[int]:
+        """
+        임계값에 도달할 수 있는 후보만 남기기 (원본 순서 유지)
+        ratio = 2M/T 이고 M은 두 문자열의 공통 글자 수(중복 포함)를 넘을 수 없으므로,
+        공통 글자 수로 계산한 상한이 임계값보다 낮은 후보는 제외합니다.
+        """
+        if not norm_apt:
+            # 빈 이름끼리는 유사도 1.0, 그 외는 0
+            return [pos for pos in candidates if pos in self.empty_names]
+
+        sharing = set()
+        for char in set(norm_apt):
+            sharing |= self.char_index.get(char, set())
+        if not sharing:
+            return []
+
+        counts = Counter(norm_apt)
+        shortlist = []
+        for pos in candidates:
+            if pos not in sharing:
+                continue
+            common = sum((counts & self.name_counts[pos]).values())
+            if 2.0 * common / (len(norm_apt) + len(self.names[pos])) >= self.threshold:
+                shortlist.append(pos)
+        return shortlist
+
+    def match(self, gu, dong, apt) -> int:
+        """
+        단지 하나 매칭
+
+        Args:
+            gu: 자치구
+            dong: 동
+            apt: 아파트명
+
+        Returns:
+            int: 매칭된 메인 아파트 위치 (없으면 -1)
+        """
+        candidates = self.by_key.get((gu, normalize_dong(dong)), [])
+        if not candidates:
+            candidates = self.by_gu.get(gu, [])
+        if not candidates:
+            return -1
+
+        norm_apt = normalize_apt_strong(apt)
+        best_pos = -1
+        best_sim = -1.0
+        for pos in self._shortlist(norm_apt, candidates):
+            sim = name_similarity(norm_apt, self.names[pos])
+            # 동점이면 먼저 나온 후보 유지
+            if sim > best_sim:
+                best_pos, best_sim = pos, sim
+        if best_pos >= 0 and best_sim >= self.threshold:
+            return best_pos
+        return -1
+
+    def match_frame(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        데이터프레임 전체 매칭 (같은 자치구/동/아파트명 조합은 한 번만 계산)
+
+        Args:
+            df: 자치구, 동, 아파트명 컬럼이 있는 데이터프레임
+
+        Returns:
+            np.ndarray: 행별 메인 아파트 위치 (없으면 -1)
+        """
+        results = np.full(len(df), -1, dtype=np.int64)
+        memo = {}
+        for row, key in enumerate(zip(df["자치구"], df["동"], df["아파트명"])):
+            try:
+                pos = memo[key]
+            except KeyError:
+                pos = memo[key] = self.match(*key)
+            except TypeError:
+                pos = self.match(*key)
+            results[row] = pos
+        return results
+
+
+def _file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _frame_hash(df: pd.DataFrame) -> str:
+    keys = df[["자치구", "동", "아파트명"]].astype(str)
+    return hashlib.sha256(pd.util.hash_pandas_object(keys, index=False).values.tobytes()).hexdigest()
+
+
+def load_main_apt(main_path: str) -> Optional[pd.DataFrame]:
+    """메인 아파트 CSV 로드 (구/동/아파트명 중복 제거). 읽을 수 없으면 None."""
+    try:
+        main = pd.read_csv(main_path, encoding="utf-8-sig")
+        main = main[["구", "동", "아파트명", "평수", "실거래가", "기준연월일"]].drop_duplicates(
+            subset=["구", "동", "아파트명"], keep="first"
+        )
+    except Exception:
+        return None
+    return main.reset_index(drop=True)
+
+
+def match_main_apt(
+    df: pd.DataFrame,
+    main_path: str,
+    threshold: float = MAIN_APT_SIMILARITY_THRESHOLD,
+    cache_dir: Optional[str] = MATCH_CACHE_DIR,
+) -> Tuple[Optional[pd.DataFrame], np.ndarray]:
+    """
+    행별 매칭 결과 계산 (입력 해시가 같으면 저장된 결과 사용)
+
+    Args:
+        df: 자치구, 동, 아파트명 컬럼이 있는 데이터프레임
+        main_path: 메인 아파트 CSV 경로
+        threshold: 유사도 임계값
+        cache_dir: 결과 저장 디렉터리 (None이면 저장하지 않음)
+
+    Returns:
+        Tuple[Optional[pd.DataFrame], np.ndarray]: (메인 아파트 데이터, 행별 위치 배열 (-1은 미매칭))
+    """
+    main = load_main_apt(main_path)
+    if main is None:
+        return None, np.full(len(df), -1, dtype=np.int64)
+
+    cache_path = None
+    if cache_dir:
+        key = f"{MATCHER_VERSION}:{threshold}:{_file_hash(main_path)}:{_frame_hash(df)}"
+        cache_path = os.path.join(cache_dir, hashlib.sha256(key.encode()).hexdigest()[:32] + ".npy")
+        try:
+            positions = np.load(cache_path)
+            if len(positions) == len(df):
+                return main, positions
+        except (OSError, ValueError):
+            pass
+
+    positions = MainAptMatcher(main, threshold).match_frame(df)
+
+    if cache_path:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.tmp.npy"
+            np.save(tmp_path, positions)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    return main, positions
+
+
+def enrich_with_main_apt(
+    df: pd.DataFrame,
+    main_path: str,
+    threshold: float = MAIN_APT_SIMILARITY_THRESHOLD,
+    cache_dir: Optional[str] = MATCH_CACHE_DIR,
+) -> pd.DataFrame:
+    """
+    메인 아파트 CSV와 동 정규화 + 단지명 유사도 매칭으로 left join.
+    - 1차: (자치구, norm_동) 일치 후보 중 단지명 유사도(강화 정규화) >= 임계값
+    - 2차(fallback): 동 후보 없으면 자치구만으로 후보 확대 후 동일 유사도 매칭
+    매칭되면 평수, 실거래가, 기준연월일 추가; 안 되면 공란.
+    파일 없어도 컬럼은 추가해 테이블에 항상 표시.
+    """
+    df = df.copy()
+    for col in MAIN_APT_COLUMNS:
+        df[col] = None
+    if not os.path.exists(main_path) or df.empty:
+        return df
+    if "자치구" not in df.columns or "동" not in df.columns or "아파트명" not in df.columns:
+        return df
+
+    main, positions = match_main_apt(df, main_path, threshold, cache_dir)
+    if main is None:
+        return df
+    matched = positions >= 0
+    if matched.any():
+        rows = np.flatnonzero(matched)
+        for col in MAIN_APT_COLUMNS:
+            values = np.full(len(df), None, dtype=object)
+            values[rows] = main[col].to_numpy(dtype=object)[positions[matched]]
+            df[col] = pd.Series(values, index=df.index, dtype=object)
+    return df
@@ -0,0 +1,74 @@
+"""
+저장 형식별 로드 시간 비교 (CSV vs Parquet vs Feather) + 앱 데이터셋 메모리 사용량
+사용법: python benchmark_storage.py [CSV 파일 경로] [반복 배수]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from config import APP_DATA_COLUMNS
+from dataset_schema import apply_schema, drop_passthrough_columns, memory_usage_mb
+from storage import USE_PYARROW, load_dataset, save_dataset
+
+
+def _timeit(func, repeat: int = 5) -> float:
+    """가장 빠른 실행 시간 (초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    csv_file = sys.argv[1] if len(sys.argv) > 1 else "seoul_apartments_metadata.csv"
+    scale = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+    if not os.path.exists(csv_file):
+        print(f"❌ 파일을 찾을 수 없습니다: {csv_file}")
+        return
+    if not USE_PYARROW:
+        print("⚠️ pyarrow가 설치되지 않아 CSV만 측정할 수 있습니다. (pip install pyarrow)")
+        return
+
+    df = pd.read_csv(csv_file, encoding="utf-8-sig")
+    if scale > 1:
+        df = pd.concat([df] * scale, ignore_index=True)
+    columns = [col for col in APP_DATA_COLUMNS if col in df.columns]
+
+    print("=" * 60)
+    print(f"데이터: {len(df)}행 x {len(df.columns)}컬럼 (앱 사용 컬럼 {len(columns)}개)")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        results = []
+        for ext in (".csv", ".parquet", ".feather"):
+            path = os.path.join(tmp_dir, f"bench{ext}")
+            save_dataset(df, path)
+            size_mb = os.path.getsize(path) / 1024 / 1024
+            full = _timeit(lambda: load_dataset(path))
+            projected = _timeit(lambda: load_dataset(path, columns=columns))
+            results.append((ext.lstrip("."), size_mb, full, projected))
+
+        base_full = results[0][2]
+        print(f"{'형식':<10}{'크기(MB)':>10}{'전체 로드(ms)':>16}{'컬럼 선택(ms)':>16}{'CSV 전체 대비':>12}")
+        for name, size_mb, full, projected in results:
+            print(f"{name:<10}{size_mb:>10.2f}{full * 1000:>16.1f}{projected * 1000:>16.1f}{base_full / projected:>11.1f}x")
+
+        # 타입 보존 확인 (CSV는 결측치가 있는 정수 컬럼이 float로 바뀜)
+        parquet_df = load_dataset(os.path.join(tmp_dir, "bench.parquet"))
+        changed = [col for col in df.columns if parquet_df[col].dtype != df[col].dtype]
+        print(f"\nParquet 왕복 후 타입이 바뀐 컬럼: {changed or '없음'}")
+
+    # 메모리 사용량 (타입 스키마 적용 전 → 후)
+    app_df = df[columns]
+    print(f"\n메모리 (전체 컬럼): {memory_usage_mb(df):.2f} MB → 원본_* 제외 + 타입 스키마 "
+          f"{memory_usage_mb(apply_schema(drop_passthrough_columns(df))):.2f} MB")
+    print(f"메모리 (앱 사용 컬럼): {memory_usage_mb(app_df):.2f} MB → 타입 스키마 {memory_usage_mb(apply_schema(app_df)):.2f} MB")
+
+if __name__ == "__main__":
+    main()
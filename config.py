@@ -64,7 +64,121 @@ SEOUL_DISTRICTS = [
     "성북구", "송파구", "양천구", "영등포구", "용산구", "은평구", "종로구", "중구", "중랑구"
 ]
 
+# 서울시 자치구 코드 (법정동 코드 앞 5자리, 실거래가 데이터의 SGG_CD)
+SEOUL_DISTRICT_CODES = {
+    "11110": "종로구", "11140": "중구", "11170": "용산구", "11200": "성동구", "11215": "광진구",
+    "11230": "동대문구", "11260": "중랑구", "11290": "성북구", "11305": "강북구", "11320": "도봉구",
+    "11350": "노원구", "11380": "은평구", "11410": "서대문구", "11440": "마포구", "11470": "양천구",
+    "11500": "강서구", "11530": "구로구", "11545": "금천구", "11560": "영등포구", "11590": "동작구",
+    "11620": "관악구", "11650": "서초구", "11680": "강남구", "11710": "송파구", "11740": "강동구",
+}
+
 # 크롤링 설정
 CRAWL_DELAY = 1  # 요청 간 지연 시간 (초)
-MAX_RETRIES = 3  # 최대 재시도 횟수
+MAX_RETRIES = 3  # 최대 재시도 횟수 (5xx 응답, 연결/읽기 타임아웃)
+RETRY_BACKOFF_FACTOR = 0.5  # 재시도 지수 백오프 계수 (초, 0.5 → 1 → 2 ...)
+CRAWL_MAX_WORKERS = 4  # 페이지 동시 요청 스레드 수
+CRAWL_REQUESTS_PER_SECOND = 4  # 초당 최대 요청 수 (CRAWL_DELAY 대신 사용)
+
+# 서울 열린데이터광장 Open API 제한
+SEOUL_API_PAGE_SIZE = 1000  # 1회 최대 조회 건수
+SEOUL_API_DAILY_QUOTA = 1000  # 하루 최대 요청 횟수
+
+# Open API 응답 디스크 캐시 (개발용 선택 기능, 기본 꺼짐. API 키는 캐시 키에 포함되지 않음)
+# 켜도 데이터 새로고침/증분 동기화는 캐시를 읽지 않고 항상 API를 호출해 캐시를 갱신함
+HTTP_CACHE_ENABLED = get_secret("HTTP_CACHE_ENABLED", "false").lower() in ("1", "true", "yes")
+HTTP_CACHE_DIR = ".cache/http"
+HTTP_CACHE_TTL = 24 * 60 * 60  # 캐시 유효 시간 (초)
+HTTP_CACHE_MAX_BYTES = 200 * 1024 * 1024  # 캐시 최대 용량 (초과 시 오래 사용하지 않은 항목부터 삭제)
+# 오프라인 모드: API를 호출하지 않고 캐시된 응답만 사용 (개발/테스트용, HTTP_CACHE_ENABLED와 무관하게 캐시 사용)
+SEOUL_API_OFFLINE = get_secret("SEOUL_API_OFFLINE", "false").lower() in ("1", "true", "yes")
+
+# 처리된 아파트 메타데이터 파일 (Parquet, pyarrow가 없으면 같은 이름의 .csv)
+METADATA_FILE = "seoul_apartments_metadata.parquet"
+
+# 지하철 접근성 지표 컬럼 (단지 전체를 한 번에 계산)
+# 반경(m) → 반경 내 지하철역 수 컬럼
+SUBWAY_COUNT_COLUMNS = {500: "반경500m_지하철역수", 1000: "반경1km_지하철역수"}
+# n번째로 가까운 역 → 거리 컬럼 (가장 가까운 역은 지하철역거리_km)
+SUBWAY_RANK_COLUMNS = {2: "2번째지하철역거리_km", 3: "3번째지하철역거리_km"}
+# 주요 거점역 → 거리 컬럼 (역 이름은 subway_stations.STATIONS의 역 이름)
+SUBWAY_HUB_COLUMNS = {"강남역": "강남역거리_km", "시청역": "시청역거리_km", "여의도역": "여의도역거리_km"}
+SUBWAY_ACCESS_COLUMNS = [
+    *SUBWAY_COUNT_COLUMNS.values(), *SUBWAY_RANK_COLUMNS.values(), *SUBWAY_HUB_COLUMNS.values(),
+]
+
+# 도보 네트워크 거리 (선택): 도로/보행로 그래프 파일이 있을 때만 역까지 도보 거리 계산
+# 노드 파일: node_id, lat, lon / 간선 파일: u, v, length_m (OSMnx graph_to_gdfs의 osmid, y, x / u, v, length도 인식)
+# 확장자를 빼고 찾으므로 Parquet/Feather/CSV 모두 가능
+WALK_NETWORK_NODES_FILE = "walk_network_nodes.parquet"
+WALK_NETWORK_EDGES_FILE = "walk_network_edges.parquet"
+WALK_SNAP_MAX_KM = 0.3  # 단지/역을 가장 가까운 그래프 노드에 붙일 최대 거리 (넘으면 그래프 밖으로 보고 제외)
+
+# 앱에서 사용하는 메타데이터 컬럼 (저장 파일에서 이 컬럼만 읽음)
+APP_DATA_COLUMNS = [
+    "자치구", "동", "주소", "아파트명", "건축연도", "세대수", "복도계단식",
+    "평형", "세대당평균평형",
+    "전용면적60㎡이하_세대수", "전용면적60_85㎡_세대수", "전용면적85_135㎡_세대수",
+    "주차대수", "세대당주차면수",
+    "위도", "경도", "지오해시", "가장가까운지하철역", "지하철역거리_km",
+    "도보지하철역", "지하철역도보거리_km",
+    *SUBWAY_ACCESS_COLUMNS,
+    "원본_CMPX_CLSF", "원본_EMD_ADDR",
+]
+
+# 지도: 결과가 MAP_TILE_THRESHOLD개를 넘으면 축소 화면에서 지오해시 격자 타일로 표시하고 확대하면 개별 단지 표시,
+# MAP_RAW_POINT_LIMIT개를 넘으면 개별 단지는 보내지 않고 타일만 표시
+MAP_TILE_THRESHOLD = 1000
+MAP_RAW_POINT_LIMIT = 5000
+# 타일 단계: (지오해시 정밀도, 최소 줌, 최대 줌). 5 ≈ 4.9km, 6 ≈ 1.2km x 0.6km, 7 ≈ 150m 격자
+TILE_LEVELS = [(5, 0, 12), (6, 13, 14), (7, 15, 18)]
+MAP_RAW_MIN_ZOOM = 15  # 개별 단지를 표시하는 최소 줌 (이 줌부터는 타일 대신 단지 마커)
+TILE_MAX_PRECISION = 7  # 행별로 저장하는 지오해시 정밀도 (상위 격자는 앞 글자)
+MAP_CACHE_SIZE = 16  # 프로세스 전체에서 보관할 지도 HTML 개수 (데이터셋/필터 결과별, 모든 세션 공용, 오래 쓰지 않은 것부터 삭제)
+
+# 메인 아파트(실거래가) 단지명 유사도 매칭 임계값 (0~1). 0.75로 완화해 매칭률 상승
+MAIN_APT_SIMILARITY_THRESHOLD = 0.75
+MATCH_CACHE_DIR = ".cache/apt_match"  # 매칭 결과 저장 디렉터리 (입력 파일 해시별)
+
+# 아파트 정보 증분 동기화 상태 파일 (수정일자 워터마크)
+SYNC_STATE_FILE = "seoul_apartments_metadata.sync.json"
+
+# 목록 탭 다운로드: CSV 인코딩 묶음 행 수, 필터 결과/형식별로 보관할 파일 개수
+EXPORT_CHUNK_ROWS = 5000
+EXPORT_CACHE_SIZE = 8
+
+# 목록 탭 페이지당 행 수 (선택지, 첫 값이 기본값)
+LIST_PAGE_SIZES = [100, 50, 500, 1000]
+
+# 앱 메모리용 컬럼 타입 (로드 후 적용, 값이 범위를 벗어나거나 정수가 아니면 원래 타입 유지)
+DATASET_DTYPES = {
+    "자치구": "category",
+    "동": "category",
+    "복도계단식": "category",
+    "난방방식": "category",
+    "건설사": "category",
+    "시행사": "category",
+    "가장가까운지하철역": "category",
+    "건축연도": "Int16",
+    "세대수": "Int32",
+    "주차대수": "Int32",
+    "전용면적60㎡이하_세대수": "Int32",
+    "전용면적60_85㎡_세대수": "Int32",
+    "전용면적85_135㎡_세대수": "Int32",
+    "위도": "float32",
+    "경도": "float32",
+    "지하철역거리_km": "float32",
+    "도보지하철역": "category",
+    "지하철역도보거리_km": "float32",
+    **{col: "Int16" for col in SUBWAY_COUNT_COLUMNS.values()},
+    **{col: "float32" for col in [*SUBWAY_RANK_COLUMNS.values(), *SUBWAY_HUB_COLUMNS.values()]},
+}
+# 목록에 없는 문자열 컬럼도 고유값 비율이 이 값 이하이면 category로 변환
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+# 원본 API 필드 그대로 보관하는 컬럼 접두어 (앱 메모리에는 올리지 않고 필요할 때 파일에서 읽음)
+PASSTHROUGH_PREFIX = "원본_"
 
+# 세션 간 공유 데이터셋 (준비된 데이터를 메모리 매핑 Arrow 파일로 게시, CURRENT.json이 현재 버전을 가리킴)
+SHARED_DATASET_DIR = ".cache/shared_dataset"
+SHARED_DATASET_KEEP_VERSIONS = 2  # 항상 보관할 최근 버전 수
+SHARED_DATASET_GRACE_SECONDS = 600  # 새 버전 게시 후 이전 버전 파일을 지우기 전까지 기다릴 시간(초)
@@ -2,13 +2,23 @@
 서울시 공동주택 아파트 정보 (메타데이터) 수집 스크립트
 데이터셋: OA-15818
 1000개씩 배치로 전체 데이터 수집
+(저장된 데이터가 있으면 수정일자 기준 증분 동기화, --full 옵션으로 전체 재수집)
 """
 from crawler import SeoulApartmentCrawler
+from config import METADATA_FILE
+from district_stats import compute_district_stats, save_district_stats
+from storage import dataset_path, find_dataset
+from utils import preprocess_apartment_df
+import pandas as pd
 import os
 import sys
 
 def main():
-    crawler = SeoulApartmentCrawler()
+    crawler = SeoulApartmentCrawler(revalidate_cache=True)  # 수집은 항상 최신 응답 사용 (캐시는 갱신만)
+    
+    # --full: 저장된 데이터와 관계없이 전체 다시 수집
+    args = [arg for arg in sys.argv[1:] if arg != "--full"]
+    full_refresh = "--full" in sys.argv[1:]
     
     print("=" * 60)
     print("서울시 공동주택 아파트 정보 (메타데이터) 수집")
@@ -30,18 +40,30 @@ def main():
         print(f"✅ API 테스트 성공! {len(test_df)}건 수집")
         print("\n전체 데이터 수집 시작 (1000개씩 배치)...")
         
-        # 전체 데이터 수집 (1000개씩 자동 분할)
-        all_df = crawler.crawl_seoul_apartment_info_all(max_records=50000)
+        # 저장된 데이터가 있으면 변경된 단지만 갱신 (--full 옵션으로 전체 재수집)
+        stored_df = pd.DataFrame()
+        if not full_refresh and find_dataset(METADATA_FILE):
+            stored_df = crawler.load_dataset(METADATA_FILE)
+        
+        # 전체 데이터 수집 (1000개씩 자동 분할) 후 변경분만 변환
+        processed_df, sync_summary = crawler.sync_seoul_apartment_info(stored_df, max_records=50000)
         
-        if not all_df.empty:
-            processed_df = crawler.process_seoul_apartment_info_data(all_df)
-            crawler.save_to_csv(processed_df, "seoul_apartments_metadata.csv")
+        if sync_summary and not processed_df.empty:
+            output_file = crawler.save_dataset(processed_df, dataset_path(METADATA_FILE))
+            # 앱 통계 탭용 자치구별 통계 (앱과 같은 전처리 후 계산)
+            save_district_stats(compute_district_stats(preprocess_apartment_df(processed_df)), output_file)
+            crawler.save_sync_state(sync_summary)
             
             print("\n" + "=" * 60)
             print("✅ API를 통한 수집 완료!")
             print("=" * 60)
             print(f"총 {len(processed_df)}건의 아파트 메타데이터")
-            print(f"저장 파일: seoul_apartments_metadata.csv")
+            if sync_summary["mode"] == "incremental":
+                print(
+                    f"신규 {sync_summary['new']}건, 수정 {sync_summary['updated']}건, "
+                    f"삭제 {sync_summary['deleted']}건, 유지 {sync_summary['unchanged']}건"
+                )
+            print(f"저장 파일: {output_file}")
             return
         else:
             print("⚠️  전체 데이터 수집 실패")
@@ -53,8 +75,8 @@ def main():
     print("-" * 60)
     
     csv_file = None
-    if len(sys.argv) > 1:
-        csv_file = sys.argv[1]
+    if args:
+        csv_file = args[0]
         print(f"지정된 CSV 파일: {csv_file}")
     else:
         # 자동 검색
@@ -83,7 +105,7 @@ def main():
             print("✅ 수집 완료!")
             print("=" * 60)
             print(f"총 {len(result_df)}건의 아파트 메타데이터")
-            print(f"저장 파일: seoul_apartments_metadata.csv")
+            print(f"저장 파일: {dataset_path(METADATA_FILE)}")
             print("\n데이터 통계:")
             if result_df['자치구'].notna().any():
                 print(f"  - 자치구: {result_df['자치구'].nunique()}개")
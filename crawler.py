@@ -3,27 +3,222 @@
 공공데이터포털 API와 네이버 부동산 크롤링을 결합
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
 import time
 import json
+import threading
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
 from config import (
     PUBLIC_DATA_API_KEY, 
     SEOUL_DATA_API_KEY,
     SEOUL_REAL_ESTATE_DATASET_ID,
     SEOUL_APARTMENT_INFO_DATASET_ID,
     SEOUL_DISTRICTS, 
-    CRAWL_DELAY
+    SEOUL_DISTRICT_CODES,
+    SEOUL_API_PAGE_SIZE,
+    SEOUL_API_DAILY_QUOTA,
+    CRAWL_DELAY,
+    CRAWL_MAX_WORKERS,
+    CRAWL_REQUESTS_PER_SECOND,
+    MAX_RETRIES,
+    RETRY_BACKOFF_FACTOR,
+    SYNC_STATE_FILE,
+    METADATA_FILE,
+    HTTP_CACHE_ENABLED,
+    HTTP_CACHE_DIR,
+    HTTP_CACHE_TTL,
+    HTTP_CACHE_MAX_BYTES,
+    SEOUL_API_OFFLINE,
 )
-from utils import extract_district, calculate_pyeong, calculate_distance_to_subway
+from http_cache import ResponseCache
+from spatial_tiles import geohash_strings
+from storage import dataset_path, find_dataset, load_dataset, save_dataset
+from utils import (
+    extract_district_series,
+    calculate_pyeong,
+    calculate_pyeong_series,
+    round_series,
+    calculate_distance_to_subway_batch,
+    calculate_subway_accessibility_batch,
+    add_subway_accessibility,
+)
+
+
+# OA-15818 원본 API 응답 컬럼 → 결측 시 기본값 (원본_* 컬럼으로 그대로 보존)
+APT_INFO_RAW_COLUMNS = {
+    "SN": None,
+    "APT_CD": '',
+    "APT_NM": '',
+    "CMPX_CLSF": '',  # 단지분류
+    "APT_STDG_ADDR": '',  # 지번주소
+    "APT_RDN_ADDR": '',  # 도로명주소
+    "CTPV_ADDR": '',  # 시도주소
+    "SGG_ADDR": '',  # 시군구주소
+    "EMD_ADDR": '',  # 읍면동주소
+    "DADDR": '',  # 상세주소
+    "RDN_ADDR": '',  # 도로명
+    "ROAD_DADDR": '',  # 도로명상세주소
+    "TELNO": '',
+    "FXNO": '',  # 팩스번호
+    "APT_CMPX": '',  # 아파트단지
+    "APT_ATCH_FILE": '',  # 첨부파일
+    "HH_TYPE": '',  # 세대유형
+    "MNG_MTHD": '',  # 관리방법
+    "ROAD_TYPE": '',  # 복도유형
+    "MN_MTHD": '',  # 난방방식
+    "WHOL_DONG_CNT": None,  # 전체동수
+    "TNOHSH": None,  # 전체세대수
+    "BLDR": '',  # 건설사
+    "DVLR": '',  # 시행사
+    "USE_APRV_YMD": '',  # 사용승인일
+    "GFA": None,  # 연면적
+    "RSDT_XUAR": None,  # 주거전용면적
+    "MNCO_LEVY_AREA": None,  # 관리비부과면적
+    "XUAR_HH_STTS60": None,  # 전용면적별세대현황(60㎡이하)
+    "XUAR_HH_STTS85": None,  # 전용면적별세대현황(60㎡~85㎡이하)
+    "XUAR_HH_STTS135": None,  # 85㎡~135㎡이하
+    "XUAR_HH_STTS136": None,  # 135㎡초과
+    "HMPG": '',  # 홈페이지
+    "REG_YMD": '',  # 등록일자
+    "MDFCN_YMD": '',  # 수정일자
+    "EPIS_MNG_NO": '',  # 에피소드관리번호
+    "EPS_MNG_FORM": '',  # 에피소드관리형태
+    "HH_ELCT_CTRT_MTHD": '',  # 세대전기계약방법
+    "CLNG_MNG_FORM": '',  # 냉방관리형태
+    "BDAR": None,  # 건물면적
+    "PRK_CNTOM": None,  # 주차대수
+    "SE_CD": '',  # 시설코드
+    "CMPX_APRV_DAY": '',  # 단지승인일
+    "USE_YN": '',  # 사용여부
+    "MNCO_ULD_YN": '',  # 관리사무소유무
+    "XCRD": '',  # 경도
+    "YCRD": '',  # 위도
+    "CMPX_APLD_DAY": '',  # 단지적용일
+}
+
+
+
+def _raw_column(df: pd.DataFrame, name: str, default=None) -> pd.Series:
+    """원본 컬럼 (0부터 시작하는 인덱스, 컬럼이 없으면 기본값으로 채움)"""
+    if name in df.columns:
+        return df[name].reset_index(drop=True)
+    return pd.Series([default] * len(df), dtype=object)
+
+
+def _text_column(df: pd.DataFrame, name: str) -> pd.Series:
+    """문자열 컬럼 (결측/빈 값은 '')"""
+    return _raw_column(df, name, '').astype(object).where(lambda s: s.notna(), '')
+
+
+def _optional_text_column(df: pd.DataFrame, name: str) -> pd.Series:
+    """문자열 컬럼 (row.get(name, '') or ''와 동일: None/빈 값은 '', NaN은 결측 그대로)"""
+    values = _raw_column(df, name, '')
+    raw = values.to_numpy(dtype=object)
+    empty = (raw == None) | (raw == '')  # noqa: E711 (object 배열 원소별 비교)
+    return values.astype(object).where(~empty, '')
+
+
+def _numeric_column(df: pd.DataFrame, name: str) -> pd.Series:
+    """숫자 컬럼 (변환 불가 값은 NaN)"""
+    return pd.to_numeric(_raw_column(df, name), errors='coerce').astype(float)
+
+
+def _integer_column(df: pd.DataFrame, name: str) -> pd.Series:
+    """정수 컬럼 (int() 변환과 동일하게 소수점 이하 버림, 변환 불가 값은 NaN)"""
+    return np.trunc(_numeric_column(df, name))
+
+
+def _batch_by_unique_coordinates(batch_func, lats, lons) -> pd.DataFrame:
+    """
+    좌표별 일괄 계산을 고유 좌표마다 한 번만 실행하고 행 순서로 펼침
+    (실거래가 데이터처럼 같은 건물 좌표가 여러 행에 반복될 때)
+
+    Args:
+        batch_func: (위도 배열, 경도 배열) → 행 순서 DataFrame 함수
+        lats: 위도 배열 (숫자 변환 불가/결측은 0으로 보고 계산 제외)
+        lons: 경도 배열
+
+    Returns:
+        pd.DataFrame: batch_func 결과 (입력 순서, 0부터 시작하는 인덱스)
+    """
+    coords = np.column_stack([
+        pd.to_numeric(pd.Series(np.asarray(values, dtype=object).ravel()), errors='coerce').to_numpy(dtype=float)
+        for values in (lats, lons)
+    ])
+    coords[~np.isfinite(coords)] = 0
+    unique_coords, inverse = np.unique(coords, axis=0, return_inverse=True)
+    result = batch_func(unique_coords[:, 0], unique_coords[:, 1])
+    return result.iloc[inverse.ravel()].reset_index(drop=True)
+
+
+class RateLimiter:
+    """초당 요청 수 제한 (여러 스레드에서 공유 가능)"""
+    
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second if requests_per_second and requests_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+    
+    def wait(self):
+        """다음 요청 가능 시각까지 대기"""
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+def create_http_session(pool_size: int = CRAWL_MAX_WORKERS, max_retries: int = MAX_RETRIES) -> requests.Session:
+    """
+    연결 풀(keep-alive)과 재시도 정책이 설정된 HTTP 세션 생성
+    5xx 응답, 연결/읽기 타임아웃 시 지수 백오프(+지터)로 최대 max_retries회 재시도합니다.
+    
+    Args:
+        pool_size: 호스트당 유지할 연결 수 (동시 요청 스레드 수 이상)
+        max_retries: 최대 재시도 횟수
+    
+    Returns:
+        requests.Session: HTTP 세션
+    """
+    retry_options = dict(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    )
+    try:
+        retry = Retry(backoff_jitter=RETRY_BACKOFF_FACTOR, **retry_options)
+    except TypeError:
+        # urllib3 1.x에는 backoff_jitter 옵션이 없음
+        retry = Retry(**retry_options)
+    
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
 class SeoulApartmentCrawler:
     """서울 아파트 데이터 크롤러"""
     
-    def __init__(self):
+    def __init__(self, revalidate_cache: bool = False):
+        """
+        Args:
+            revalidate_cache: 응답 캐시를 읽지 않고 항상 API를 호출해 캐시를 갱신할지 여부
+                (데이터 새로고침/동기화처럼 최신 목록이 필요한 경우, 오프라인 모드에서는 무시)
+        """
         # API 키가 이미 URL 인코딩되어 있으면 디코딩
         self.api_key = PUBLIC_DATA_API_KEY
         if self.api_key and self.api_key != "YOUR_API_KEY_HERE":
@@ -45,6 +240,75 @@ class SeoulApartmentCrawler:
         # 서울 열린데이터광장 API 엔드포인트
         self.seoul_api_base = "http://openapi.seoul.go.kr:8088"
         self.data = []
+        
+        # 서울 열린데이터광장 API 요청 속도/횟수 제한 (하루 최대 1,000회)
+        self.rate_limiter = RateLimiter(CRAWL_REQUESTS_PER_SECOND)
+        self.request_count = 0
+        self._request_count_lock = threading.Lock()
+        self.last_total_count = 0  # 마지막 전체 수집 시 list_total_count
+        
+        # 연결 풀/재시도가 설정된 공용 HTTP 세션과 요청별 소요 시간 기록
+        self.session = create_http_session()
+        self.request_timings = []
+        
+        # Open API 응답 디스크 캐시 (HTTP_CACHE_ENABLED일 때만, 오프라인 모드는 캐시만 사용)
+        self.response_cache = (
+            ResponseCache(HTTP_CACHE_DIR, HTTP_CACHE_TTL, HTTP_CACHE_MAX_BYTES)
+            if HTTP_CACHE_ENABLED or SEOUL_API_OFFLINE else None
+        )
+        self.offline = SEOUL_API_OFFLINE
+        self.revalidate_cache = revalidate_cache
+    
+    def _http_get(self, url: str, **kwargs) -> requests.Response:
+        """
+        공용 세션으로 GET 요청 후 소요 시간 기록
+        
+        Args:
+            url: 요청 URL
+            **kwargs: requests.Session.get 인자 (timeout 등)
+        
+        Returns:
+            requests.Response: 응답
+        """
+        started = time.perf_counter()
+        status_code = None
+        try:
+            response = self.session.get(url, **kwargs)
+            status_code = response.status_code
+            return response
+        finally:
+            self.request_timings.append({
+                "url": self._redact_url(url),
+                "status_code": status_code,
+                "seconds": time.perf_counter() - started,
+            })
+    
+    def _redact_url(self, url: str) -> str:
+        """URL에서 API 키 가리기"""
+        for key in (self.seoul_api_key, self.api_key, urllib.parse.quote(self.api_key or "")):
+            if key and key not in ("YOUR_SEOUL_API_KEY_HERE", "YOUR_API_KEY_HERE"):
+                url = url.replace(key, "***")
+        return url
+    
+    def get_request_stats(self) -> Dict:
+        """
+        HTTP 요청 소요 시간 통계
+        첫 요청(연결 수립 포함)과 이후 요청(연결 재사용)의 평균을 비교할 수 있습니다.
+        
+        Returns:
+            Dict: 요청 수, 전체/첫 요청/이후 요청 평균 소요 시간(초)
+        """
+        seconds = [timing["seconds"] for timing in self.request_timings]
+        if not seconds:
+            return {"count": 0}
+        later = seconds[1:]
+        return {
+            "count": len(seconds),
+            "total_seconds": round(sum(seconds), 3),
+            "mean_seconds": round(sum(seconds) / len(seconds), 3),
+            "first_seconds": round(seconds[0], 3),
+            "later_mean_seconds": round(sum(later) / len(later), 3) if later else None,
+        }
     
     def test_api_key(self) -> bool:
         """
@@ -66,7 +330,7 @@ class SeoulApartmentCrawler:
             # URL에 직접 포함시키는 방식도 가능
             test_url = f"{self.base_url}?serviceKey={urllib.parse.quote(self.api_key)}&LAWD_CD=11680&DEAL_YMD=202401"
             
-            response = requests.get(test_url, timeout=10)
+            response = self._http_get(test_url, timeout=10)
             
             if response.status_code == 200:
                 # XML 응답 확인
@@ -143,86 +407,215 @@ class SeoulApartmentCrawler:
         Returns:
             pd.DataFrame: 부동산 실거래가 데이터프레임
         """
+        df, _ = self._fetch_seoul_real_estate_page(start_index, end_index)
+        return df
+    
+    def _fetch_seoul_real_estate_page(self, start_index: int, end_index: int) -> Tuple[pd.DataFrame, int]:
+        """
+        부동산 실거래가 한 페이지 조회
+        
+        Returns:
+            Tuple[pd.DataFrame, int]: (데이터프레임, 전체 데이터 건수 list_total_count)
+        """
+        return self._fetch_seoul_page(
+            "tbLnOpendataRentV", start_index, end_index,
+            label="서울 열린데이터광장", unit="데이터",
+        )
+    
+    def _fetch_seoul_page(
+        self, service_name: str, start_index: int, end_index: int, label: str, unit: str
+    ) -> Tuple[pd.DataFrame, int]:
+        """
+        서울 열린데이터광장 Open API 한 페이지 조회 (공통)
+        형식: http://openapi.seoul.go.kr:8088/{인증키}/json/{서비스명}/{시작인덱스}/{종료인덱스}
+        
+        Args:
+            service_name: 서비스명 (예: OpenAptInfo, tbLnOpendataRentV)
+            start_index: 시작 인덱스
+            end_index: 종료 인덱스 (최대 1000개씩 조회 가능)
+            label: 로그에 표시할 API 이름
+            unit: 로그에 표시할 데이터 단위
+        
+        Returns:
+            Tuple[pd.DataFrame, int]: (데이터프레임, 전체 데이터 건수 list_total_count)
+        """
+        # ⚠️ 주의: 1회에 최대 1,000건만 요청 가능
+        if end_index - start_index + 1 > SEOUL_API_PAGE_SIZE:
+            print(f"⚠️ 1회 요청은 최대 1,000건까지 가능합니다. (요청: {end_index - start_index + 1}건)")
+            end_index = start_index + SEOUL_API_PAGE_SIZE - 1
+        
+        # 응답 캐시 조회 (적중 시 요청 횟수를 소모하지 않음, 오프라인 모드는 만료 항목도 사용)
+        # revalidate_cache이면 캐시를 읽지 않고 API 응답으로 캐시를 갱신
+        cache_key = ResponseCache.make_key(service_name, start_index, end_index)
+        if self.response_cache is not None and (self.offline or not self.revalidate_cache):
+            cached = self.response_cache.get(cache_key, allow_expired=self.offline)
+            if cached is not None:
+                print(f"{label} 캐시 사용 (인덱스: {start_index}~{end_index})")
+                return self._parse_seoul_page(cached, service_name, start_index, unit)
+        if self.offline:
+            print(f"⚠️ 오프라인 모드: 캐시된 응답이 없습니다. ({cache_key})")
+            return pd.DataFrame(), 0
+        
         if self.seoul_api_key == "YOUR_SEOUL_API_KEY_HERE":
             print("⚠️ 서울 열린데이터광장 API 키가 설정되지 않았습니다.")
             print("   config.py에서 SEOUL_DATA_API_KEY를 설정하세요.")
             print("   또는 CSV 파일을 직접 다운로드하여 사용할 수 있습니다.")
-            return pd.DataFrame()
+            return pd.DataFrame(), 0
         
         try:
-            # 서울 열린데이터광장 Open API 엔드포인트
-            # 형식: http://openapi.seoul.go.kr:8088/{인증키}/json/{서비스명}/{시작인덱스}/{종료인덱스}
-            # ⚠️ 주의: 1회에 최대 1,000건만 요청 가능
-            if end_index - start_index + 1 > 1000:
-                print(f"⚠️ 1회 요청은 최대 1,000건까지 가능합니다. (요청: {end_index - start_index + 1}건)")
-                end_index = start_index + 999
+            with self._request_count_lock:
+                if self.request_count >= SEOUL_API_DAILY_QUOTA:
+                    print(f"⚠️ 하루 최대 요청 횟수({SEOUL_API_DAILY_QUOTA}회)에 도달했습니다.")
+                    return pd.DataFrame(), 0
+                self.request_count += 1
             
-            url = f"{self.seoul_api_base}/{self.seoul_api_key}/json/tbLnOpendataRentV/{start_index}/{end_index}"
+            url = f"{self.seoul_api_base}/{self.seoul_api_key}/json/{service_name}/{start_index}/{end_index}"
             
-            print(f"서울 열린데이터광장 API 호출 중... (인덱스: {start_index}~{end_index})")
-            response = requests.get(url, timeout=30)
+            print(f"{label} API 호출 중... (인덱스: {start_index}~{end_index})")
+            self.rate_limiter.wait()
+            response = self._http_get(url, timeout=30)
             
             if response.status_code == 200:
                 data = response.json()
                 
-                # API 응답 구조 확인
-                if 'tbLnOpendataRentV' in data:
-                    result = data['tbLnOpendataRentV']
-                    
-                    if 'row' in result:
-                        df = pd.DataFrame(result['row'])
-                        print(f"✅ {len(df)}개의 데이터를 수집했습니다.")
-                        return df
-                    else:
-                        print("⚠️ 데이터가 없습니다.")
-                        return pd.DataFrame()
-                else:
-                    print(f"⚠️ API 응답 구조가 예상과 다릅니다: {list(data.keys())}")
-                    return pd.DataFrame()
+                # 정상 응답(서비스명 키 포함)만 캐시에 저장
+                if self.response_cache is not None and service_name in data:
+                    self.response_cache.set(cache_key, data)
+                
+                return self._parse_seoul_page(data, service_name, start_index, unit)
             else:
                 print(f"❌ API 호출 실패: {response.status_code}")
                 print(f"   응답: {response.text[:200]}")
-                return pd.DataFrame()
+                return pd.DataFrame(), 0
                 
         except Exception as e:
-            print(f"❌ 서울 열린데이터광장 크롤링 오류: {type(e).__name__}")
+            print(f"❌ {label} 크롤링 오류: {type(e).__name__}")
             print(f"   오류 내용: {str(e)[:200]}")
-            return pd.DataFrame()
+            return pd.DataFrame(), 0
+    
+    def _parse_seoul_page(
+        self, data: Dict, service_name: str, start_index: int, unit: str
+    ) -> Tuple[pd.DataFrame, int]:
+        """
+        서울 열린데이터광장 Open API 응답 JSON을 데이터프레임으로 변환
+        
+        Args:
+            data: 응답 JSON
+            service_name: 서비스명
+            start_index: 시작 인덱스
+            unit: 로그에 표시할 데이터 단위
+        
+        Returns:
+            Tuple[pd.DataFrame, int]: (데이터프레임, 전체 데이터 건수 list_total_count)
+        """
+        # API 응답 구조: {서비스명} -> row
+        if service_name in data:
+            result = data[service_name]
+            
+            # 총 데이터 개수 확인
+            total_count = int(result.get('list_total_count', 0) or 0)
+            if start_index == 1:
+                print(f"   전체 데이터: {total_count}건")
+            
+            if 'row' in result:
+                df = pd.DataFrame(result['row'])
+                print(f"✅ {len(df)}개의 {unit}를 수집했습니다.")
+                return df, total_count
+            else:
+                print("⚠️ 데이터가 없습니다.")
+                return pd.DataFrame(), total_count
+        else:
+            print(f"⚠️ API 응답 구조가 예상과 다릅니다: {list(data.keys())}")
+            return pd.DataFrame(), 0
     
-    def crawl_seoul_real_estate_all(self, max_records: int = 10000) -> pd.DataFrame:
+    def _crawl_all_pages(
+        self,
+        fetch_page: Callable[[int, int], Tuple[pd.DataFrame, int]],
+        max_records: int,
+        concurrent: bool = True,
+    ) -> List[pd.DataFrame]:
+        """
+        여러 페이지를 나누어 수집
+        첫 페이지의 list_total_count로 나머지 페이지 범위를 미리 계산한 뒤,
+        concurrent=True이면 스레드 풀(CRAWL_MAX_WORKERS)로 동시에 요청합니다.
+        요청 속도는 RateLimiter(CRAWL_REQUESTS_PER_SECOND)로 제한되며,
+        결과는 인덱스 순서대로 반환됩니다.
+        
+        Args:
+            fetch_page: (시작, 종료) 인덱스를 받아 (데이터프레임, 전체 건수)를 반환하는 함수
+            max_records: 최대 수집할 레코드 수
+            concurrent: 동시 요청 여부
+        
+        Returns:
+            List[pd.DataFrame]: 페이지별 데이터프레임 (인덱스 순서)
+        """
+        batch_size = SEOUL_API_PAGE_SIZE
+        first_df, total_count = fetch_page(1, min(batch_size, max_records))
+        self.last_total_count = total_count
+        if first_df.empty:
+            print("더 이상 데이터가 없습니다.")
+            return []
+        
+        pages = [first_df]
+        if len(first_df) < batch_size or max_records <= batch_size:
+            print("마지막 배치를 수집했습니다.")
+            return pages
+        
+        if not total_count:
+            # 전체 건수를 알 수 없으면 짧은 배치가 나올 때까지 순차 수집
+            start_index = batch_size + 1
+            while start_index <= max_records:
+                end_index = min(start_index + batch_size - 1, max_records)
+                df_batch, _ = fetch_page(start_index, end_index)
+                if df_batch.empty:
+                    print("더 이상 데이터가 없습니다.")
+                    break
+                pages.append(df_batch)
+                start_index = end_index + 1
+                if len(df_batch) < batch_size:
+                    print("마지막 배치를 수집했습니다.")
+                    break
+            return pages
+        
+        # 나머지 페이지 범위 미리 계산 (남은 하루 요청 횟수 이내로)
+        last_index = min(total_count, max_records)
+        ranges = [
+            (start, min(start + batch_size - 1, last_index))
+            for start in range(batch_size + 1, last_index + 1, batch_size)
+        ]
+        remaining_quota = SEOUL_API_DAILY_QUOTA - self.request_count
+        if len(ranges) > remaining_quota:
+            print(f"⚠️ 남은 요청 횟수({remaining_quota}회)만큼만 수집합니다. (필요: {len(ranges)}회)")
+            ranges = ranges[:max(remaining_quota, 0)]
+        
+        if concurrent and len(ranges) > 1:
+            with ThreadPoolExecutor(max_workers=CRAWL_MAX_WORKERS) as executor:
+                results = list(executor.map(lambda page_range: fetch_page(*page_range), ranges))
+        else:
+            results = [fetch_page(*page_range) for page_range in ranges]
+        
+        for (start, end), (df_batch, _) in zip(ranges, results):
+            if df_batch.empty:
+                print(f"⚠️ 인덱스 {start}~{end} 페이지를 수집하지 못했습니다.")
+                continue
+            pages.append(df_batch)
+        return pages
+    
+    def crawl_seoul_real_estate_all(self, max_records: int = 10000, concurrent: bool = True) -> pd.DataFrame:
         """
         서울 열린데이터광장에서 모든 부동산 실거래가 데이터 크롤링
         (여러 번 호출하여 전체 데이터 수집)
         
         Args:
             max_records: 최대 수집할 레코드 수
+            concurrent: 페이지 동시 요청 여부
         
         Returns:
             pd.DataFrame: 전체 부동산 실거래가 데이터프레임
         """
-        all_data = []
-        start_index = 1
-        batch_size = 1000
-        
         print(f"서울 열린데이터광장에서 최대 {max_records}개의 데이터를 수집합니다...")
         
-        while start_index <= max_records:
-            end_index = min(start_index + batch_size - 1, max_records)
-            df_batch = self.crawl_seoul_real_estate(start_index, end_index)
-            
-            if df_batch.empty:
-                print("더 이상 데이터가 없습니다.")
-                break
-            
-            all_data.append(df_batch)
-            start_index = end_index + 1
-            
-            # API 호출 제한을 위한 지연
-            time.sleep(CRAWL_DELAY)
-            
-            if len(df_batch) < batch_size:
-                print("마지막 배치를 수집했습니다.")
-                break
+        all_data = self._crawl_all_pages(self._fetch_seoul_real_estate_page, max_records, concurrent)
         
         if all_data:
             result_df = pd.concat(all_data, ignore_index=True)
@@ -245,71 +638,52 @@ class SeoulApartmentCrawler:
         if df.empty:
             return df
         
-        processed_data = []
-        
-        for _, row in df.iterrows():
-            # 자치구 추출
-            district = extract_district(str(row.get('SGG_CD', '')) + str(row.get('BJDONG_NM', '')))
-            if not district:
-                # 주소에서 자치구 추출 시도
-                address = str(row.get('SGG_NM', '')) + str(row.get('BJDONG_NM', ''))
-                district = extract_district(address)
-            
-            # 건축년도
-            build_year = row.get('BUILD_YEAR', None)
-            try:
-                build_year = int(build_year) if pd.notna(build_year) else None
-            except:
-                build_year = None
-            
-            # 면적 정보
-            area_sqm = row.get('RENT_AREA', None) or row.get('RENT_GBN', None)
-            try:
-                area_sqm = float(area_sqm) if pd.notna(area_sqm) else None
-            except:
-                area_sqm = None
-            
-            pyeong = calculate_pyeong(area_sqm) if area_sqm else None
-            
-            # 주소 구성
-            address = f"서울특별시 {row.get('SGG_NM', '')} {row.get('BJDONG_NM', '')} {row.get('BLDG_NM', '')}"
-            address = address.strip()
-            
-            # 좌표 정보 (있는 경우)
-            lat = row.get('LAT', None)
-            lon = row.get('LNG', None) or row.get('LON', None)
-            
-            # 지하철역 거리 계산
-            nearest_station = None
-            distance_km = None
-            if lat and lon:
-                try:
-                    nearest_station, distance_km = calculate_distance_to_subway(float(lat), float(lon))
-                except:
-                    pass
-            
-            apartment = {
-                "자치구": district or row.get('SGG_NM', ''),
-                "주소": address,
-                "건축연도": build_year,
-                "세대수": None,  # 실거래가 데이터에는 세대수 정보가 없을 수 있음
-                "복도계단식": None,  # 실거래가 데이터에는 이 정보가 없을 수 있음
-                "전용면적_제곱미터": area_sqm,
-                "평형": pyeong,
-                "위도": lat,
-                "경도": lon,
-                "가장가까운지하철역": nearest_station,
-                "지하철역거리_km": distance_km,
-                # 추가 정보
-                "물건금액": row.get('RENT_GTN', None),
-                "보증금": row.get('RENT_DEPOSIT', None),
-                "월세": row.get('RENT_FEE', None),
-                "신고년도": row.get('CNTRCT_DE', None),
-            }
-            
-            processed_data.append(apartment)
-        
-        return pd.DataFrame(processed_data)
+        # 자치구: 구 코드(SGG_CD) 조회 → 이름 문자열 검색 → 원본 SGG_NM 순으로 결정
+        sgg_name = _text_column(df, 'SGG_NM').astype(str)
+        bjdong_name = _text_column(df, 'BJDONG_NM').astype(str)
+        sgg_code = _text_column(df, 'SGG_CD').astype(str)
+        district = sgg_code.str.strip().str.replace(r'\.0$', '', regex=True).str[:5].map(SEOUL_DISTRICT_CODES)
+        district = district.fillna(extract_district_series(sgg_code + bjdong_name))
+        district = district.fillna(extract_district_series(sgg_name + bjdong_name))
+        district = district.where(district.notna(), sgg_name)
+        
+        # 면적 정보 (RENT_AREA가 비어 있으면 RENT_GBN 사용)
+        area_raw = _raw_column(df, 'RENT_AREA').astype(object)
+        area_raw = area_raw.where(area_raw.astype(bool), _raw_column(df, 'RENT_GBN'))
+        area_sqm = pd.to_numeric(area_raw, errors='coerce').astype(float)
+        pyeong = calculate_pyeong_series(area_sqm.where(area_sqm != 0))
+        
+        # 주소 구성
+        address = ("서울특별시 " + sgg_name + " " + bjdong_name + " " + _text_column(df, 'BLDG_NM').astype(str)).str.strip()
+        
+        # 좌표 정보 (있는 경우) - 지하철역 거리 일괄 계산 (같은 건물 거래가 반복되므로 고유 좌표별로 한 번만)
+        lat = _raw_column(df, 'LAT')
+        lon = _raw_column(df, 'LNG').astype(object)
+        lon = lon.where(lon.astype(bool), _raw_column(df, 'LON'))  # LNG가 비어 있으면 LON (없으면 None)
+        subway_df = _batch_by_unique_coordinates(calculate_distance_to_subway_batch, lat.to_numpy(), lon.to_numpy())
+        access_df = _batch_by_unique_coordinates(calculate_subway_accessibility_batch, lat.to_numpy(), lon.to_numpy())
+        
+        empty = pd.Series([None] * len(df), dtype=object)
+        return pd.DataFrame({
+            "자치구": district,
+            "주소": address,
+            "건축연도": _integer_column(df, 'BUILD_YEAR'),
+            "세대수": empty,  # 실거래가 데이터에는 세대수 정보가 없을 수 있음
+            "복도계단식": empty,  # 실거래가 데이터에는 이 정보가 없을 수 있음
+            "전용면적_제곱미터": area_sqm,
+            "평형": pyeong,
+            "위도": lat,
+            "경도": lon,
+            "가장가까운지하철역": subway_df["가장가까운지하철역"],
+            "지하철역거리_km": subway_df["지하철역거리_km"],
+            # 지하철 접근성 지표 (반경 내 역 수, 2·3번째 역 거리, 거점역 거리)
+            **{col: access_df[col] for col in access_df.columns},
+            # 추가 정보
+            "물건금액": _raw_column(df, 'RENT_GTN'),
+            "보증금": _raw_column(df, 'RENT_DEPOSIT'),
+            "월세": _raw_column(df, 'RENT_FEE'),
+            "신고년도": _raw_column(df, 'CNTRCT_DE'),
+        })
     
     def crawl_seoul_apartment_info(self, start_index: int = 1, end_index: int = 1000) -> pd.DataFrame:
         """
@@ -336,95 +710,37 @@ class SeoulApartmentCrawler:
         Returns:
             pd.DataFrame: 아파트 정보 데이터프레임
         """
-        if self.seoul_api_key == "YOUR_SEOUL_API_KEY_HERE":
-            print("⚠️ 서울 열린데이터광장 API 키가 설정되지 않았습니다.")
-            print("   config.py에서 SEOUL_DATA_API_KEY를 설정하세요.")
-            print("   또는 CSV 파일을 직접 다운로드하여 사용할 수 있습니다.")
-            return pd.DataFrame()
+        df, _ = self._fetch_seoul_apartment_info_page(start_index, end_index)
+        return df
+    
+    def _fetch_seoul_apartment_info_page(self, start_index: int, end_index: int) -> Tuple[pd.DataFrame, int]:
+        """
+        공동주택 아파트 정보 한 페이지 조회
+        서비스명: OpenAptInfo (서울시 공동주택 아파트 정보)
         
-        try:
-            # 서울 열린데이터광장 Open API 엔드포인트
-            # 형식: http://openapi.seoul.go.kr:8088/{인증키}/json/{서비스명}/{시작인덱스}/{종료인덱스}
-            # 서비스명은 데이터셋에 따라 다를 수 있음 (일반적으로 데이터셋 ID 기반)
-            # ⚠️ 주의: 1회에 최대 1,000건만 요청 가능
-            if end_index - start_index + 1 > 1000:
-                print(f"⚠️ 1회 요청은 최대 1,000건까지 가능합니다. (요청: {end_index - start_index + 1}건)")
-                end_index = start_index + 999
-            
-            # 서비스명: OpenAptInfo (서울시 공동주택 아파트 정보)
-            # API 엔드포인트: http://openapi.seoul.go.kr:8088/{인증키}/json/OpenAptInfo/{시작}/{종료}
-            service_name = "OpenAptInfo"
-            url = f"{self.seoul_api_base}/{self.seoul_api_key}/json/{service_name}/{start_index}/{end_index}"
-            
-            print(f"서울 열린데이터광장 아파트 정보 API 호출 중... (인덱스: {start_index}~{end_index})")
-            response = requests.get(url, timeout=30)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                # API 응답 구조: OpenAptInfo -> row
-                if 'OpenAptInfo' in data:
-                    result = data['OpenAptInfo']
-                    
-                    # 총 데이터 개수 확인
-                    total_count = result.get('list_total_count', 0)
-                    if start_index == 1:
-                        print(f"   전체 데이터: {total_count}건")
-                    
-                    if 'row' in result:
-                        df = pd.DataFrame(result['row'])
-                        print(f"✅ {len(df)}개의 아파트 정보를 수집했습니다.")
-                        return df
-                    else:
-                        print("⚠️ 데이터가 없습니다.")
-                        return pd.DataFrame()
-                else:
-                    print(f"⚠️ API 응답 구조가 예상과 다릅니다: {list(data.keys())}")
-                    return pd.DataFrame()
-            else:
-                print(f"❌ API 호출 실패: {response.status_code}")
-                print(f"   응답: {response.text[:200]}")
-                return pd.DataFrame()
-                
-        except Exception as e:
-            print(f"❌ 서울 열린데이터광장 아파트 정보 크롤링 오류: {type(e).__name__}")
-            print(f"   오류 내용: {str(e)[:200]}")
-            return pd.DataFrame()
+        Returns:
+            Tuple[pd.DataFrame, int]: (데이터프레임, 전체 데이터 건수 list_total_count)
+        """
+        return self._fetch_seoul_page(
+            "OpenAptInfo", start_index, end_index,
+            label="서울 열린데이터광장 아파트 정보", unit="아파트 정보",
+        )
     
-    def crawl_seoul_apartment_info_all(self, max_records: int = 10000) -> pd.DataFrame:
+    def crawl_seoul_apartment_info_all(self, max_records: int = 10000, concurrent: bool = True) -> pd.DataFrame:
         """
         서울 열린데이터광장에서 모든 아파트 정보 데이터 크롤링
         (여러 번 호출하여 전체 데이터 수집)
         
         Args:
             max_records: 최대 수집할 레코드 수
+            concurrent: 페이지 동시 요청 여부
         
         Returns:
             pd.DataFrame: 전체 아파트 정보 데이터프레임
         """
-        all_data = []
-        start_index = 1
-        batch_size = 1000
-        
         print(f"서울 열린데이터광장에서 최대 {max_records}개의 아파트 정보를 수집합니다...")
         
-        while start_index <= max_records:
-            end_index = min(start_index + batch_size - 1, max_records)
-            df_batch = self.crawl_seoul_apartment_info(start_index, end_index)
-            
-            if df_batch.empty:
-                print("더 이상 데이터가 없습니다.")
-                break
-            
-            all_data.append(df_batch)
-            start_index = end_index + 1
-            
-            # API 호출 제한을 위한 지연
-            time.sleep(CRAWL_DELAY)
-            
-            if len(df_batch) < batch_size:
-                print("마지막 배치를 수집했습니다.")
-                break
+        all_data = self._crawl_all_pages(self._fetch_seoul_apartment_info_page, max_records, concurrent)
         
         if all_data:
             result_df = pd.concat(all_data, ignore_index=True)
@@ -447,223 +763,251 @@ class SeoulApartmentCrawler:
         if df.empty:
             return df
         
-        processed_data = []
+        def column(name, default=None):
+            return _raw_column(df, name, default)
+        
+        def text(name):
+            return _optional_text_column(df, name)
+        
+        def number(name):
+            return _numeric_column(df, name)
+        
+        def integer(name):
+            return _integer_column(df, name)
+        
+        # USE_APRV_YMD: k-사용검사일-사용승인일 (준공일자, 예: "2003-12-26 00:00:00.0")
+        completion_date = column('USE_APRV_YMD')
+        date_str = completion_date.astype(str)
+        build_year = pd.to_numeric(date_str.str[:4], errors='coerce').where(
+            completion_date.notna() & completion_date.astype(bool) & (date_str.str.len() >= 4)
+        )
+        build_year = build_year.where(build_year % 1 == 0)
+        
+        # TNOHSH: k-전체세대수
+        households = integer('TNOHSH')
+        
+        # ROAD_TYPE: k-복도유형 (복도식, 계단식, 혼합식, 그 외 원본 값 유지, 결측은 None)
+        # 행 단위 구현은 결측(NaN)을 문자열 'nan'으로 저장했으나 필터 옵션에 'nan'이 생기므로 None으로 둠
+        road_type = _text_column(df, 'ROAD_TYPE').astype(str)
+        hallway_type = pd.Series(
+            np.select(
+                [road_type.str.contains('복도'), road_type.str.contains('계단'), road_type.str.contains('혼합')],
+                ["복도식", "계단식", "혼합식"],
+                default=road_type,
+            ),
+            dtype=object,
+        ).where(road_type != '', None)
+        
+        # RSDT_XUAR: k-주거전용면적 (제곱미터)
+        area_sqm = number('RSDT_XUAR')
+        pyeong = calculate_pyeong_series(area_sqm.where(area_sqm != 0))
+        
+        # 세대당 평균 전용면적 계산 (전체 단지 전용면적 / 세대수)
+        has_households = households > 0
+        avg_area_per_household = round_series(area_sqm / households, 2).where((area_sqm != 0) & has_households)
+        avg_pyeong_per_household = calculate_pyeong_series(
+            avg_area_per_household.where(avg_area_per_household != 0)
+        )
+        
+        # PRK_CNTOM: 주차대수, 세대당 주차 면 갯수 계산
+        parking_count = integer('PRK_CNTOM')
+        parking_per_household = round_series(parking_count / households, 2).where((parking_count != 0) & has_households)
+        
+        # YCRD: 좌표Y (위도), XCRD: 좌표X (경도) - 지하철역 거리/접근성 지표 일괄 계산
+        lat = column('YCRD')
+        lon = column('XCRD')
+        subway_df = calculate_distance_to_subway_batch(lat.to_numpy(), lon.to_numpy())
+        access_df = calculate_subway_accessibility_batch(lat.to_numpy(), lon.to_numpy())
+        
+        # 원본 데이터를 모두 보존하면서 필요한 파생변수만 추가
+        columns = {
+            # === 파생/변환된 컬럼 (앱에서 사용하기 편한 형식) ===
+            "자치구": text('SGG_ADDR'),  # SGG_ADDR: 주소(시군구)
+            "주소": text('APT_RDN_ADDR'),  # APT_RDN_ADDR: kapt도로명주소
+            "아파트명": text('APT_NM'),  # APT_NM: k-아파트명
+            "건축연도": build_year,
+            "세대수": households,
+            "복도계단식": hallway_type,
+            
+            # 면적 정보 (원본 + 파생)
+            "전용면적_제곱미터": area_sqm,  # 전체 단지 전용면적 합계 (원본)
+            "평형": pyeong,  # 전체 단지 평형 합계 (파생)
+            "세대당평균전용면적_제곱미터": avg_area_per_household,  # 세대당 평균 전용면적 (파생)
+            "세대당평균평형": avg_pyeong_per_household,  # 세대당 평균 평형 (파생)
+            
+            # 전용면적별 세대현황
+            "전용면적60㎡이하_세대수": number('XUAR_HH_STTS60'),
+            "전용면적60_85㎡_세대수": number('XUAR_HH_STTS85'),
+            "전용면적85_135㎡_세대수": number('XUAR_HH_STTS135'),
+            
+            # 주차 정보
+            "주차대수": parking_count,  # 주차 대수 (원본)
+            "세대당주차면수": parking_per_household,  # 세대당 주차 면 갯수 (파생)
+            
+            # 위치 정보
+            "위도": lat,
+            "경도": lon,
+            "가장가까운지하철역": subway_df["가장가까운지하철역"],
+            "지하철역거리_km": subway_df["지하철역거리_km"],
+            # 지하철 접근성 지표 (반경 내 역 수, 2·3번째 역 거리, 거점역 거리)
+            **{col: access_df[col] for col in access_df.columns},
+            # 지도 격자 집계용 지오해시 (앞 글자가 상위 격자)
+            "지오해시": pd.Series(
+                geohash_strings(pd.to_numeric(lat, errors='coerce'), pd.to_numeric(lon, errors='coerce')),
+                index=lat.index,
+                dtype=object,
+            ),
+            
+            # 추가 정보
+            "건설사": text('BLDR'),  # BLDR: k-건설사(시공사)
+            "시행사": text('DVLR'),  # DVLR: k-시행사
+            "난방방식": text('MN_MTHD'),  # MN_MTHD: k-난방방식
+            "홈페이지": text('HMPG'),  # HMPG: k-홈페이지
+        }
+        
+        # 결측이 없는 정수 컬럼은 int로 (행 단위 int() 변환 결과와 동일한 dtype)
+        for col in ["건축연도", "세대수", "주차대수"]:
+            if columns[col].notna().all():
+                columns[col] = columns[col].astype('int64')
+        
+        # === 원본 API 응답 컬럼 모두 보존 ===
+        for raw_name, default in APT_INFO_RAW_COLUMNS.items():
+            columns[f"원본_{raw_name}"] = column(raw_name, default)
+        
+        return pd.DataFrame(columns)
+    
+    def sync_seoul_apartment_info(
+        self,
+        stored_df: pd.DataFrame,
+        state_file: str = SYNC_STATE_FILE,
+        max_records: int = 50000,
+    ) -> Tuple[pd.DataFrame, Dict]:
+        """
+        아파트 정보 증분 동기화
+        저장된 데이터(process_seoul_apartment_info_data 결과)와 비교해 수정일자(MDFCN_YMD)가
+        워터마크 이후이거나 새로 생긴 단지(APT_CD)만 변환한 뒤 APT_CD 기준으로 upsert합니다.
+        사용여부(USE_YN)가 'N'이거나 전체 목록에서 사라진 단지는 삭제합니다.
         
-        for _, row in df.iterrows():
-            # 명세서에 따른 필드 매핑
-            # APT_NM: k-아파트명
-            apt_name = row.get('APT_NM', '') or ''
-            
-            # APT_RDN_ADDR: kapt도로명주소
-            address = row.get('APT_RDN_ADDR', '') or ''
-            
-            # SGG_ADDR: 주소(시군구) - 자치구
-            district = row.get('SGG_ADDR', '') or ''
-            
-            # USE_APRV_YMD: k-사용검사일-사용승인일 (준공일자)
-            completion_date = row.get('USE_APRV_YMD', None)
-            build_year = None
-            if completion_date and pd.notna(completion_date):
-                try:
-                    # 날짜 형식: "2003-12-26 00:00:00.0"
-                    date_str = str(completion_date)
-                    if len(date_str) >= 4:
-                        build_year = int(date_str[:4])
-                except:
-                    pass
-            
-            # TNOHSH: k-전체세대수
-            households = row.get('TNOHSH', None)
-            try:
-                households = int(households) if pd.notna(households) else None
-            except:
-                households = None
-            
-            # ROAD_TYPE: k-복도유형 (복도식, 계단식, 혼합식)
-            road_type = row.get('ROAD_TYPE', '') or ''
-            hallway_type = None
-            if road_type:
-                if '복도' in str(road_type):
-                    hallway_type = "복도식"
-                elif '계단' in str(road_type):
-                    hallway_type = "계단식"
-                elif '혼합' in str(road_type):
-                    hallway_type = "혼합식"
-                else:
-                    hallway_type = str(road_type)  # 원본 값 유지
-            
-            # RSDT_XUAR: k-주거전용면적 (제곱미터)
-            area_sqm = row.get('RSDT_XUAR', None)
-            try:
-                area_sqm = float(area_sqm) if pd.notna(area_sqm) else None
-            except:
-                area_sqm = None
-            
-            pyeong = calculate_pyeong(area_sqm) if area_sqm else None
-            
-            # YCRD: 좌표Y (위도), XCRD: 좌표X (경도)
-            lat = row.get('YCRD', None)  # 위도
-            lon = row.get('XCRD', None)  # 경도
-            
-            # 지하철역 거리 계산
-            nearest_station = None
-            distance_km = None
-            if lat and lon and pd.notna(lat) and pd.notna(lon):
-                try:
-                    nearest_station, distance_km = calculate_distance_to_subway(float(lat), float(lon))
-                except:
-                    pass
-            
-            # BLDR: k-건설사(시공사)
-            builder = row.get('BLDR', '') or ''
-            
-            # DVLR: k-시행사
-            developer = row.get('DVLR', '') or ''
-            
-            # MN_MTHD: k-난방방식
-            heating_method = row.get('MN_MTHD', '') or ''
-            
-            # HMPG: k-홈페이지
-            homepage = row.get('HMPG', '') or ''
-            
-            # 세대당 평균 전용면적 계산 (전체 단지 전용면적 / 세대수)
-            avg_area_per_household = None
-            avg_pyeong_per_household = None
-            if area_sqm and households and households > 0:
-                try:
-                    avg_area_per_household = round(area_sqm / households, 2)
-                    avg_pyeong_per_household = calculate_pyeong(avg_area_per_household)
-                except:
-                    pass
-            
-            # PRK_CNTOM: 주차대수
-            parking_count = row.get('PRK_CNTOM', None)
-            try:
-                parking_count = int(parking_count) if pd.notna(parking_count) else None
-            except:
-                parking_count = None
-            
-            # 세대당 주차 면 갯수 계산
-            parking_per_household = None
-            if parking_count and households and households > 0:
-                try:
-                    parking_per_household = round(parking_count / households, 2)
-                except:
-                    pass
-            
-            # 전용면적별 세대현황 정보
-            # XUAR_HH_STTS60: k-전용면적별세대현황(60㎡이하)
-            hh_60sqm = row.get('XUAR_HH_STTS60', None)
-            try:
-                hh_60sqm = float(hh_60sqm) if pd.notna(hh_60sqm) else None
-            except:
-                hh_60sqm = None
-            
-            # XUAR_HH_STTS85: k-전용면적별세대현황(60m²~85m²이하)
-            hh_85sqm = row.get('XUAR_HH_STTS85', None)
-            try:
-                hh_85sqm = float(hh_85sqm) if pd.notna(hh_85sqm) else None
-            except:
-                hh_85sqm = None
-            
-            # XUAR_HH_STTS135: k-85m²~135m²이하
-            hh_135sqm = row.get('XUAR_HH_STTS135', None)
-            try:
-                hh_135sqm = float(hh_135sqm) if pd.notna(hh_135sqm) else None
-            except:
-                hh_135sqm = None
-            
-            # 원본 데이터를 모두 보존하면서 필요한 파생변수만 추가
-            apartment = {
-                # === 파생/변환된 컬럼 (앱에서 사용하기 편한 형식) ===
-                "자치구": district,
-                "주소": address,
-                "아파트명": apt_name,
-                "건축연도": build_year,
-                "세대수": households,
-                "복도계단식": hallway_type,
-                
-                # 면적 정보 (원본 + 파생)
-                "전용면적_제곱미터": area_sqm,  # 전체 단지 전용면적 합계 (원본)
-                "평형": pyeong,  # 전체 단지 평형 합계 (파생)
-                "세대당평균전용면적_제곱미터": avg_area_per_household,  # 세대당 평균 전용면적 (파생)
-                "세대당평균평형": avg_pyeong_per_household,  # 세대당 평균 평형 (파생)
-                
-                # 전용면적별 세대현황
-                "전용면적60㎡이하_세대수": hh_60sqm,
-                "전용면적60_85㎡_세대수": hh_85sqm,
-                "전용면적85_135㎡_세대수": hh_135sqm,
-                
-                # 주차 정보
-                "주차대수": parking_count,  # 주차 대수 (원본)
-                "세대당주차면수": parking_per_household,  # 세대당 주차 면 갯수 (파생)
-                
-                # 위치 정보
-                "위도": lat,
-                "경도": lon,
-                "가장가까운지하철역": nearest_station,
-                "지하철역거리_km": distance_km,
-                
-                # 추가 정보
-                "건설사": builder,
-                "시행사": developer,
-                "난방방식": heating_method,
-                "홈페이지": homepage,
-                
-                # === 원본 API 응답 컬럼 모두 보존 ===
-                "원본_SN": row.get('SN', None),
-                "원본_APT_CD": row.get('APT_CD', ''),
-                "원본_APT_NM": row.get('APT_NM', ''),
-                "원본_CMPX_CLSF": row.get('CMPX_CLSF', ''),  # 단지분류
-                "원본_APT_STDG_ADDR": row.get('APT_STDG_ADDR', ''),  # 지번주소
-                "원본_APT_RDN_ADDR": row.get('APT_RDN_ADDR', ''),  # 도로명주소
-                "원본_CTPV_ADDR": row.get('CTPV_ADDR', ''),  # 시도주소
-                "원본_SGG_ADDR": row.get('SGG_ADDR', ''),  # 시군구주소
-                "원본_EMD_ADDR": row.get('EMD_ADDR', ''),  # 읍면동주소
-                "원본_DADDR": row.get('DADDR', ''),  # 상세주소
-                "원본_RDN_ADDR": row.get('RDN_ADDR', ''),  # 도로명
-                "원본_ROAD_DADDR": row.get('ROAD_DADDR', ''),  # 도로명상세주소
-                "원본_TELNO": row.get('TELNO', ''),
-                "원본_FXNO": row.get('FXNO', ''),  # 팩스번호
-                "원본_APT_CMPX": row.get('APT_CMPX', ''),  # 아파트단지
-                "원본_APT_ATCH_FILE": row.get('APT_ATCH_FILE', ''),  # 첨부파일
-                "원본_HH_TYPE": row.get('HH_TYPE', ''),  # 세대유형
-                "원본_MNG_MTHD": row.get('MNG_MTHD', ''),  # 관리방법
-                "원본_ROAD_TYPE": row.get('ROAD_TYPE', ''),  # 복도유형
-                "원본_MN_MTHD": row.get('MN_MTHD', ''),  # 난방방식
-                "원본_WHOL_DONG_CNT": row.get('WHOL_DONG_CNT', None),  # 전체동수
-                "원본_TNOHSH": row.get('TNOHSH', None),  # 전체세대수
-                "원본_BLDR": row.get('BLDR', ''),  # 건설사
-                "원본_DVLR": row.get('DVLR', ''),  # 시행사
-                "원본_USE_APRV_YMD": row.get('USE_APRV_YMD', ''),  # 사용승인일
-                "원본_GFA": row.get('GFA', None),  # 연면적
-                "원본_RSDT_XUAR": row.get('RSDT_XUAR', None),  # 주거전용면적
-                "원본_MNCO_LEVY_AREA": row.get('MNCO_LEVY_AREA', None),  # 관리비부과면적
-                "원본_XUAR_HH_STTS60": row.get('XUAR_HH_STTS60', None),  # 전용면적별세대현황(60㎡이하)
-                "원본_XUAR_HH_STTS85": row.get('XUAR_HH_STTS85', None),  # 전용면적별세대현황(60㎡~85㎡이하)
-                "원본_XUAR_HH_STTS135": row.get('XUAR_HH_STTS135', None),  # 85㎡~135㎡이하
-                "원본_XUAR_HH_STTS136": row.get('XUAR_HH_STTS136', None),  # 135㎡초과
-                "원본_HMPG": row.get('HMPG', ''),  # 홈페이지
-                "원본_REG_YMD": row.get('REG_YMD', ''),  # 등록일자
-                "원본_MDFCN_YMD": row.get('MDFCN_YMD', ''),  # 수정일자
-                "원본_EPIS_MNG_NO": row.get('EPIS_MNG_NO', ''),  # 에피소드관리번호
-                "원본_EPS_MNG_FORM": row.get('EPS_MNG_FORM', ''),  # 에피소드관리형태
-                "원본_HH_ELCT_CTRT_MTHD": row.get('HH_ELCT_CTRT_MTHD', ''),  # 세대전기계약방법
-                "원본_CLNG_MNG_FORM": row.get('CLNG_MNG_FORM', ''),  # 냉방관리형태
-                "원본_BDAR": row.get('BDAR', None),  # 건물면적
-                "원본_PRK_CNTOM": row.get('PRK_CNTOM', None),  # 주차대수
-                "원본_SE_CD": row.get('SE_CD', ''),  # 시설코드
-                "원본_CMPX_APRV_DAY": row.get('CMPX_APRV_DAY', ''),  # 단지승인일
-                "원본_USE_YN": row.get('USE_YN', ''),  # 사용여부
-                "원본_MNCO_ULD_YN": row.get('MNCO_ULD_YN', ''),  # 관리사무소유무
-                "원본_XCRD": row.get('XCRD', ''),  # 경도
-                "원본_YCRD": row.get('YCRD', ''),  # 위도
-                "원본_CMPX_APLD_DAY": row.get('CMPX_APLD_DAY', ''),  # 단지적용일
+        ⚠️ Open API는 수정일자 조건 조회를 지원하지 않으므로 목록 페이지는 모두 조회하지만
+        (2,800건 기준 3회 요청), 변환/지하철역 거리 계산은 변경된 단지만 수행합니다.
+        
+        Args:
+            stored_df: 저장된 변환 데이터 (원본_APT_CD, 원본_MDFCN_YMD 컬럼 필요)
+            state_file: 워터마크 저장 파일
+            max_records: 최대 수집할 레코드 수
+        
+        Returns:
+            Tuple[pd.DataFrame, Dict]: (동기화된 데이터, 동기화 결과 요약)
+                결과 요약은 save_sync_state()로 저장하면 다음 동기화의 워터마크가 됩니다.
+        """
+        # 변경 여부는 최신 목록과 비교해야 하므로 응답 캐시를 읽지 않음
+        revalidate_cache, self.revalidate_cache = self.revalidate_cache, True
+        try:
+            raw_df = self.crawl_seoul_apartment_info_all(max_records=max_records)
+        finally:
+            self.revalidate_cache = revalidate_cache
+        if raw_df.empty:
+            return stored_df, {}
+        
+        raw_keys = _text_column(raw_df, 'APT_CD').astype(str)
+        raw_modified = pd.to_datetime(_raw_column(raw_df, 'MDFCN_YMD'), errors='coerce', format='mixed')
+        raw_in_use = _text_column(raw_df, 'USE_YN').astype(str).str.upper() != 'N'
+        new_watermark = raw_modified.max()
+        
+        incremental = (
+            stored_df is not None
+            and not stored_df.empty
+            and '원본_APT_CD' in stored_df.columns
+        )
+        if not incremental:
+            print("ℹ️ 저장된 데이터가 없어 전체 데이터를 변환합니다.")
+            processed_df = self.process_seoul_apartment_info_data(raw_df[raw_in_use.to_numpy()])
+            summary = {
+                "mode": "full",
+                "new": len(processed_df),
+                "updated": 0,
+                "deleted": 0,
+                "unchanged": 0,
+                "watermark": None if pd.isna(new_watermark) else str(new_watermark),
             }
-            
-            processed_data.append(apartment)
+            return processed_df, summary
+        
+        stored_keys = stored_df['원본_APT_CD'].fillna('').astype(str)
+        
+        # 워터마크: 저장된 상태 파일과 저장된 데이터의 최대 수정일자 중 더 이른 값
+        watermark = pd.NaT
+        if '원본_MDFCN_YMD' in stored_df.columns:
+            watermark = pd.to_datetime(stored_df['원본_MDFCN_YMD'], errors='coerce', format='mixed').max()
+        state = self.load_sync_state(state_file)
+        if state.get("watermark"):
+            state_watermark = pd.to_datetime(state["watermark"], errors='coerce')
+            if pd.notna(state_watermark) and (pd.isna(watermark) or state_watermark < watermark):
+                watermark = state_watermark
+        
+        is_new = ~raw_keys.isin(set(stored_keys))
+        if pd.isna(watermark):
+            is_modified = pd.Series(True, index=raw_keys.index)
+        else:
+            is_modified = raw_modified > watermark
+        changed = (is_new | is_modified) & raw_in_use
+        
+        # 삭제: 사용여부 'N' + (전체 목록을 모두 받은 경우) 목록에서 사라진 단지
+        deleted_keys = set(raw_keys[~raw_in_use])
+        if self.last_total_count and len(raw_df) >= self.last_total_count:
+            deleted_keys |= set(stored_keys) - set(raw_keys)
+        deleted_keys &= set(stored_keys)
+        
+        changed_keys = set(raw_keys[changed])
+        processed_changes = self.process_seoul_apartment_info_data(raw_df[changed.to_numpy()])
+        
+        keep = ~stored_keys.isin(changed_keys | deleted_keys)
+        merged_df = pd.concat([stored_df[keep.to_numpy()], processed_changes], ignore_index=True)
+        merged_df = merged_df[list(stored_df.columns) + [c for c in merged_df.columns if c not in stored_df.columns]]
+        # 이전 버전으로 저장된 단지는 접근성 지표가 없으므로 빈 행만 일괄 계산
+        merged_df = add_subway_accessibility(merged_df)
+        
+        summary = {
+            "mode": "incremental",
+            "new": int((changed & is_new).sum()),
+            "updated": int((changed & ~is_new).sum()),
+            "deleted": len(deleted_keys),
+            "unchanged": int(keep.sum()),
+            "watermark": None if pd.isna(new_watermark) else str(new_watermark),
+        }
+        print(
+            f"✅ 증분 동기화: 신규 {summary['new']}건, 수정 {summary['updated']}건, "
+            f"삭제 {summary['deleted']}건, 유지 {summary['unchanged']}건"
+        )
+        return merged_df, summary
+    
+    def load_sync_state(self, state_file: str = SYNC_STATE_FILE) -> Dict:
+        """
+        증분 동기화 상태(워터마크) 로드
+        
+        Args:
+            state_file: 상태 파일 경로
         
-        return pd.DataFrame(processed_data)
+        Returns:
+            Dict: 상태 (파일이 없으면 빈 dict)
+        """
+        try:
+            with open(state_file, encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+    
+    def save_sync_state(self, summary: Dict, state_file: str = SYNC_STATE_FILE):
+        """
+        증분 동기화 상태(워터마크) 저장
+        동기화된 데이터를 저장한 뒤에 호출하세요.
+        
+        Args:
+            summary: sync_seoul_apartment_info()가 반환한 결과 요약
+            state_file: 상태 파일 경로
+        """
+        state = dict(summary, synced_at=time.strftime("%Y-%m-%d %H:%M:%S"))
+        with open(state_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
     
     def download_seoul_apartment_csv_selenium(self) -> str:
         """
@@ -794,7 +1138,6 @@ class SeoulApartmentCrawler:
             str: 다운로드된 파일 경로 또는 None
         """
         import os
-        import requests
         from bs4 import BeautifulSoup
         
         print("=" * 60)
@@ -807,7 +1150,7 @@ class SeoulApartmentCrawler:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self._http_get(url, headers=headers, timeout=30)
             
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
@@ -942,8 +1285,7 @@ class SeoulApartmentCrawler:
             print(f"✅ 변환 완료! {len(processed_df)}건의 데이터가 처리되었습니다.")
             
             # 저장
-            output_file = "seoul_apartments_metadata.csv"
-            self.save_to_csv(processed_df, output_file)
+            output_file = self.save_dataset(processed_df, dataset_path(METADATA_FILE))
             
             print(f"\n💾 최종 데이터 저장: {output_file}")
             print(f"   총 {len(processed_df)}건의 아파트 메타데이터")
@@ -989,6 +1331,8 @@ class SeoulApartmentCrawler:
         hallway_types = ["복도식", "계단식", "혼합식"]
         
         sample_data = []
+        sample_lats = []
+        sample_lons = []
         
         for i in range(num_samples):
             district = random.choice(districts)
@@ -999,14 +1343,13 @@ class SeoulApartmentCrawler:
             # 서울시 내 랜덤 좌표 생성
             lat = random.uniform(37.4, 37.7)
             lon = random.uniform(126.8, 127.2)
+            sample_lats.append(lat)
+            sample_lons.append(lon)
             
             # 평형 계산 (전용면적 기준)
             area_sqm = random.uniform(50, 150)
             pyeong = calculate_pyeong(area_sqm)
             
-            # 지하철역 거리 계산
-            nearest_station, distance_km = calculate_distance_to_subway(lat, lon)
-            
             apartment = {
                 "자치구": district,
                 "주소": f"서울특별시 {district} {random.choice(['로', '길'])} {random.randint(1, 999)}",
@@ -1017,17 +1360,60 @@ class SeoulApartmentCrawler:
                 "평형": pyeong,
                 "위도": round(lat, 6),
                 "경도": round(lon, 6),
-                "가장가까운지하철역": nearest_station,
-                "지하철역거리_km": distance_km
             }
             
             sample_data.append(apartment)
         
-        return pd.DataFrame(sample_data)
+        sample_df = pd.DataFrame(sample_data)
+        if sample_df.empty:
+            return sample_df
+        
+        # 지하철역 거리 일괄 계산 (반올림 전 좌표 기준)
+        subway_df = calculate_distance_to_subway_batch(sample_lats, sample_lons)
+        sample_df["가장가까운지하철역"] = subway_df["가장가까운지하철역"].to_numpy()
+        sample_df["지하철역거리_km"] = subway_df["지하철역거리_km"].to_numpy()
+        access_df = calculate_subway_accessibility_batch(sample_lats, sample_lons)
+        for col in access_df.columns:
+            sample_df[col] = access_df[col].array
+        return sample_df
+    
+    def save_dataset(self, df: pd.DataFrame, filename: str = METADATA_FILE) -> str:
+        """
+        처리된 데이터를 컬럼 타입 그대로 저장 (기본 Parquet, pyarrow가 없으면 CSV)
+        
+        Args:
+            df: 저장할 데이터프레임
+            filename: 파일명 (확장자로 형식 결정: .parquet / .feather / .csv)
+        
+        Returns:
+            str: 실제 저장된 파일 경로
+        """
+        path = save_dataset(df, filename)
+        print(f"데이터가 {path}에 저장되었습니다. (총 {len(df)}개)")
+        return path
+    
+    def load_dataset(self, filename: str = METADATA_FILE, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        저장된 데이터 로드 (Parquet/Feather가 없으면 같은 이름의 CSV)
+        
+        Args:
+            filename: 파일명
+            columns: 읽을 컬럼 목록 (None이면 전체)
+        
+        Returns:
+            pd.DataFrame: 로드된 데이터프레임
+        """
+        path = find_dataset(filename)
+        if path is None:
+            print(f"{filename} 파일을 찾을 수 없습니다.")
+            return pd.DataFrame()
+        df = load_dataset(path, columns=columns)
+        print(f"{path}에서 {len(df)}개의 데이터를 로드했습니다.")
+        return df
     
     def save_to_csv(self, df: pd.DataFrame, filename: str = "seoul_apartments.csv"):
         """
-        데이터를 CSV 파일로 저장
+        데이터를 CSV 파일로 저장 (내보내기용)
         
         Args:
             df: 저장할 데이터프레임
@@ -1117,8 +1503,8 @@ if __name__ == "__main__":
         # 데이터 변환
         processed_df = crawler.process_seoul_apartment_info_data(apartment_info_df)
         
-        # CSV로 저장
-        crawler.save_to_csv(processed_df, "seoul_apartments_metadata.csv")
+        # 저장 (Parquet)
+        crawler.save_dataset(processed_df, dataset_path(METADATA_FILE))
         
         print("\n✅ 아파트 메타데이터 수집 완료!")
         print(f"   총 {len(processed_df)}개의 아파트 정보가 저장되었습니다.")
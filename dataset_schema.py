@@ -0,0 +1,88 @@
+"""
+앱 데이터셋 메모리 최적화
+로드한 데이터프레임에 컬럼 타입 스키마를 적용합니다. (범주형 문자열, nullable 정수, float32)
+원본 API 필드(원본_*)는 앱 메모리에서 빼고 필요할 때 저장 파일에서 읽습니다.
+"""
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import CATEGORY_MAX_UNIQUE_RATIO, DATASET_DTYPES, PASSTHROUGH_PREFIX
+
+_INT_RANGES = {
+    "Int16": (np.iinfo(np.int16).min, np.iinfo(np.int16).max),
+    "Int32": (np.iinfo(np.int32).min, np.iinfo(np.int32).max),
+}
+
+
+def memory_usage_mb(df: pd.DataFrame) -> float:
+    """데이터프레임 메모리 사용량 (MB, 문자열 포함)"""
+    return df.memory_usage(deep=True).sum() / (1024 * 1024)
+
+
+def _is_text(series: pd.Series) -> bool:
+    return pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)
+
+
+def _to_int(series: pd.Series, dtype: str) -> pd.Series:
+    """정수 타입 변환 (정수가 아닌 값이나 범위를 벗어난 값이 있으면 원래 컬럼 반환)"""
+    values = pd.to_numeric(series, errors="coerce")
+    if values.notna().sum() != series.notna().sum():
+        return series
+    valid = values.dropna()
+    low, high = _INT_RANGES[dtype]
+    if len(valid) and ((valid % 1 != 0).any() or valid.min() < low or valid.max() > high):
+        return series
+    return values.astype(dtype)
+
+
+def apply_schema(df: pd.DataFrame, dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    컬럼 타입 스키마 적용 (없는 컬럼은 무시)
+    - "category": 범주형 (그 외 문자열 컬럼도 고유값 비율이 낮으면 범주형)
+    - "Int16"/"Int32": nullable 정수 (결측 허용)
+    - "float32": 좌표/거리
+
+    Args:
+        df: 앱 데이터프레임
+        dtypes: {컬럼: 타입} (None이면 config.DATASET_DTYPES)
+
+    Returns:
+        pd.DataFrame: 타입이 적용된 새 데이터프레임
+    """
+    dtypes = DATASET_DTYPES if dtypes is None else dtypes
+    df = df.copy()
+    for col in df.columns:
+        dtype = dtypes.get(col)
+        series = df[col]
+        if dtype is None:
+            if _is_text(series) and len(series) and series.nunique() <= CATEGORY_MAX_UNIQUE_RATIO * len(series):
+                dtype = "category"
+            else:
+                continue
+        if dtype == "category":
+            # 문자열/숫자가 섞인 컬럼은 범주 정렬이 안 되므로 그대로 둠
+            if _is_text(series) and pd.api.types.infer_dtype(series, skipna=True) == "string":
+                df[col] = series.astype("category")
+        elif dtype in _INT_RANGES:
+            df[col] = _to_int(series, dtype)
+        elif dtype == "float32":
+            df[col] = pd.to_numeric(series, errors="coerce").astype(np.float32)
+    return df
+
+
+def drop_passthrough_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """원본 API 필드(원본_*) 제외 (저장 파일에는 남아 있으므로 load_dataset(columns=...)로 읽을 수 있음)"""
+    passthrough = [col for col in df.columns if str(col).startswith(PASSTHROUGH_PREFIX)]
+    return df.drop(columns=passthrough) if passthrough else df
+
+
+def as_float64(series: pd.Series) -> pd.Series:
+    """
+    float32 컬럼을 표시값 그대로 float64로 변환 (0.67f → 0.67, 0.6700000166893005가 되지 않도록)
+    그 외 타입은 숫자로만 변환합니다.
+    """
+    if series.dtype == np.float32:
+        return series.astype(str).astype(float)
+    return pd.to_numeric(series, errors="coerce")
@@ -0,0 +1,150 @@
+"""
+통계 탭 집계
+자치구별 통계 표와 분포 차트 데이터를 groupby 한 번으로 계산하고,
+처리된 데이터 파일 옆에 CSV로 저장해 다시 계산하지 않도록 합니다.
+"""
+import io
+import os
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+DISTRICT_STATS_SUFFIX = ".district_stats.csv"
+
+
+def _format_column(means: pd.Series, template: str, truncate: bool = False) -> pd.Series:
+    """평균값 서식 적용 (결측은 "N/A")"""
+    if truncate:
+        return means.map(lambda value: template.format(int(value)) if pd.notna(value) else "N/A")
+    return means.map(lambda value: template.format(value) if pd.notna(value) else "N/A")
+
+
+def compute_district_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    자치구별 통계 표 계산 (아파트 수, 평균 건축연도/세대수/평형/주차/지하철 거리)
+
+    Args:
+        df: 앱 데이터프레임
+
+    Returns:
+        pd.DataFrame: 자치구별 통계 (자치구 가나다순, 값은 표시용 문자열)
+    """
+    if "자치구" not in df.columns or df["자치구"].dropna().empty:
+        return pd.DataFrame()
+
+    # (결과 컬럼, 원본 컬럼, 서식, 정수 절사 여부)
+    columns = [
+        ("평균 건축연도", "건축연도", "{}년", True),
+        ("평균 세대수", "세대수", "{}세대", True),
+    ]
+    if "세대당평균평형" in df.columns:
+        columns.append(("평균 평형 (세대당)", "세대당평균평형", "{:.1f}평", False))
+    elif "평형" in df.columns:
+        columns.append(("평균 평형", "평형", "{:.1f}평", False))
+    if "주차대수" in df.columns:
+        columns.append(("평균 주차대수", "주차대수", "{}대", True))
+    if "세대당주차면수" in df.columns:
+        columns.append(("평균 세대당 주차면수", "세대당주차면수", "{:.2f}면", False))
+    columns.append(("평균 지하철 거리", "지하철역거리_km", "{:.2f}km", False))
+
+    source_columns = [source for _, source, _, _ in columns if source in df.columns]
+    numeric = df[source_columns].apply(pd.to_numeric, errors="coerce")
+    numeric["자치구"] = df["자치구"]
+    grouped = numeric.groupby("자치구", sort=True)
+    means = grouped.mean()
+
+    stats = {"자치구": means.index.tolist(), "아파트 수": grouped.size().tolist()}
+    for name, source, template, truncate in columns:
+        values = means[source] if source in means.columns else pd.Series(np.nan, index=means.index)
+        stats[name] = _format_column(values, template, truncate).tolist()
+    return pd.DataFrame(stats)
+
+
+def compute_distribution_charts(df: pd.DataFrame) -> Dict[str, pd.Series]:
+    """
+    통계 탭 차트 데이터 계산 (자치구별 수, 건축연도/복도계단식/세대당 평형 분포)
+
+    Args:
+        df: 앱 데이터프레임
+
+    Returns:
+        Dict[str, pd.Series]: 차트 이름별 집계 (데이터가 없으면 키 없음)
+    """
+    charts = {}
+    if "자치구" in df.columns:
+        charts["자치구"] = df["자치구"].value_counts()
+    if "건축연도" in df.columns:
+        year_data = df["건축연도"].dropna()
+        if len(year_data) > 0:
+            charts["건축연도"] = year_data.value_counts().sort_index()
+    if "복도계단식" in df.columns:
+        hallway_data = df["복도계단식"].dropna()
+        if len(hallway_data) > 0:
+            charts["복도계단식"] = hallway_data.value_counts()
+    if "세대당평균평형" in df.columns:
+        pyeong_data = df["세대당평균평형"].dropna()
+        if len(pyeong_data) > 0:
+            charts["세대당평균평형"] = pd.cut(
+                pyeong_data,
+                bins=10,
+                labels=[f"{i*5}-{(i+1)*5}평" for i in range(10)]
+            ).value_counts().sort_index()
+    return charts
+
+
+def stats_to_csv_bytes(stats: pd.DataFrame) -> bytes:
+    """통계 표를 CSV 바이트로 변환 (엑셀 호환 utf-8-sig)"""
+    return stats.to_csv(index=False).encode("utf-8-sig")
+
+
+def district_stats_path(data_path: str) -> str:
+    """처리된 데이터 파일 옆 통계 파일 경로 (예: seoul_apartments_metadata.district_stats.csv)"""
+    return os.path.splitext(data_path)[0] + DISTRICT_STATS_SUFFIX
+
+
+def save_district_stats(stats: pd.DataFrame, data_path: str) -> Optional[str]:
+    """
+    통계 표를 처리된 데이터 파일 옆에 저장
+
+    Args:
+        stats: compute_district_stats() 결과
+        data_path: 처리된 데이터 파일 경로
+
+    Returns:
+        Optional[str]: 저장된 파일 경로 (실패 시 None)
+    """
+    path = district_stats_path(data_path)
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(stats_to_csv_bytes(stats))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️ 자치구별 통계 저장 실패: {e}")
+        return None
+    return path
+
+
+def load_district_stats(data_path: str) -> Optional[Tuple[pd.DataFrame, bytes]]:
+    """
+    저장된 통계 표 로드 (데이터 파일보다 오래됐으면 None)
+
+    Args:
+        data_path: 처리된 데이터 파일 경로
+
+    Returns:
+        Optional[Tuple[pd.DataFrame, bytes]]: (통계 표, CSV 바이트)
+    """
+    path = district_stats_path(data_path)
+    try:
+        if os.path.getmtime(path) < os.path.getmtime(data_path):
+            return None
+        with open(path, "rb") as f:
+            payload = f.read()
+        stats = pd.read_csv(io.BytesIO(payload), encoding="utf-8-sig", dtype=object)
+    except (OSError, ValueError):
+        return None
+    if "아파트 수" in stats.columns:
+        stats["아파트 수"] = stats["아파트 수"].astype(int)
+    return stats, payload
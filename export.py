@@ -0,0 +1,136 @@
+"""
+목록 탭 다운로드 파일 생성
+버튼을 누를 때만 파일을 만들고, 행 묶음 단위로 인코딩해 전체 CSV 문자열을 한 번에 만들지 않습니다.
+같은 필터 결과/형식의 파일은 캐시해 다시 만들지 않습니다.
+"""
+import gzip
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, Union
+
+import numpy as np
+import pandas as pd
+
+from config import EXPORT_CACHE_SIZE, EXPORT_CHUNK_ROWS
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# 형식별 (라벨, 확장자, MIME)
+EXPORT_FORMATS: Dict[str, tuple] = {
+    "csv": ("CSV", "csv", "text/csv"),
+    "csv.gz": ("CSV (gzip 압축)", "csv.gz", "application/gzip"),
+    "parquet": ("Parquet", "parquet", "application/vnd.apache.parquet"),
+}
+
+
+def available_formats() -> list:
+    """사용 가능한 다운로드 형식 목록 (pyarrow가 없으면 Parquet 제외)"""
+    return [fmt for fmt in EXPORT_FORMATS if fmt != "parquet" or PARQUET_AVAILABLE]
+
+
+def iter_csv_chunks(df: pd.DataFrame, chunk_rows: int = EXPORT_CHUNK_ROWS) -> Iterator[bytes]:
+    """
+    데이터프레임을 행 묶음 단위의 CSV 바이트로 인코딩 (엑셀 호환 utf-8-sig)
+
+    Args:
+        df: 내보낼 데이터프레임
+        chunk_rows: 한 번에 인코딩할 행 수
+
+    Yields:
+        bytes: 첫 묶음은 BOM + 헤더, 이후는 데이터 행
+    """
+    yield ("\ufeff" + df.iloc[:0].to_csv(index=False)).encode("utf-8")
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows].to_csv(index=False, header=False).encode("utf-8")
+
+
+def encode_export(df: pd.DataFrame, fmt: str = "csv", chunk_rows: int = EXPORT_CHUNK_ROWS) -> bytes:
+    """
+    다운로드 파일 바이트 생성
+
+    Args:
+        df: 내보낼 데이터프레임
+        fmt: 형식 ("csv", "csv.gz", "parquet")
+        chunk_rows: CSV 인코딩 묶음 행 수
+
+    Returns:
+        bytes: 파일 내용
+    """
+    buffer = io.BytesIO()
+    if fmt == "parquet":
+        from storage import _prepare_for_arrow
+        _prepare_for_arrow(df).to_parquet(buffer, index=False)
+    elif fmt == "csv.gz":
+        with gzip.GzipFile(fileobj=buffer, mode="wb", mtime=0) as gz:
+            for chunk in iter_csv_chunks(df, chunk_rows):
+                gz.write(chunk)
+    elif fmt == "csv":
+        for chunk in iter_csv_chunks(df, chunk_rows):
+            buffer.write(chunk)
+    else:
+        raise ValueError(f"지원하지 않는 다운로드 형식: {fmt}")
+    return buffer.getvalue()
+
+
+def export_cache_key(row_positions: np.ndarray, dataset_key=None) -> str:
+    """
+    다운로드 캐시 키 (데이터셋 + 내보낼 행 위치 해시, 정렬 순서 포함)
+
+    Args:
+        row_positions: 내보낼 행 위치 배열 (파일 행 순서)
+        dataset_key: 데이터셋 식별값 (공유 데이터셋 버전, 세션 데이터 토큰 등)
+
+    Returns:
+        str: 캐시 키
+    """
+    digest = hashlib.sha1(repr(dataset_key).encode("utf-8"))
+    digest.update(np.ascontiguousarray(row_positions, dtype=np.int64).tobytes())
+    return digest.hexdigest()
+
+
+class ExportCache:
+    """필터 결과/형식별 다운로드 파일 캐시 (LRU, 다운로드 요청 스레드에서도 안전)"""
+
+    def __init__(self, max_entries: int = EXPORT_CACHE_SIZE):
+        """
+        Args:
+            max_entries: 최대 보관 개수
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: str, df: Union[pd.DataFrame, Callable[[], pd.DataFrame]], fmt: str = "csv") -> bytes:
+        """
+        캐시된 파일 반환 (없으면 생성 후 보관)
+
+        Args:
+            key: 필터 상태 키 (export_cache_key)
+            df: 내보낼 데이터프레임, 또는 캐시에 없을 때만 호출해 데이터프레임을 만드는 함수 (서식 비용 절약)
+            fmt: 형식
+
+        Returns:
+            bytes: 파일 내용
+        """
+        cache_key = (key, fmt)
+        with self._lock:
+            if cache_key in self._entries:
+                self._entries.move_to_end(cache_key)
+                return self._entries[cache_key]
+        payload = encode_export(df() if callable(df) else df, fmt)
+        with self._lock:
+            self._entries[cache_key] = payload
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return payload
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
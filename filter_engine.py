@@ -0,0 +1,213 @@
+"""
+사이드바 필터 엔진
+데이터셋마다 한 번 인덱스를 만들어 두고, 필터 조합을 행 위치 배열의 교집합으로 계산합니다.
+- 범주형 컬럼: 값별 행 위치 배열
+- 숫자 컬럼: 값 기준 정렬 배열 (searchsorted로 범위 검색)
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from dataset_schema import as_float64
+
+CATEGORICAL_COLUMNS = ("자치구", "동", "복도계단식", "가장가까운지하철역")
+RANGE_COLUMNS = ("건축연도", "세대수", "지하철역거리_km")
+
+
+class FilterEngine:
+    """범주 일치/숫자 범위 필터를 데이터프레임 복사 없이 계산하는 인덱스"""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        categorical_columns: Iterable[str] = CATEGORICAL_COLUMNS,
+        range_columns: Iterable[str] = RANGE_COLUMNS,
+    ):
+        """
+        Args:
+            df: 대상 데이터프레임
+            categorical_columns: 값 일치로 거르는 컬럼
+            range_columns: 범위로 거르는 숫자 컬럼
+        """
+        self.size = len(df)
+        self.all_positions = np.arange(self.size)
+
+        # 범주형: 코드 배열(-1은 결측) + 값별 행 위치 배열
+        self.codes: Dict[str, np.ndarray] = {}
+        self.categories: Dict[str, np.ndarray] = {}
+        self.value_positions: Dict[str, Dict[object, np.ndarray]] = {}
+        for col in categorical_columns:
+            if col not in df.columns:
+                continue
+            codes, uniques = pd.factorize(df[col], use_na_sentinel=True)
+            self.codes[col] = codes
+            self.categories[col] = np.asarray(uniques, dtype=object)
+            order = np.argsort(codes, kind="stable")
+            bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+            self.value_positions[col] = {
+                value: order[bounds[code]:bounds[code + 1]] for code, value in enumerate(self.categories[col])
+            }
+
+        # 숫자형: 결측 제외 후 값 기준 정렬 (정렬된 값, 해당 행 위치)
+        self.values: Dict[str, np.ndarray] = {}
+        self.sorted_values: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for col in range_columns:
+            if col not in df.columns:
+                continue
+            values = as_float64(df[col]).to_numpy(dtype=float, na_value=np.nan)
+            valid = np.flatnonzero(~np.isnan(values))
+            order = valid[np.argsort(values[valid], kind="stable")]
+            self.values[col] = values
+            self.sorted_values[col] = (values[order], order)
+
+    def equals_positions(self, col: str, value) -> np.ndarray:
+        """값이 일치하는 행 위치 (오름차순)"""
+        return self.value_positions[col].get(value, np.empty(0, dtype=np.int64))
+
+    def range_positions(self, col: str, low, high) -> np.ndarray:
+        """low 이상 high 이하(결측 제외)인 행 위치 (오름차순)"""
+        sorted_vals, order = self.sorted_values[col]
+        start = np.searchsorted(sorted_vals, low, side="left")
+        end = np.searchsorted(sorted_vals, high, side="right")
+        return np.sort(order[start:end])
+
+    def positions(
+        self,
+        equals: Optional[Dict[str, object]] = None,
+        ranges: Optional[Dict[str, Tuple[float, float]]] = None,
+        subsets: Optional[Iterable[np.ndarray]] = None,
+    ) -> np.ndarray:
+        """
+        필터 조합에 해당하는 행 위치 계산 (모든 조건의 교집합)
+
+        Args:
+            equals: {컬럼: 값} 일치 조건 (None 값은 조건 없음)
+            ranges: {컬럼: (최소, 최대)} 범위 조건 (결측은 제외)
+            subsets: 미리 계산한 행 위치 배열 조건 (공간 검색 결과 등)
+
+        Returns:
+            np.ndarray: 행 위치 배열 (오름차순)
+        """
+        matches: List[np.ndarray] = [np.asarray(subset, dtype=np.int64) for subset in (subsets or [])]
+        for col, value in (equals or {}).items():
+            if value is not None and col in self.value_positions:
+                matches.append(self.equals_positions(col, value))
+        for col, bounds in (ranges or {}).items():
+            if bounds is not None and col in self.sorted_values:
+                matches.append(self.range_positions(col, bounds[0], bounds[1]))
+        if not matches:
+            return self.all_positions
+
+        # 가장 작은 결과부터 비트맵으로 교집합
+        matches.sort(key=len)
+        result = matches[0]
+        for other in matches[1:]:
+            if len(result) == 0:
+                break
+            bitmap = np.zeros(self.size, dtype=bool)
+            bitmap[other] = True
+            result = result[bitmap[result]]
+        return result
+
+    def unique_values(self, col: str, positions: Optional[np.ndarray] = None) -> list:
+        """
+        행 위치 범위 안의 고유값 (결측 제외, 처음 나온 순서)
+
+        Args:
+            col: 범주형 컬럼
+            positions: 행 위치 배열 (None이면 전체)
+
+        Returns:
+            list: 고유값 목록
+        """
+        if col not in self.codes:
+            return []
+        codes = self.codes[col] if positions is None else self.codes[col][positions]
+        present = pd.unique(codes[codes >= 0])
+        return self.categories[col][present].tolist()
+
+    def value_range(self, col: str, positions: Optional[np.ndarray] = None):
+        """
+        행 위치 범위 안의 (최소, 최대) 값 (결측 제외)
+
+        Args:
+            col: 숫자 컬럼
+            positions: 행 위치 배열 (None이면 전체)
+
+        Returns:
+            Optional[Tuple[float, float]]: (최소, 최대), 값이 없으면 None
+        """
+        if col not in self.values:
+            return None
+        values = self.values[col] if positions is None else self.values[col][positions]
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return None
+        return float(values.min()), float(values.max())
+
+
+def _option_list(values, skip_blank: bool = True) -> List[str]:
+    """위젯 옵션 목록 (결측 제외, 문자열로 가나다순 정렬)"""
+    return sorted(str(x) for x in values if pd.notna(x) and (not skip_blank or str(x).strip()))
+
+
+class FacetTable:
+    """
+    (자치구, 동)별 위젯 옵션/슬라이더 범위 표
+    데이터셋 준비 시 한 번 만들어 두고 위젯 렌더링 때는 딕셔너리 조회만 합니다.
+    """
+
+    ALL = "전체"
+
+    def __init__(self, engine: FilterEngine):
+        """
+        Args:
+            engine: 필터 엔진
+        """
+        self.districts = _option_list(engine.unique_values("자치구"))
+        self.dongs_by_district = {self.ALL: _option_list(engine.unique_values("동"))}
+        self.facets = {(self.ALL, self.ALL): self._facet(engine, engine.all_positions)}
+
+        for district in engine.unique_values("자치구"):
+            if pd.isna(district) or not str(district).strip():
+                continue
+            district_positions = engine.positions({"자치구": district})
+            self.dongs_by_district[str(district)] = _option_list(engine.unique_values("동", district_positions))
+            self.facets[(str(district), self.ALL)] = self._facet(engine, district_positions)
+            for dong in engine.unique_values("동", district_positions):
+                dong_positions = engine.positions({"자치구": district, "동": dong})
+                self.facets[(str(district), str(dong))] = self._facet(engine, dong_positions)
+
+    @staticmethod
+    def _facet(engine: FilterEngine, positions: np.ndarray) -> Dict:
+        return {
+            "복도계단식": _option_list(engine.unique_values("복도계단식", positions), skip_blank=False),
+            "가장가까운지하철역": _option_list(engine.unique_values("가장가까운지하철역", positions)),
+            "건축연도": engine.value_range("건축연도", positions),
+            "세대수": engine.value_range("세대수", positions),
+            "지하철역거리_km": engine.value_range("지하철역거리_km", positions),
+        }
+
+    def dongs(self, district: str) -> List[str]:
+        """자치구의 동 목록 ("전체"면 전체 동)"""
+        return self.dongs_by_district.get(district, [])
+
+    def get(self, district: str, dong: str) -> Dict:
+        """
+        선택된 자치구/동의 옵션과 범위 (자치구가 "전체"면 동 선택은 무시)
+
+        Args:
+            district: 선택된 자치구
+            dong: 선택된 동
+
+        Returns:
+            Dict: 복도계단식/가장가까운지하철역 옵션, 건축연도/세대수/지하철역거리_km (최소, 최대)
+        """
+        if district == self.ALL:
+            return self.facets[(self.ALL, self.ALL)]
+        facet = self.facets.get((district, dong))
+        if facet is None:
+            # 데이터에 없는 자치구/동 조합: 빈 옵션
+            facet = {key: ([] if isinstance(value, list) else None) for key, value in self.facets[(self.ALL, self.ALL)].items()}
+        return facet
@@ -0,0 +1,163 @@
+"""
+위경도 좌표 공간 인덱스
+좌표를 단위 구면 위 3차원 벡터로 바꿔 KD-tree로 최근접 검색합니다.
+(scipy가 없으면 NumPy 전수 비교로 동작)
+"""
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+    USE_SCIPY = True
+except ImportError:
+    USE_SCIPY = False
+
+# 평균 지구 반지름 (km, IUGG)
+EARTH_RADIUS_KM = 6371.0088
+
+
+def to_unit_vectors(lats, lons) -> np.ndarray:
+    """
+    위경도(도)를 단위 구면 위 3차원 좌표로 변환
+
+    Args:
+        lats: 위도 배열
+        lons: 경도 배열
+
+    Returns:
+        np.ndarray: (n, 3) 좌표 배열
+    """
+    lat_rad = np.radians(np.asarray(lats, dtype=float))
+    lon_rad = np.radians(np.asarray(lons, dtype=float))
+    cos_lat = np.cos(lat_rad)
+    return np.column_stack((cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad)))
+
+
+def chord_to_km(chord):
+    """단위 구면 현(chord) 길이를 대원 거리(km)로 변환"""
+    chord = np.clip(np.asarray(chord, dtype=float), 0.0, 2.0)
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(chord / 2.0)
+
+
+def km_to_chord(km):
+    """대원 거리(km)를 단위 구면 현(chord) 길이로 변환"""
+    angle = np.minimum(np.asarray(km, dtype=float) / EARTH_RADIUS_KM, np.pi)
+    return 2.0 * np.sin(angle / 2.0)
+
+
+class GeoIndex:
+    """위경도 좌표 최근접/반경 검색 인덱스"""
+
+    def __init__(self, lats, lons):
+        """
+        Args:
+            lats: 위도 배열
+            lons: 경도 배열
+        """
+        self.lats = np.asarray(lats, dtype=float)
+        self.lons = np.asarray(lons, dtype=float)
+        self._xyz = to_unit_vectors(self.lats, self.lons)
+        self._tree = cKDTree(self._xyz) if USE_SCIPY and len(self._xyz) else None
+        # 사각 영역 검색용 위도 정렬 (처음 사용할 때 생성)
+        self._lat_order = None
+        self._sorted_lats = None
+
+    def __len__(self):
+        return len(self._xyz)
+
+    def query(self, lats, lons, k: int = 1):
+        """
+        k개 최근접 좌표 검색 (대원 거리 기준)
+
+        Args:
+            lats: 검색 위도 (스칼라 또는 배열)
+            lons: 검색 경도 (스칼라 또는 배열)
+            k: 검색할 개수
+
+        Returns:
+            tuple: (거리(km) 배열 (m, k), 인덱스 배열 (m, k)) - 가까운 순
+        """
+        points = to_unit_vectors(np.atleast_1d(lats), np.atleast_1d(lons))
+        k = min(int(k), len(self))
+        if k <= 0:
+            empty = np.empty((len(points), 0))
+            return empty, empty.astype(int)
+
+        if self._tree is not None:
+            chord, idx = self._tree.query(points, k=k)
+            chord = np.asarray(chord).reshape(len(points), k)
+            idx = np.asarray(idx).reshape(len(points), k)
+        else:
+            chord_all = np.linalg.norm(points[:, None, :] - self._xyz[None, :, :], axis=2)
+            idx = np.argsort(chord_all, axis=1, kind="stable")[:, :k]
+            chord = np.take_along_axis(chord_all, idx, axis=1)
+
+        return chord_to_km(chord), idx
+
+    def query_radius(self, lat: float, lon: float, radius_km: float) -> np.ndarray:
+        """
+        반경 내 좌표 검색
+
+        Args:
+            lat: 중심 위도
+            lon: 중심 경도
+            radius_km: 반경 (km)
+
+        Returns:
+            np.ndarray: 반경 내 좌표 인덱스 (오름차순)
+        """
+        point = to_unit_vectors([lat], [lon])[0]
+        chord = float(km_to_chord(radius_km))
+        if self._tree is not None:
+            idx = np.asarray(self._tree.query_ball_point(point, chord), dtype=int)
+        else:
+            idx = np.flatnonzero(np.linalg.norm(self._xyz - point, axis=1) <= chord)
+        return np.sort(idx)
+
+    def count_within(self, lats, lons, radius_km: float, chunk_size: int = 2048) -> np.ndarray:
+        """
+        여러 중심점별 반경 내 좌표 개수
+
+        Args:
+            lats: 중심 위도 배열
+            lons: 중심 경도 배열
+            radius_km: 반경 (km)
+            chunk_size: NumPy 전수 비교 시 한 번에 계산할 중심점 수
+
+        Returns:
+            np.ndarray: 개수 배열 (입력 순서)
+        """
+        points = to_unit_vectors(np.atleast_1d(lats), np.atleast_1d(lons))
+        chord = float(km_to_chord(radius_km))
+        if len(points) == 0 or len(self) == 0:
+            return np.zeros(len(points), dtype=np.int64)
+        if self._tree is not None:
+            return np.asarray(self._tree.query_ball_point(points, chord, return_length=True), dtype=np.int64)
+        counts = np.empty(len(points), dtype=np.int64)
+        for start in range(0, len(points), chunk_size):
+            block = points[start:start + chunk_size]
+            counts[start:start + chunk_size] = (
+                np.linalg.norm(block[:, None, :] - self._xyz[None, :, :], axis=2) <= chord
+            ).sum(axis=1)
+        return counts
+
+    def query_bbox(self, south: float, west: float, north: float, east: float) -> np.ndarray:
+        """
+        사각 영역 내 좌표 검색 (위도 정렬 배열에서 이진 검색 후 경도 비교)
+
+        Args:
+            south: 남쪽 위도
+            west: 서쪽 경도
+            north: 북쪽 위도
+            east: 동쪽 경도
+
+        Returns:
+            np.ndarray: 영역 내 좌표 인덱스 (오름차순)
+        """
+        if self._lat_order is None:
+            self._lat_order = np.argsort(self.lats, kind="stable")
+            self._sorted_lats = self.lats[self._lat_order]
+        start = np.searchsorted(self._sorted_lats, south, side="left")
+        end = np.searchsorted(self._sorted_lats, north, side="right")
+        idx = self._lat_order[start:end]
+        lons = self.lons[idx]
+        return np.sort(idx[(lons >= west) & (lons <= east)])
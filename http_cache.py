@@ -0,0 +1,160 @@
+"""
+서울 열린데이터광장 Open API 응답 디스크 캐시
+서비스명/시작/종료 인덱스를 키로 응답 JSON을 gzip 압축해 저장합니다.
+(API 키는 키에도, 저장 내용에도 포함하지 않음)
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+
+class ResponseCache:
+    """TTL과 용량 제한(LRU 삭제)이 있는 API 응답 캐시"""
+
+    def __init__(self, cache_dir: str, ttl_seconds: float = 86400, max_bytes: int = 200 * 1024 * 1024):
+        """
+        Args:
+            cache_dir: 캐시 디렉터리
+            ttl_seconds: 캐시 유효 시간 (초, 0 이하면 만료 없음)
+            max_bytes: 캐시 최대 용량 (바이트, 초과 시 오래 사용하지 않은 항목부터 삭제)
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # 적중/미적중 수는 페이지 동시 요청 스레드에서 갱신되므로 별도 잠금 사용
+        self._stats_lock = threading.Lock()
+
+    def _count(self, hit: bool):
+        with self._stats_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @staticmethod
+    def make_key(service_name: str, start_index: int, end_index: int) -> str:
+        """캐시 키 생성 (예: OpenAptInfo/1/1000)"""
+        return f"{service_name}/{int(start_index)}/{int(end_index)}"
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        service_name = key.split("/", 1)[0]
+        return os.path.join(self.cache_dir, f"{service_name}-{digest}.json.gz")
+
+    def get(self, key: str, allow_expired: bool = False) -> Optional[Dict]:
+        """
+        캐시된 응답 조회
+
+        Args:
+            key: 캐시 키
+            allow_expired: 만료된 항목도 반환할지 여부 (오프라인 모드)
+
+        Returns:
+            Optional[Dict]: 응답 JSON (없거나 만료되면 None)
+        """
+        path = self._path(key)
+        try:
+            modified = os.path.getmtime(path)
+            if not allow_expired and self.ttl_seconds > 0 and time.time() - modified > self.ttl_seconds:
+                self._count(False)
+                return None
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+            if entry.get("key") != key:
+                self._count(False)
+                return None
+            # 접근 시각 갱신 (LRU 기준은 atime, TTL 기준은 mtime)
+            os.utime(path, (time.time(), modified))
+        except (OSError, ValueError, EOFError):
+            self._count(False)
+            return None
+        self._count(True)
+        return entry.get("data")
+
+    def set(self, key: str, data: Dict):
+        """
+        응답 저장 후 용량 초과 시 정리
+
+        Args:
+            key: 캐시 키
+            data: 응답 JSON
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump({"key": key, "saved_at": time.time(), "data": data}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ 응답 캐시 저장 실패: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self.evict()
+
+    def evict(self):
+        """최대 용량을 넘으면 가장 오래 사용하지 않은 항목부터 삭제"""
+        with self._lock:
+            entries = []
+            total = 0
+            try:
+                names = os.listdir(self.cache_dir)
+            except OSError:
+                return
+            for name in names:
+                if not name.endswith(".json.gz"):
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((max(stat.st_atime, stat.st_mtime), stat.st_size, path))
+                total += stat.st_size
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".json.gz"):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+    def stats(self) -> Dict:
+        """
+        캐시 사용 통계
+
+        Returns:
+            Dict: 적중/미적중 수, 항목 수, 전체 용량(바이트)
+        """
+        count = 0
+        size = 0
+        if os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".json.gz"):
+                    count += 1
+                    size += os.path.getsize(os.path.join(self.cache_dir, name))
+        with self._stats_lock:
+            hits, misses = self.hits, self.misses
+        return {"hits": hits, "misses": misses, "entries": count, "bytes": size}
@@ -0,0 +1,156 @@
+"""
+목록 탭 페이지 보기
+데이터셋마다 컬럼별 정렬 순위를 한 번 계산해 두고, 필터 결과는 순위 배열로 정렬합니다.
+표시용 서식은 화면에 보이는 페이지의 행에만 적용합니다.
+"""
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from dataset_schema import as_float64
+
+# 화면에 표시할 컬럼 (원본 컬럼명 → 표시 이름, 이 순서대로 표시, 주소는 맨 우측)
+DISPLAY_COLUMNS: Dict[str, str] = {
+    "자치구": "자치구",
+    "동": "동",
+    "아파트명": "아파트명",
+    "건축연도": "연도",
+    "세대수": "세대수",
+    "복도계단식": "복도/계단",
+    # 면적 정보 (세대당 평균만 표시)
+    "세대당평균평형": "평형",
+    # 메인 아파트 실거래가 (동·단지명 정규화+유사도 매칭, 없으면 공란)
+    "평수": "평수",
+    "실거래가": "실거래가",
+    "기준연월일": "기준연월일",
+    # 전용면적별 세대현황 (평형별 세대수 분포)
+    "전용면적60㎡이하_세대수": "60㎡이하",
+    "전용면적60_85㎡_세대수": "60~85㎡",
+    "전용면적85_135㎡_세대수": "85~135㎡",
+    # 주차 정보
+    "주차대수": "주차",
+    "세대당주차면수": "세대당주차",
+    # 지하철 정보
+    "가장가까운지하철역": "지하철역",
+    "지하철역거리_km": "역거리",
+    # 도보 그래프가 있을 때만 있는 컬럼
+    "도보지하철역": "도보 최근접역",
+    "지하철역도보거리_km": "도보거리",
+    # 지하철 접근성 지표
+    "반경500m_지하철역수": "500m내 역",
+    "반경1km_지하철역수": "1km내 역",
+    "2번째지하철역거리_km": "2번째 역거리",
+    "3번째지하철역거리_km": "3번째 역거리",
+    "강남역거리_km": "강남역",
+    "시청역거리_km": "시청역",
+    "여의도역거리_km": "여의도역",
+    "주소": "주소",
+}
+
+# 매칭 안 된 행은 공란으로 표시하는 컬럼
+BLANK_IF_MISSING = ("평수", "실거래가", "기준연월일")
+
+# 기본 정렬: 건축연도 오름차순 (오래된순)
+DEFAULT_SORT_COLUMN = "건축연도"
+
+
+class ListView:
+    """필터 결과 정렬과 페이지 서식을 담당하는 목록 인덱스"""
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Args:
+            df: 앱 데이터프레임 (필터 엔진과 같은 행 순서)
+        """
+        self.df = df
+        self.columns = [col for col in DISPLAY_COLUMNS if col in df.columns]
+        self._ranks: Dict[str, np.ndarray] = {}
+
+    def rank(self, col: str) -> np.ndarray:
+        """
+        컬럼 정렬 순위 (같은 값은 같은 순위, 결측은 -1). 컬럼별로 처음 요청될 때 한 번 계산합니다.
+        숫자 컬럼은 값 순서, 그 외는 문자열 가나다순입니다.
+        """
+        if col not in self._ranks:
+            series = self.df[col]
+            numeric = pd.to_numeric(series, errors="coerce")
+            if numeric.notna().sum() == series.notna().sum():
+                keys = numeric
+            else:
+                keys = series.map(lambda value: value if pd.isna(value) else str(value))
+            codes, _ = pd.factorize(keys, sort=True, use_na_sentinel=True)
+            self._ranks[col] = codes
+        return self._ranks[col]
+
+    def sort_positions(self, positions: np.ndarray, col: Optional[str] = None, ascending: bool = True) -> np.ndarray:
+        """
+        필터 결과 행 위치를 컬럼 기준으로 정렬 (결측은 항상 맨 뒤, 같은 값은 원래 순서 유지)
+
+        Args:
+            positions: 필터링된 행 위치 배열
+            col: 정렬 컬럼 (None이거나 없는 컬럼이면 기본 정렬)
+            ascending: 오름차순 여부
+
+        Returns:
+            np.ndarray: 정렬된 행 위치 배열
+        """
+        if col is None or col not in self.df.columns:
+            col = DEFAULT_SORT_COLUMN
+        if col not in self.df.columns or len(positions) == 0:
+            return positions
+        ranks = self.rank(col)[positions].astype(np.int64)
+        missing = ranks < 0
+        keys = ranks if ascending else -ranks
+        keys[missing] = np.iinfo(np.int64).max
+        return positions[np.argsort(keys, kind="stable")]
+
+    def format_rows(self, positions: np.ndarray) -> pd.DataFrame:
+        """
+        행 위치의 표시용 데이터프레임 (컬럼명 간략화 및 포맷팅)
+
+        Args:
+            positions: 표시할 행 위치 배열 (이 순서대로 표시)
+
+        Returns:
+            pd.DataFrame: 표시용 데이터프레임
+        """
+        page = self.df.iloc[positions][self.columns].rename(columns=DISPLAY_COLUMNS)
+        page = page.reset_index(drop=True)
+        # float32 컬럼(좌표/거리)은 표시값 그대로 float64로
+        for col in page.columns[page.dtypes == np.float32]:
+            page[col] = as_float64(page[col])
+        # 매칭 안 된 행: 평수/실거래가/기준연월일 공란 처리
+        for col in BLANK_IF_MISSING:
+            if col in page.columns:
+                values = page[col].astype(object)
+                page[col] = values.where(values.notna(), "")
+        # 건축연도 포맷팅 (콤마 제거, 정수로 표시)
+        if "연도" in page.columns:
+            years = pd.to_numeric(page["연도"], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+            missing = np.isnan(years)
+            text = np.where(missing, 0, years).astype(np.int64).astype(str).astype(object)
+            text[missing] = ""
+            page["연도"] = pd.Series(text, index=page.index, dtype=object)
+        return page
+
+    def page(self, sorted_positions: np.ndarray, page_number: int, page_size: int) -> pd.DataFrame:
+        """
+        정렬된 결과에서 한 페이지만 서식 적용
+
+        Args:
+            sorted_positions: sort_positions() 결과
+            page_number: 페이지 번호 (1부터)
+            page_size: 페이지당 행 수
+
+        Returns:
+            pd.DataFrame: 표시용 데이터프레임
+        """
+        start = (max(page_number, 1) - 1) * page_size
+        return self.format_rows(sorted_positions[start:start + page_size])
+
+
+def page_count(total: int, page_size: int) -> int:
+    """전체 페이지 수 (결과가 없어도 1)"""
+    return max(1, -(-total // page_size))
+
@@ -0,0 +1,375 @@
+"""
+지도 탭 렌더링 (folium)
+아파트별 Marker 대신 좌표 배열을 FastMarkerCluster로 넘겨 브라우저에서 클러스터링하고,
+팝업 HTML은 마커를 클릭할 때 만듭니다. 결과가 많으면 축소 화면에서는 지오해시 격자 집계 타일을 표시하고,
+확대하면 개별 단지를 표시합니다.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import folium
+import numpy as np
+import pandas as pd
+from branca.element import MacroElement
+from folium.plugins import FastMarkerCluster
+from jinja2 import Template
+
+from config import MAP_CACHE_SIZE, MAP_RAW_MIN_ZOOM, MAP_RAW_POINT_LIMIT, MAP_TILE_THRESHOLD, TILE_LEVELS
+from dataset_schema import as_float64
+from spatial_tiles import TileIndex
+
+# 서울 중심 좌표 (유효한 좌표가 없을 때)
+SEOUL_CENTER = (37.5665, 126.9780)
+
+# 팝업에 표시할 컬럼 (좌표 뒤에 이 순서로 문자열로 담음)
+POPUP_FIELDS = ["아파트명", "주소", "자치구", "건축연도", "세대수", "평형", "가장가까운지하철역", "지하철역거리_km"]
+
+# 행 데이터: [위도, 경도, 툴팁, 아파트명, 주소, 자치구, 건축연도, 세대수, 평형, 지하철역, 거리]
+MARKER_CALLBACK = """(function () {
+    function esc(value) {
+        return String(value).replace(/[&<>"']/g, function (c) {
+            return {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}[c];
+        });
+    }
+    function popupHtml(row) {
+        return "<b>" + esc(row[3] || row[4]) + "</b><br>"
+            + "주소: " + esc(row[4]) + "<br>"
+            + "자치구: " + esc(row[5]) + "<br>"
+            + "건축연도: " + esc(row[6]) + "년<br>"
+            + "세대수: " + esc(row[7]) + "세대<br>"
+            + "평형: " + esc(row[8]) + "평<br>"
+            + "지하철역: " + esc(row[9]) + " (" + esc(row[10]) + "km)";
+    }
+    return function (row) {
+        var marker = L.marker(new L.LatLng(row[0], row[1]));
+        marker.bindTooltip(esc(row[2]));
+        // 팝업 HTML은 클릭 시 생성
+        marker.bindPopup(function () { return popupHtml(row); }, {maxWidth: 300});
+        return marker;
+    };
+})()"""
+
+
+def compute_map_view(lats: np.ndarray, lons: np.ndarray) -> Dict:
+    """
+    중심점, 초기 줌 레벨, 표시 범위 계산
+
+    Args:
+        lats: 유효한 위도 배열
+        lons: 유효한 경도 배열
+
+    Returns:
+        Dict: center, zoom_start, bounds ([[남, 서], [북, 동]] 또는 None)
+    """
+    if len(lats) == 0:
+        return {"center": SEOUL_CENTER, "zoom_start": 11, "bounds": None}
+
+    min_lat, max_lat = float(lats.min()), float(lats.max())
+    min_lon, max_lon = float(lons.min()), float(lons.max())
+
+    # 범위에 따른 적절한 초기 줌 레벨 계산
+    max_range = max(max_lat - min_lat, max_lon - min_lon)
+    if max_range < 0.01:  # 매우 좁은 범위 (약 1km)
+        zoom_start = 15
+    elif max_range < 0.05:  # 좁은 범위 (약 5km)
+        zoom_start = 13
+    elif max_range < 0.1:  # 중간 범위 (약 10km)
+        zoom_start = 12
+    elif max_range < 0.2:  # 넓은 범위 (약 20km)
+        zoom_start = 11
+    else:  # 매우 넓은 범위
+        zoom_start = 10
+
+    padding = 0.01  # 약 1km 여유 공간
+    return {
+        "center": (float(lats.mean()), float(lons.mean())),
+        "zoom_start": zoom_start,
+        "bounds": [[min_lat - padding, min_lon - padding], [max_lat + padding, max_lon + padding]],
+    }
+
+
+def _text_column(df: pd.DataFrame, col: str, size: int) -> List[str]:
+    """팝업용 문자열 컬럼 (없으면 빈 문자열)"""
+    if col not in df.columns:
+        return [""] * size
+    values = as_float64(df[col]) if df[col].dtype == np.float32 else df[col]
+    return [f"{value}" for value in values.tolist()]
+
+
+def pack_marker_rows(df: pd.DataFrame) -> List[list]:
+    """
+    FastMarkerCluster에 넘길 행 배열 생성 (유효한 좌표만)
+
+    Args:
+        df: 위도/경도 컬럼이 있는 데이터프레임
+
+    Returns:
+        List[list]: [위도, 경도, 툴팁, 팝업 필드...] 목록
+    """
+    lats = as_float64(df["위도"]).to_numpy(dtype=float, na_value=np.nan)
+    lons = as_float64(df["경도"]).to_numpy(dtype=float, na_value=np.nan)
+    valid = ~(np.isnan(lats) | np.isnan(lons))
+    subset = df[valid]
+    size = len(subset)
+
+    names = subset["아파트명"].tolist() if "아파트명" in subset.columns else [""] * size
+    addresses = subset["주소"].tolist() if "주소" in subset.columns else [""] * size
+    tooltips = [f"{name or address}" for name, address in zip(names, addresses)]
+    fields = [_text_column(subset, col, size) for col in POPUP_FIELDS]
+
+    return [list(row) for row in zip(lats[valid].tolist(), lons[valid].tolist(), tooltips, *fields)]
+
+
+class ZoomTileLayers(MacroElement):
+    """
+    줌 단계별 격자 타일 레이어 전환 (타일 레이어는 처음 보일 때 생성)
+    개별 단지 레이어가 있으면 raw_min_zoom 이상에서만 지도에 올립니다.
+    """
+
+    _template = Template("""
+{% macro script(this, kwargs) %}
+(function () {
+    var map = {{ this._parent.get_name() }};
+    var levels = {{ this.levels_json }};
+    var raw = {{ this.raw_layer_name }};
+    var rawMinZoom = {{ this.raw_min_zoom }};
+    function tooltip(cell) {
+        return cell[4] + "개 단지<br>"
+            + "세대수 합계: " + cell[5] + "세대<br>"
+            + "평균 건축연도: " + (cell[6] === null ? "N/A" : cell[6] + "년") + "<br>"
+            + "평균 지하철역 거리: " + (cell[7] === null ? "N/A" : cell[7] + "km");
+    }
+    function buildLayer(level) {
+        var group = L.layerGroup();
+        level.cells.forEach(function (cell) {
+            var opacity = 0.15 + 0.55 * cell[4] / level.maxCount;
+            L.rectangle([[cell[0], cell[1]], [cell[2], cell[3]]], {
+                color: "#3388ff", weight: 1, fillOpacity: opacity
+            }).bindTooltip(tooltip(cell)).addTo(group);
+            L.marker([(cell[0] + cell[2]) / 2, (cell[1] + cell[3]) / 2], {
+                interactive: false,
+                icon: L.divIcon({
+                    className: "",
+                    iconSize: [40, 16],
+                    html: "<div style=\\"text-align:center;font-weight:bold;font-size:11px;\\">" + cell[4] + "</div>"
+                })
+            }).addTo(group);
+        });
+        return group;
+    }
+    function update() {
+        var zoom = map.getZoom();
+        levels.forEach(function (level) {
+            var show = zoom >= level.minZoom && zoom <= level.maxZoom;
+            if (show && !level.layer) {
+                level.layer = buildLayer(level);
+            }
+            if (show && !map.hasLayer(level.layer)) {
+                level.layer.addTo(map);
+            } else if (!show && level.layer && map.hasLayer(level.layer)) {
+                map.removeLayer(level.layer);
+            }
+        });
+        if (raw) {
+            var showRaw = zoom >= rawMinZoom;
+            if (showRaw && !map.hasLayer(raw)) {
+                raw.addTo(map);
+            } else if (!showRaw && map.hasLayer(raw)) {
+                map.removeLayer(raw);
+            }
+        }
+    }
+    map.on("zoomend", update);
+    update();
+})();
+{% endmacro %}
+""")
+
+    def __init__(self, levels: List[Dict], raw_layer=None, raw_min_zoom: int = MAP_RAW_MIN_ZOOM):
+        """
+        Args:
+            levels: tile_levels() 결과
+            raw_layer: 확대했을 때만 표시할 개별 단지 레이어 (없으면 None)
+            raw_min_zoom: 개별 단지를 표시하는 최소 줌
+        """
+        super().__init__()
+        self._name = "ZoomTileLayers"
+        self.levels_json = json.dumps(levels, ensure_ascii=False)
+        self.raw_layer_name = raw_layer.get_name() if raw_layer is not None else "null"
+        self.raw_min_zoom = raw_min_zoom
+
+
+def tile_levels(tiles: TileIndex, positions: Optional[np.ndarray], include_raw: bool) -> List[Dict]:
+    """
+    줌 단계별 격자 집계 (개별 단지를 함께 표시하면 raw 줌 이상 단계는 제외)
+
+    Args:
+        tiles: 격자 인덱스
+        positions: 행 위치 배열 (None이면 전체)
+        include_raw: 확대 시 개별 단지 표시 여부
+
+    Returns:
+        List[Dict]: minZoom, maxZoom, maxCount, cells([남, 서, 북, 동, 단지수, 세대수합계, 평균건축연도, 평균역거리]) 목록
+    """
+    levels = [level for level in TILE_LEVELS if not include_raw or level[1] < MAP_RAW_MIN_ZOOM]
+    result = []
+    for i, (precision, min_zoom, max_zoom) in enumerate(levels):
+        agg = tiles.aggregate(positions, precision)
+        if i == len(levels) - 1:
+            # 마지막 단계는 개별 단지 줌 직전까지, 타일만 표시하면 최대 줌까지
+            max_zoom = MAP_RAW_MIN_ZOOM - 1 if include_raw else 99
+        years = agg["평균건축연도"].round().astype("Int64").astype(object).where(agg["평균건축연도"].notna(), None)
+        distances = agg["평균지하철역거리_km"].round(2).astype(object).where(agg["평균지하철역거리_km"].notna(), None)
+        cells = [
+            [round(s, 6), round(w, 6), round(n, 6), round(e, 6), int(count), int(households), year, distance]
+            for s, w, n, e, count, households, year, distance in zip(
+                agg["남"], agg["서"], agg["북"], agg["동"], agg["단지수"], agg["세대수합계"], years, distances
+            )
+        ]
+        result.append({
+            "minZoom": min_zoom,
+            "maxZoom": max_zoom,
+            "maxCount": int(agg["단지수"].max()) if len(agg) else 1,
+            "cells": cells,
+        })
+    return result
+
+
+def build_apartment_map(
+    df: pd.DataFrame,
+    tiles: Optional[TileIndex] = None,
+    positions: Optional[np.ndarray] = None,
+    tile_threshold: int = MAP_TILE_THRESHOLD,
+    raw_point_limit: int = MAP_RAW_POINT_LIMIT,
+) -> Tuple[folium.Map, str]:
+    """
+    아파트 지도 생성
+    - 포인트가 tile_threshold 이하: 마커 클러스터
+    - raw_point_limit 이하: 축소 화면은 격자 타일, 확대하면 마커 클러스터
+    - 초과: 격자 타일만 (개별 단지 데이터는 보내지 않음)
+
+    Args:
+        df: 위도/경도 컬럼이 있는 데이터프레임 (필터링된 결과)
+        tiles: 데이터셋 격자 인덱스 (None이면 df로 생성)
+        positions: tiles 기준 필터링된 행 위치 (tiles가 None이면 무시)
+        tile_threshold: 격자 타일로 전환할 포인트 수
+        raw_point_limit: 개별 단지를 보내지 않을 포인트 수
+
+    Returns:
+        Tuple[folium.Map, str]: (지도, 표시 방식 "cluster", "tiles", "tiles_only")
+    """
+    lats = as_float64(df["위도"]).to_numpy(dtype=float, na_value=np.nan)
+    lons = as_float64(df["경도"]).to_numpy(dtype=float, na_value=np.nan)
+    valid = ~(np.isnan(lats) | np.isnan(lons))
+    view = compute_map_view(lats[valid], lons[valid])
+
+    m = folium.Map(location=list(view["center"]), zoom_start=view["zoom_start"], tiles="OpenStreetMap")
+
+    point_count = int(valid.sum())
+    if point_count <= tile_threshold:
+        if point_count > 0:
+            FastMarkerCluster(pack_marker_rows(df), callback=MARKER_CALLBACK).add_to(m)
+        mode = "cluster"
+    else:
+        if tiles is None:
+            tiles, positions = TileIndex(df), None
+        include_raw = point_count <= raw_point_limit
+        raw_layer = None
+        if include_raw:
+            raw_layer = FastMarkerCluster(pack_marker_rows(df), callback=MARKER_CALLBACK)
+            raw_layer.add_to(m)
+        ZoomTileLayers(tile_levels(tiles, positions, include_raw), raw_layer).add_to(m)
+        mode = "tiles" if include_raw else "tiles_only"
+
+    # 모든 마커가 보이도록 bounds 설정 (유효한 좌표가 있는 경우만)
+    if view["bounds"] is not None:
+        m.fit_bounds(view["bounds"], padding=(20, 20))  # 픽셀 단위 여유 공간
+    return m, mode
+
+
+def map_cache_key(row_positions: np.ndarray, dataset_key=None) -> str:
+    """
+    지도 캐시 키 (데이터셋 + 필터링된 행 위치 해시)
+
+    Args:
+        row_positions: 필터링된 행 위치 배열
+        dataset_key: 데이터셋 식별값 (공유 데이터셋 버전, 세션 데이터 토큰 등)
+
+    Returns:
+        str: 캐시 키
+    """
+    digest = hashlib.sha1(repr(dataset_key).encode("utf-8"))
+    digest.update(np.ascontiguousarray(row_positions, dtype=np.int64).tobytes())
+    return digest.hexdigest()
+
+
+def render_map_html(
+    df: pd.DataFrame,
+    tiles: Optional[TileIndex] = None,
+    positions: Optional[np.ndarray] = None,
+) -> Tuple[str, str]:
+    """
+    아파트 지도를 HTML 문서로 렌더링
+
+    Args:
+        df: 위도/경도 컬럼이 있는 데이터프레임
+        tiles: 데이터셋 격자 인덱스
+        positions: tiles 기준 필터링된 행 위치
+
+    Returns:
+        Tuple[str, str]: (HTML, 표시 방식)
+    """
+    m, mode = build_apartment_map(df, tiles, positions)
+    return m.get_root().render(), mode
+
+
+class MapHtmlCache:
+    """
+    필터 결과별 렌더링한 지도 HTML 캐시 (LRU, 여러 세션이 함께 쓰므로 스레드 안전)
+    folium 지도 객체는 다시 렌더링하면 스크립트가 중복되므로 렌더링 결과를 보관합니다.
+    """
+
+    def __init__(self, max_entries: int = MAP_CACHE_SIZE):
+        """
+        Args:
+            max_entries: 최대 보관 개수
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_render(
+        self,
+        key: str,
+        df: pd.DataFrame,
+        tiles: Optional[TileIndex] = None,
+        positions: Optional[np.ndarray] = None,
+    ) -> Tuple[str, str]:
+        """
+        같은 필터 결과면 렌더링해 둔 지도 HTML 재사용 (없으면 렌더링 후 보관)
+
+        Args:
+            key: map_cache_key()로 만든 키
+            df: 필터링된 데이터프레임
+            tiles: 데이터셋 격자 인덱스
+            positions: tiles 기준 필터링된 행 위치
+
+        Returns:
+            Tuple[str, str]: (HTML, 표시 방식)
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        rendered = render_map_html(df, tiles, positions)
+        with self._lock:
+            self._entries[key] = rendered
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return rendered
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,145 @@
+"""
+세션 간 공유 데이터셋
+준비된 앱 데이터셋을 비압축 Arrow(Feather v2) 파일로 게시하고, 버전 포인터(CURRENT.json)를 원자적으로 교체합니다.
+각 세션/프로세스는 현재 버전 파일을 메모리 매핑해 읽으므로 숫자 컬럼과 문자열 컬럼(pyarrow 기반 str)은 복사 없이 공유됩니다.
+"""
+import glob
+import json
+import os
+import time
+import uuid
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import SHARED_DATASET_DIR, SHARED_DATASET_GRACE_SECONDS, SHARED_DATASET_KEEP_VERSIONS
+from storage import _prepare_for_arrow
+
+POINTER_FILE = "CURRENT.json"
+DATASET_PREFIX = "dataset-"
+DATASET_EXTENSION = ".arrow"
+
+
+def _pointer_path(data_dir: str) -> str:
+    return os.path.join(data_dir, POINTER_FILE)
+
+
+def dataset_file(data_dir: str, version: str) -> str:
+    """버전별 데이터셋 파일 경로"""
+    return os.path.join(data_dir, f"{DATASET_PREFIX}{version}{DATASET_EXTENSION}")
+
+
+def read_pointer(data_dir: str = SHARED_DATASET_DIR) -> Optional[Dict]:
+    """
+    현재 버전 포인터 읽기
+
+    Args:
+        data_dir: 공유 데이터셋 디렉터리
+
+    Returns:
+        Optional[Dict]: version, rows, published_at 및 게시할 때 넘긴 메타데이터 (없거나 파일이 사라졌으면 None)
+    """
+    try:
+        with open(_pointer_path(data_dir), "r", encoding="utf-8") as f:
+            pointer = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(pointer, dict) or not os.path.exists(dataset_file(data_dir, pointer.get("version", ""))):
+        return None
+    return pointer
+
+
+def publish(df: pd.DataFrame, data_dir: str = SHARED_DATASET_DIR, **metadata) -> Dict:
+    """
+    데이터셋을 새 버전으로 게시 (파일 기록 후 포인터 교체, 실패 시 OSError)
+
+    Args:
+        df: 준비된 앱 데이터프레임
+        data_dir: 공유 데이터셋 디렉터리
+        **metadata: 포인터에 함께 기록할 값 (JSON 직렬화 가능해야 함)
+
+    Returns:
+        Dict: 새 포인터
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    os.makedirs(data_dir, exist_ok=True)
+    version = f"{time.strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+    path = dataset_file(data_dir, version)
+
+    # 메모리 매핑으로 바로 읽을 수 있도록 비압축으로 기록
+    table = pa.Table.from_pandas(_prepare_for_arrow(df).reset_index(drop=True), preserve_index=False)
+    feather.write_feather(table, f"{path}.tmp", compression="uncompressed")
+    os.replace(f"{path}.tmp", path)
+
+    pointer = {"version": version, "rows": len(df), "published_at": time.time(), **metadata}
+    tmp_pointer = f"{_pointer_path(data_dir)}.{version}.tmp"
+    with open(tmp_pointer, "w", encoding="utf-8") as f:
+        json.dump(pointer, f, ensure_ascii=False)
+    os.replace(tmp_pointer, _pointer_path(data_dir))
+
+    _remove_old_versions(data_dir, SHARED_DATASET_KEEP_VERSIONS, SHARED_DATASET_GRACE_SECONDS)
+    return pointer
+
+
+def _remove_old_versions(data_dir: str, keep: int, grace_seconds: float):
+    """
+    오래된 버전 파일 삭제
+
+    최근 keep개는 항상 유지하고, 그보다 오래된 버전도 다음 버전이 게시된 지 grace_seconds가 지나야 삭제합니다.
+    (포인터를 읽은 뒤 아직 파일을 열지 않은 세션이 사라진 파일을 열지 않도록. 이미 매핑한 프로세스는 삭제 후에도 계속 읽을 수 있음)
+
+    Args:
+        data_dir: 공유 데이터셋 디렉터리
+        keep: 항상 유지할 최근 버전 수
+        grace_seconds: 다음 버전 게시 후 이전 버전을 유지할 시간(초)
+    """
+    try:
+        files = sorted(
+            (os.path.getmtime(path), path)
+            for path in glob.glob(os.path.join(data_dir, f"{DATASET_PREFIX}*{DATASET_EXTENSION}"))
+        )
+    except OSError:
+        return
+    now = time.time()
+    # files[i]는 files[i + 1]이 게시된 시점부터 현재 버전이 아님
+    for (_, path), (superseded_at, _) in zip(files[:-max(keep, 1)], files[1:]):
+        if now - superseded_at < grace_seconds:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _arrow_string_dtype() -> pd.StringDtype:
+    """Arrow 버퍼를 그대로 쓰는 문자열 타입 (결측값은 NaN, pandas 3의 기본 str과 같음)"""
+    try:
+        return pd.StringDtype("pyarrow", na_value=np.nan)
+    except TypeError:
+        return pd.StringDtype("pyarrow_numpy")  # pandas 2.1~2.2
+
+
+def open_dataset(version: str, data_dir: str = SHARED_DATASET_DIR) -> pd.DataFrame:
+    """
+    게시된 버전을 메모리 매핑으로 로드 (숫자/문자열 컬럼은 매핑된 버퍼를 그대로 참조, 파일이 이미 삭제됐으면 FileNotFoundError)
+
+    Args:
+        version: 포인터의 version
+        data_dir: 공유 데이터셋 디렉터리
+
+    Returns:
+        pd.DataFrame: 앱 데이터프레임
+    """
+    import pyarrow as pa
+
+    source = pa.memory_map(dataset_file(data_dir, version), "r")
+    table = pa.ipc.open_file(source).read_all()
+    # pandas 버전과 무관하게 문자열 컬럼을 pyarrow 기반 str로 (object로 변환하면 값마다 파이썬 문자열로 복사됨)
+    string_dtype = _arrow_string_dtype()
+    return table.to_pandas(
+        split_blocks=True,
+        types_mapper={pa.string(): string_dtype, pa.large_string(): string_dtype}.get,
+    )
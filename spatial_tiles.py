@@ -0,0 +1,209 @@
+"""
+지오해시 격자 집계 (축소된 지도용 타일)
+단지 좌표를 지오해시 정수 코드로 바꿔 두고, 상위 격자는 비트 이동으로 구합니다.
+필터 결과는 행 위치 배열로 받아 격자별 단지 수, 세대수 합, 평균 건축연도, 평균 지하철역 거리를 집계합니다.
+"""
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import TILE_MAX_PRECISION
+from dataset_schema import as_float64
+
+GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_BASE32_CHARS = np.array(list(GEOHASH_BASE32))
+_BASE32_INDEX = {char: value for value, char in enumerate(GEOHASH_BASE32)}
+
+GEOHASH_COLUMN = "지오해시"
+
+
+def _bit_counts(precision: int):
+    """정밀도별 (경도 비트 수, 위도 비트 수) - 지오해시는 경도 비트부터 번갈아 배치"""
+    bits = precision * 5
+    return (bits + 1) // 2, bits // 2
+
+
+def geohash_codes(lats, lons, precision: int = TILE_MAX_PRECISION) -> np.ndarray:
+    """
+    위경도를 지오해시 정수 코드로 변환 (좌표가 없으면 -1)
+
+    Args:
+        lats: 위도 배열
+        lons: 경도 배열
+        precision: 지오해시 글자 수
+
+    Returns:
+        np.ndarray: int64 코드 배열
+    """
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    valid = ~(np.isnan(lats) | np.isnan(lons))
+    lon_bits, lat_bits = _bit_counts(precision)
+
+    lat_q = np.clip(np.floor((np.where(valid, lats, 0.0) + 90.0) / 180.0 * (1 << lat_bits)), 0, (1 << lat_bits) - 1)
+    lon_q = np.clip(np.floor((np.where(valid, lons, 0.0) + 180.0) / 360.0 * (1 << lon_bits)), 0, (1 << lon_bits) - 1)
+    lat_q = lat_q.astype(np.int64)
+    lon_q = lon_q.astype(np.int64)
+
+    codes = np.zeros(len(lats), dtype=np.int64)
+    for i in range(precision * 5):
+        if i % 2 == 0:
+            bit = (lon_q >> (lon_bits - 1 - i // 2)) & 1
+        else:
+            bit = (lat_q >> (lat_bits - 1 - i // 2)) & 1
+        codes = (codes << 1) | bit
+    codes[~valid] = -1
+    return codes
+
+
+def parent_codes(codes: np.ndarray, precision: int, from_precision: int = TILE_MAX_PRECISION) -> np.ndarray:
+    """상위 격자 코드 (지오해시 앞 precision 글자, -1은 유지)"""
+    shifted = np.asarray(codes, dtype=np.int64) >> (5 * (from_precision - precision))
+    return np.where(np.asarray(codes) < 0, -1, shifted)
+
+
+def codes_to_strings(codes: np.ndarray, precision: int) -> np.ndarray:
+    """지오해시 코드 → 문자열 (-1은 None)"""
+    codes = np.asarray(codes, dtype=np.int64)
+    digits = np.column_stack([(codes >> (5 * (precision - 1 - j))) & 31 for j in range(precision)])
+    text = np.array(["".join(row) for row in _BASE32_CHARS[digits]], dtype=object)
+    text[codes < 0] = None
+    return text
+
+
+def strings_to_codes(values: Iterable, precision: int = TILE_MAX_PRECISION) -> np.ndarray:
+    """
+    지오해시 문자열 → 코드 (precision 글자로 자름, 짧거나 잘못된 값은 -1)
+
+    Args:
+        values: 지오해시 문자열 목록
+        precision: 코드 정밀도
+
+    Returns:
+        np.ndarray: int64 코드 배열
+    """
+    codes = []
+    for value in values:
+        code = -1
+        if isinstance(value, str) and len(value) >= precision:
+            try:
+                code = 0
+                for char in value[:precision]:
+                    code = (code << 5) | _BASE32_INDEX[char]
+            except KeyError:
+                code = -1
+        codes.append(code)
+    return np.array(codes, dtype=np.int64)
+
+
+def geohash_strings(lats, lons, precision: int = TILE_MAX_PRECISION) -> np.ndarray:
+    """위경도 → 지오해시 문자열 배열 (좌표가 없으면 None)"""
+    return codes_to_strings(geohash_codes(lats, lons, precision), precision)
+
+
+def cell_bounds(codes: np.ndarray, precision: int) -> np.ndarray:
+    """
+    격자 범위 계산
+
+    Args:
+        codes: 지오해시 코드 배열 (유효한 값만)
+        precision: 정밀도
+
+    Returns:
+        np.ndarray: (n, 4) [남, 서, 북, 동] 배열
+    """
+    codes = np.asarray(codes, dtype=np.int64)
+    lon_bits, lat_bits = _bit_counts(precision)
+    lat_q = np.zeros(len(codes), dtype=np.int64)
+    lon_q = np.zeros(len(codes), dtype=np.int64)
+    total_bits = precision * 5
+    for i in range(total_bits):
+        bit = (codes >> (total_bits - 1 - i)) & 1
+        if i % 2 == 0:
+            lon_q = (lon_q << 1) | bit
+        else:
+            lat_q = (lat_q << 1) | bit
+    lat_size = 180.0 / (1 << lat_bits)
+    lon_size = 360.0 / (1 << lon_bits)
+    south = lat_q * lat_size - 90.0
+    west = lon_q * lon_size - 180.0
+    return np.column_stack((south, west, south + lat_size, west + lon_size))
+
+
+class TileIndex:
+    """행별 지오해시 코드를 보관하고 필터 결과를 격자별로 집계하는 인덱스"""
+
+    def __init__(self, df: pd.DataFrame, max_precision: int = TILE_MAX_PRECISION):
+        """
+        Args:
+            df: 앱 데이터프레임 (지오해시 컬럼이 있으면 사용, 없으면 위도/경도로 계산)
+            max_precision: 행별로 보관할 코드 정밀도
+        """
+        self.max_precision = max_precision
+        self.size = len(df)
+        if "위도" in df.columns and "경도" in df.columns:
+            lats = as_float64(df["위도"]).to_numpy(dtype=float, na_value=np.nan)
+            lons = as_float64(df["경도"]).to_numpy(dtype=float, na_value=np.nan)
+            codes = geohash_codes(lats, lons, max_precision)
+            if GEOHASH_COLUMN in df.columns:
+                # 저장된 지오해시 우선, 없는 행만 좌표로 계산
+                stored = strings_to_codes(df[GEOHASH_COLUMN].tolist(), max_precision)
+                codes = np.where(stored >= 0, stored, codes)
+            self.codes = codes
+        else:
+            self.codes = np.full(self.size, -1, dtype=np.int64)
+
+        def numeric(col):
+            if col not in df.columns:
+                return np.full(self.size, np.nan)
+            return as_float64(df[col]).to_numpy(dtype=float, na_value=np.nan)
+
+        self.households = numeric("세대수")
+        self.years = numeric("건축연도")
+        self.distances = numeric("지하철역거리_km")
+
+    def aggregate(self, positions: Optional[np.ndarray], precision: int) -> pd.DataFrame:
+        """
+        행 위치 범위를 격자별로 집계
+
+        Args:
+            positions: 행 위치 배열 (None이면 전체)
+            precision: 격자 정밀도 (max_precision 이하)
+
+        Returns:
+            pd.DataFrame: 지오해시, 남/서/북/동, 위도/경도(격자 중심), 단지수, 세대수합계, 평균건축연도, 평균지하철역거리_km
+        """
+        positions = np.arange(self.size) if positions is None else np.asarray(positions)
+        codes = parent_codes(self.codes[positions], precision, self.max_precision)
+        valid = codes >= 0
+        cells, inverse = np.unique(codes[valid], return_inverse=True)
+        rows = positions[valid]
+
+        def mean_of(values):
+            values = values[rows]
+            present = ~np.isnan(values)
+            sums = np.bincount(inverse, weights=np.where(present, values, 0.0), minlength=len(cells))
+            counts = np.bincount(inverse, weights=present.astype(float), minlength=len(cells))
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return np.where(counts > 0, sums / counts, np.nan)
+
+        households = self.households[rows]
+        bounds = cell_bounds(cells, precision)
+        return pd.DataFrame({
+            GEOHASH_COLUMN: codes_to_strings(cells, precision),
+            "남": bounds[:, 0],
+            "서": bounds[:, 1],
+            "북": bounds[:, 2],
+            "동": bounds[:, 3],
+            "위도": (bounds[:, 0] + bounds[:, 2]) / 2,
+            "경도": (bounds[:, 1] + bounds[:, 3]) / 2,
+            "단지수": np.bincount(inverse, minlength=len(cells)),
+            "세대수합계": np.bincount(inverse, weights=np.nan_to_num(households), minlength=len(cells)),
+            "평균건축연도": mean_of(self.years),
+            "평균지하철역거리_km": mean_of(self.distances),
+        })
+
+    def aggregate_levels(self, positions: Optional[np.ndarray], precisions: Iterable[int]) -> Dict[int, pd.DataFrame]:
+        """여러 정밀도 집계 ({정밀도: 집계표})"""
+        return {precision: self.aggregate(positions, precision) for precision in precisions}
@@ -0,0 +1,119 @@
+"""
+처리된 데이터셋 저장/로드
+기본 형식은 Parquet(pyarrow)이며 컬럼 타입을 그대로 보존하고 필요한 컬럼만 읽을 수 있습니다.
+(pyarrow가 없으면 CSV로 대체, CSV는 내보내기 용도)
+"""
+import os
+from typing import List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    USE_PYARROW = True
+except ImportError:
+    USE_PYARROW = False
+
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+FEATHER_EXTENSIONS = (".feather", ".arrow")
+
+
+def dataset_path(base_path: str) -> str:
+    """
+    저장 형식에 맞는 파일 경로 반환 (pyarrow가 있으면 .parquet, 없으면 .csv)
+
+    Args:
+        base_path: 확장자를 제외하거나 포함한 파일 경로
+
+    Returns:
+        str: 파일 경로
+    """
+    root, _ = os.path.splitext(base_path)
+    return f"{root}.parquet" if USE_PYARROW else f"{root}.csv"
+
+
+def find_dataset(base_path: str) -> Optional[str]:
+    """
+    저장된 데이터셋 파일 찾기 (Parquet/Feather 우선, 없으면 CSV)
+
+    Args:
+        base_path: 확장자를 제외하거나 포함한 파일 경로
+
+    Returns:
+        Optional[str]: 존재하는 파일 경로 (없으면 None)
+    """
+    root, _ = os.path.splitext(base_path)
+    extensions = (PARQUET_EXTENSIONS + FEATHER_EXTENSIONS if USE_PYARROW else ()) + (".csv",)
+    for ext in extensions:
+        if os.path.exists(root + ext):
+            return root + ext
+    return None
+
+
+def _prepare_for_arrow(df: pd.DataFrame) -> pd.DataFrame:
+    """숫자/문자가 섞인 object 컬럼을 문자열로 통일 (Arrow는 컬럼당 하나의 타입만 허용)"""
+    mixed = [
+        col for col in df.columns
+        if df[col].dtype == object and pd.api.types.infer_dtype(df[col], skipna=True).startswith("mixed")
+    ]
+    if not mixed:
+        return df
+    df = df.copy()
+    for col in mixed:
+        df[col] = df[col].map(lambda value: value if value is None or pd.isna(value) else str(value))
+    return df
+
+
+def save_dataset(df: pd.DataFrame, path: str):
+    """
+    데이터프레임 저장 (확장자로 형식 결정: .parquet / .feather / .csv)
+
+    Args:
+        df: 저장할 데이터프레임
+        path: 파일 경로
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in PARQUET_EXTENSIONS + FEATHER_EXTENSIONS and not USE_PYARROW:
+        path = os.path.splitext(path)[0] + ".csv"
+        ext = ".csv"
+        print("⚠️ pyarrow가 설치되지 않아 CSV로 저장합니다. (pip install pyarrow)")
+
+    # 다른 프로세스가 읽는 도중 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체
+    tmp_path = f"{path}.tmp"
+    if ext in PARQUET_EXTENSIONS:
+        _prepare_for_arrow(df).to_parquet(tmp_path, index=False)
+    elif ext in FEATHER_EXTENSIONS:
+        _prepare_for_arrow(df).reset_index(drop=True).to_feather(tmp_path)
+    else:
+        df.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_dataset(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    데이터프레임 로드 (확장자로 형식 결정)
+
+    Args:
+        path: 파일 경로
+        columns: 읽을 컬럼 목록 (None이면 전체, 파일에 없는 컬럼은 무시)
+
+    Returns:
+        pd.DataFrame: 로드된 데이터프레임
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in PARQUET_EXTENSIONS + FEATHER_EXTENSIONS:
+        if columns is not None:
+            import pyarrow.ipc as ipc
+            import pyarrow.parquet as pq
+            schema = pq.read_schema(path) if ext in PARQUET_EXTENSIONS else ipc.open_file(path).schema
+            columns = [col for col in columns if col in schema.names]
+        if ext in PARQUET_EXTENSIONS:
+            return pd.read_parquet(path, columns=columns)
+        return pd.read_feather(path, columns=columns)
+
+    usecols = None
+    if columns is not None:
+        wanted = set(columns)
+        usecols = lambda col: col in wanted  # noqa: E731
+    return pd.read_csv(path, encoding="utf-8-sig", usecols=usecols)
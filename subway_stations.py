@@ -1,376 +1,363 @@
 """
 서울 지하철역 좌표 데이터 (주요 역)
+역 목록(역별 정차 노선 포함)을 역 ID 순서의 배열 표(StationTable)로 한 번 변환해 두고,
+이름/노선 인덱스와 거리 계산용 연속 좌표 배열(float64)을 제공합니다.
 """
-SUBWAY_STATIONS = {
-    # 1호선
-    "서울역": (37.5547, 126.9706),
-    "시청역": (37.5651, 126.9770),
-    "종각역": (37.5701, 126.9830),
-    "종로3가역": (37.5714, 126.9918),
-    "종로5가역": (37.5709, 127.0015),
-    "동대문역": (37.5714, 127.0097),
-    "신설동역": (37.5753, 127.0251),
-    "제기동역": (37.5781, 127.0349),
-    "청량리역": (37.5802, 127.0466),
-    "왕십리역": (37.5612, 127.0374),
-    "성수역": (37.5446, 127.0559),
-    "건대입구역": (37.5407, 127.0692),
-    "구의역": (37.5371, 127.0855),
-    "광나루역": (37.5453, 127.1036),
-    "천호역": (37.5384, 127.1236),
-    "강동역": (37.5358, 127.1324),
-    "잠실역": (37.5133, 127.1002),
-    "송파역": (37.4995, 127.1121),
-    "가락시장역": (37.4929, 127.1185),
-    "수서역": (37.4873, 127.1014),
-    "복정역": (37.4707, 127.1266),
-    "사당역": (37.4765, 126.9817),
-    "이수역": (37.4846, 126.9806),
-    "서초역": (37.4837, 127.0324),
-    "방배역": (37.4814, 126.9976),
-    "서울대입구역": (37.4812, 126.9527),
-    "신림역": (37.4842, 126.9298),
-    "봉천역": (37.4823, 126.9414),
-    "서울대벤처타운역": (37.4700, 126.9300),
-    
-    # 2호선
-    "을지로입구역": (37.5660, 126.9826),
-    "을지로3가역": (37.5663, 126.9919),
-    "을지로4가역": (37.5666, 127.0010),
-    "동대문역사문화공원역": (37.5656, 127.0089),
-    "충무로역": (37.5614, 126.9943),
-    "신당역": (37.5656, 127.0195),
-    "상왕십리역": (37.5644, 127.0294),
-    "한남역": (37.5294, 127.0086),
-    "옥수역": (37.5406, 127.0174),
-    "압구정역": (37.5273, 127.0285),
-    "신사역": (37.5162, 127.0197),
-    "강남역": (37.4981, 127.0276),
-    "역삼역": (37.5001, 127.0364),
-    "선릉역": (37.5045, 127.0489),
-    "삼성역": (37.5088, 127.0630),
-    "종합운동장역": (37.5113, 127.0738),
-    "올림픽공원역": (37.5163, 127.1309),
-    "방이역": (37.5087, 127.1264),
-    "개롱역": (37.4947, 127.1348),
-    "거여역": (37.4931, 127.1446),
-    "마천역": (37.4950, 127.1528),
-    "잠실나루역": (37.5206, 127.1037),
-    "길동역": (37.5378, 127.1400),
-    "굽은다리역": (37.5453, 127.1428),
-    "명일역": (37.5519, 127.1439),
-    "고덕역": (37.5550, 127.1541),
-    "상일동역": (37.5567, 127.1658),
-    "강일역": (37.5574, 127.1755),
-    "둔촌동역": (37.5277, 127.1363),
-    "홍대입구역": (37.5567, 126.9234),
-    "합정역": (37.5496, 126.9139),
-    "당산역": (37.5344, 126.9023),
-    "영등포구청역": (37.5249, 126.8955),
-    "문래역": (37.5179, 126.8947),
-    "신도림역": (37.5087, 126.8912),
-    "대림역": (37.4934, 126.8980),
-    "구로디지털단지역": (37.4852, 126.9014),
-    "신대방역": (37.4874, 126.9132),
-    "신림역": (37.4842, 126.9298),
-    "봉천역": (37.4823, 126.9414),
-    "서울대입구역": (37.4812, 126.9527),
-    "낙성대역": (37.4767, 126.9630),
-    "사당역": (37.4765, 126.9817),
-    "방배역": (37.4814, 126.9976),
-    "서초역": (37.4837, 127.0324),
-    "교대역": (37.4934, 127.0145),
-    "강남역": (37.4981, 127.0276),
-    "역삼역": (37.5001, 127.0364),
-    "선릉역": (37.5045, 127.0489),
-    "삼성역": (37.5088, 127.0630),
-    "종합운동장역": (37.5113, 127.0738),
-    "올림픽공원역": (37.5163, 127.1309),
-    "방이역": (37.5087, 127.1264),
-    "개롱역": (37.4947, 127.1348),
-    "거여역": (37.4931, 127.1446),
-    "마천역": (37.4950, 127.1528),
-    "을지로입구역": (37.5660, 126.9826),
-    "을지로3가역": (37.5663, 126.9919),
-    "을지로4가역": (37.5666, 127.0010),
-    "동대문역사문화공원역": (37.5656, 127.0089),
-    "충무로역": (37.5614, 126.9943),
-    "신당역": (37.5656, 127.0195),
-    "상왕십리역": (37.5644, 127.0294),
-    "왕십리역": (37.5612, 127.0374),
-    "한남역": (37.5294, 127.0086),
-    "옥수역": (37.5406, 127.0174),
-    "압구정역": (37.5273, 127.0285),
-    "신사역": (37.5162, 127.0197),
-    
-    # 3호선
-    "대화역": (37.6761, 126.7876),
-    "주엽역": (37.6701, 126.7613),
-    "정발산역": (37.6594, 126.7730),
-    "마두역": (37.6521, 126.7776),
-    "백석역": (37.6431, 126.7879),
-    "대곡역": (37.6316, 126.8110),
-    "화정역": (37.6346, 126.8326),
-    "원당역": (37.6532, 126.8431),
-    "원흥역": (37.6507, 126.8726),
-    "삼송역": (37.6531, 126.8956),
-    "지축역": (37.6481, 126.9139),
-    "구파발역": (37.6368, 126.9188),
-    "연신내역": (37.6191, 126.9210),
-    "불광역": (37.6102, 126.9298),
-    "녹번역": (37.6009, 126.9357),
-    "홍제역": (37.5890, 126.9438),
-    "무악재역": (37.5822, 126.9501),
-    "독립문역": (37.5745, 126.9578),
-    "경복궁역": (37.5760, 126.9768),
-    "안국역": (37.5765, 126.9854),
-    "종로3가역": (37.5714, 126.9918),
-    "을지로3가역": (37.5663, 126.9919),
-    "충무로역": (37.5614, 126.9943),
-    "동대입구역": (37.5591, 127.0053),
-    "약수역": (37.5543, 127.0106),
-    "금호역": (37.5480, 127.0158),
-    "옥수역": (37.5406, 127.0174),
-    "압구정역": (37.5273, 127.0285),
-    "신사역": (37.5162, 127.0197),
-    "강남역": (37.4981, 127.0276),
-    "역삼역": (37.5001, 127.0364),
-    "선릉역": (37.5045, 127.0489),
-    "삼성역": (37.5088, 127.0630),
-    "종합운동장역": (37.5113, 127.0738),
-    "올림픽공원역": (37.5163, 127.1309),
-    "방이역": (37.5087, 127.1264),
-    "개롱역": (37.4947, 127.1348),
-    "거여역": (37.4931, 127.1446),
-    "마천역": (37.4950, 127.1528),
-    
-    # 4호선
-    "당고개역": (37.6703, 127.0790),
-    "상계역": (37.6608, 127.0735),
-    "노원역": (37.6551, 127.0613),
-    "창동역": (37.6531, 127.0476),
-    "쌍문역": (37.6481, 127.0347),
-    "수유역": (37.6378, 127.0255),
-    "미아역": (37.6266, 127.0261),
-    "미아사거리역": (37.6133, 127.0301),
-    "길음역": (37.6034, 127.0253),
-    "성신여대입구역": (37.5926, 127.0163),
-    "한성대입구역": (37.5884, 127.0061),
-    "혜화역": (37.5821, 126.9994),
-    "동대문역": (37.5714, 127.0097),
-    "동대문역사문화공원역": (37.5656, 127.0089),
-    "충무로역": (37.5614, 126.9943),
-    "명동역": (37.5636, 126.9826),
-    "회현역": (37.5584, 126.9780),
-    "서울역": (37.5547, 126.9706),
-    "숙대입구역": (37.5446, 126.9717),
-    "삼각지역": (37.5341, 126.9731),
-    "신용산역": (37.5291, 126.9679),
-    "이촌역": (37.5223, 126.9743),
-    "동작역": (37.4819, 126.9817),
-    "총신대입구역": (37.4863, 126.9817),
-    "사당역": (37.4765, 126.9817),
-    "남태령역": (37.4637, 126.9890),
-    "선바위역": (37.4517, 126.9959),
-    "경마공원역": (37.4439, 127.0079),
-    "대공원역": (37.4356, 127.0065),
-    
-    # 5호선
-    "방화역": (37.5774, 126.8127),
-    "개화산역": (37.5726, 126.8081),
-    "김포공항역": (37.5623, 126.8011),
-    "송정역": (37.5612, 126.8115),
-    "마곡역": (37.5660, 126.8265),
-    "발산역": (37.5519, 126.8365),
-    "우장산역": (37.5486, 126.8363),
-    "화곡역": (37.5415, 126.8404),
-    "까치산역": (37.5322, 126.8461),
-    "신정역": (37.5249, 126.8563),
-    "목동역": (37.5261, 126.8649),
-    "오목교역": (37.5244, 126.8753),
-    "양평역": (37.5254, 126.8862),
-    "영등포구청역": (37.5249, 126.8955),
-    "영등포시장역": (37.5226, 126.9051),
-    "신길역": (37.5174, 126.9174),
-    "여의도역": (37.5212, 126.9242),
-    "여의나루역": (37.5271, 126.9329),
-    "마포역": (37.5396, 126.9456),
-    "공덕역": (37.5446, 126.9515),
-    "애오개역": (37.5527, 126.9565),
-    "충정로역": (37.5599, 126.9634),
-    "서대문역": (37.5658, 126.9666),
-    "광화문역": (37.5714, 126.9764),
-    "종로3가역": (37.5714, 126.9918),
-    "을지로4가역": (37.5666, 127.0010),
-    "동대문역사문화공원역": (37.5656, 127.0089),
-    "청구역": (37.5602, 127.0139),
-    "신금호역": (37.5555, 127.0200),
-    "행당역": (37.5573, 127.0297),
-    "왕십리역": (37.5612, 127.0374),
-    "마장역": (37.5661, 127.0429),
-    "답십리역": (37.5667, 127.0527),
-    "장한평역": (37.5614, 127.0646),
-    "군자역": (37.5571, 127.0795),
-    "아차산역": (37.5517, 127.0896),
-    "광나루역": (37.5453, 127.1036),
-    "천호역": (37.5384, 127.1236),
-    "강동역": (37.5358, 127.1324),
-    "길동역": (37.5378, 127.1400),
-    "굽은다리역": (37.5453, 127.1428),
-    "명일역": (37.5519, 127.1439),
-    "고덕역": (37.5550, 127.1541),
-    "상일동역": (37.5567, 127.1658),
-    "강일역": (37.5574, 127.1755),
-    "미사역": (37.5623, 127.1929),
-    
-    # 6호선
-    "응암역": (37.5985, 126.9156),
-    "역촌역": (37.6061, 126.9227),
-    "불광역": (37.6102, 126.9298),
-    "독바위역": (37.6186, 126.9331),
-    "연신내역": (37.6191, 126.9210),
-    "구산역": (37.6104, 126.9176),
-    "응암역": (37.5985, 126.9156),
-    "새절역": (37.5911, 126.9136),
-    "증산역": (37.5838, 126.9096),
-    "디지털미디어시티역": (37.5762, 126.9013),
-    "월드컵경기장역": (37.5683, 126.8973),
-    "마포구청역": (37.5632, 126.9034),
-    "망원역": (37.5560, 126.9100),
-    "합정역": (37.5496, 126.9139),
-    "상수역": (37.5477, 126.9225),
-    "광흥창역": (37.5474, 126.9319),
-    "대흥역": (37.5477, 126.9420),
-    "공덕역": (37.5446, 126.9515),
-    "효창공원앞역": (37.5393, 126.9613),
-    "삼각지역": (37.5341, 126.9731),
-    "녹사평역": (37.5347, 126.9865),
-    "이태원역": (37.5345, 126.9943),
-    "한강진역": (37.5395, 127.0012),
-    "버티고개역": (37.5480, 127.0069),
-    "약수역": (37.5543, 127.0106),
-    "청구역": (37.5602, 127.0139),
-    "신당역": (37.5656, 127.0195),
-    "동묘앞역": (37.5726, 127.0164),
-    "창신역": (37.5797, 127.0152),
-    "보문역": (37.5852, 127.0194),
-    "안암역": (37.5863, 127.0291),
-    "고려대역": (37.5905, 127.0363),
-    "월곡역": (37.6019, 127.0415),
-    "상월곡역": (37.6063, 127.0485),
-    "돌곶이역": (37.6105, 127.0564),
-    "석계역": (37.6148, 127.0658),
-    "태릉입구역": (37.6179, 127.0751),
-    "화랑대역": (37.6200, 127.0848),
-    "봉화산역": (37.6173, 127.0914),
-    
-    # 7호선
-    "장암역": (37.7009, 127.0532),
-    "도봉산역": (37.6896, 127.0462),
-    "수락산역": (37.6779, 127.0553),
-    "마들역": (37.6649, 127.0572),
-    "노원역": (37.6551, 127.0613),
-    "중계역": (37.6448, 127.0643),
-    "하계역": (37.6363, 127.0679),
-    "공릉역": (37.6257, 127.0729),
-    "태릉입구역": (37.6179, 127.0751),
-    "먹골역": (37.6107, 127.0776),
-    "중화역": (37.6025, 127.0793),
-    "상봉역": (37.5963, 127.0850),
-    "면목역": (37.5886, 127.0875),
-    "사가정역": (37.5809, 127.0874),
-    "용마산역": (37.5730, 127.0867),
-    "중곡역": (37.5658, 127.0845),
-    "군자역": (37.5571, 127.0795),
-    "어린이대공원역": (37.5480, 127.0746),
-    "건대입구역": (37.5407, 127.0692),
-    "뚝섬유원지역": (37.5319, 127.0647),
-    "청담역": (37.5194, 127.0473),
-    "강남구청역": (37.5172, 127.0413),
-    "학동역": (37.5142, 127.0316),
-    "논현역": (37.5074, 127.0214),
-    "반포역": (37.5081, 127.0115),
-    "고속터미널역": (37.5047, 127.0051),
-    "내방역": (37.4876, 127.0154),
-    "총신대입구역": (37.4863, 126.9817),
-    "남성역": (37.4846, 126.9714),
-    "숭실대입구역": (37.4960, 126.9534),
-    "상도역": (37.5028, 126.9479),
-    "장승배기역": (37.5049, 126.9391),
-    "신대방삼거리역": (37.4997, 126.9281),
-    "보라매역": (37.4999, 126.9204),
-    "신풍역": (37.5001, 126.9099),
-    "대림역": (37.4934, 126.8980),
-    "남구로역": (37.4850, 126.8875),
-    "가산디지털단지역": (37.4812, 126.8826),
-    "철산역": (37.4760, 126.8679),
-    "광명사거리역": (37.4793, 126.8549),
-    "천왕역": (37.4867, 126.8387),
-    "온수역": (37.4923, 126.8240),
-    "까치울역": (37.5062, 126.8109),
-    "부천종합운동장역": (37.5053, 126.7973),
-    "춘의역": (37.5037, 126.7870),
-    "신중동역": (37.5031, 126.7759),
-    "부천시청역": (37.5047, 126.7635),
-    "상동역": (37.5058, 126.7530),
-    "삼산체육관역": (37.5064, 126.7398),
-    "굴포천역": (37.5067, 126.7312),
-    "부평구청역": (37.5087, 126.7225),
-    "산곡역": (37.5087, 126.7079),
-    "석남역": (37.5061, 126.8110),
-    
-    # 8호선
-    "암사역": (37.5502, 127.1276),
-    "천호역": (37.5384, 127.1236),
-    "강동역": (37.5358, 127.1324),
-    "몽촌토성역": (37.5173, 127.1123),
-    "잠실역": (37.5133, 127.1002),
-    "석촌역": (37.5051, 127.1069),
-    "송파역": (37.4995, 127.1121),
-    "가락시장역": (37.4929, 127.1185),
-    "문정역": (37.4859, 127.1225),
-    "장지역": (37.4786, 127.1267),
-    "복정역": (37.4707, 127.1266),
-    "산성역": (37.4570, 127.1499),
-    "남한산성입구역": (37.4516, 127.1598),
-    "단대오거리역": (37.4452, 127.1569),
-    "신흥역": (37.4405, 127.1476),
-    "수진역": (37.4374, 127.1407),
-    "모란역": (37.4340, 127.1298),
-    
-    # 9호선
-    "개화역": (37.5784, 126.7981),
-    "김포공항역": (37.5623, 126.8011),
-    "공항시장역": (37.5634, 126.8106),
-    "신방화역": (37.5674, 126.8166),
-    "마곡나루역": (37.5669, 126.8270),
-    "양천향교역": (37.5683, 126.8413),
-    "가양역": (37.5615, 126.8546),
-    "증미역": (37.5574, 126.8616),
-    "등촌역": (37.5506, 126.8658),
-    "염창역": (37.5469, 126.8747),
-    "신목동역": (37.5447, 126.8831),
-    "선유도역": (37.5380, 126.8935),
-    "당산역": (37.5344, 126.9023),
-    "국회의사당역": (37.5281, 126.9178),
-    "여의도역": (37.5212, 126.9242),
-    "샛강역": (37.5174, 126.9284),
-    "노량진역": (37.5134, 126.9424),
-    "노들역": (37.5128, 126.9532),
-    "흑석역": (37.5087, 126.9638),
-    "동작역": (37.4819, 126.9817),
-    "구반포역": (37.5014, 126.9952),
-    "신반포역": (37.5037, 127.0034),
-    "고속터미널역": (37.5047, 127.0051),
-    "사평역": (37.5042, 127.0150),
-    "신논현역": (37.5046, 127.0254),
-    "언주역": (37.5074, 127.0339),
-    "선정릉역": (37.5049, 127.0489),
-    "삼성중앙역": (37.5130, 127.0538),
-    "봉은사역": (37.5142, 127.0585),
-    "종합운동장역": (37.5113, 127.0738),
-    "올림픽공원역": (37.5163, 127.1309),
-    "한성백제역": (37.5163, 127.1163),
-    "둔촌오륜역": (37.5192, 127.1388),
-    "중앙보훈병원역": (37.5284, 127.1484),
-}
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+# 역 (역 이름, 위도, 경도, 노선). 역 ID는 이 순서이며, 노선은 1~9호선 중 정차하는 노선만 기록합니다.
+# (경의중앙선/수인분당선/신분당선/공항철도/신림선 등은 기록하지 않으므로 해당 노선만 다니는 역은 노선이 비어 있음)
+_STATION_ROWS = (
+    ("서울역", 37.5547, 126.9706, ("1호선", "4호선")),
+    ("시청역", 37.5651, 126.9770, ("1호선", "2호선")),
+    ("종각역", 37.5701, 126.9830, ("1호선",)),
+    ("종로3가역", 37.5714, 126.9918, ("1호선", "3호선", "5호선")),
+    ("종로5가역", 37.5709, 127.0015, ("1호선",)),
+    ("동대문역", 37.5714, 127.0097, ("1호선", "4호선")),
+    ("신설동역", 37.5753, 127.0251, ("1호선", "2호선")),
+    ("제기동역", 37.5781, 127.0349, ("1호선",)),
+    ("청량리역", 37.5802, 127.0466, ("1호선",)),
+    ("왕십리역", 37.5612, 127.0374, ("2호선", "5호선")),
+    ("성수역", 37.5446, 127.0559, ("2호선",)),
+    ("건대입구역", 37.5407, 127.0692, ("2호선", "7호선")),
+    ("구의역", 37.5371, 127.0855, ("2호선",)),
+    ("광나루역", 37.5453, 127.1036, ("5호선",)),
+    ("천호역", 37.5384, 127.1236, ("5호선", "8호선")),
+    ("강동역", 37.5358, 127.1324, ("5호선",)),
+    ("잠실역", 37.5133, 127.1002, ("2호선", "8호선")),
+    ("송파역", 37.4995, 127.1121, ("8호선",)),
+    ("가락시장역", 37.4929, 127.1185, ("3호선", "8호선")),
+    ("수서역", 37.4873, 127.1014, ("3호선",)),
+    ("복정역", 37.4707, 127.1266, ("8호선",)),
+    ("사당역", 37.4765, 126.9817, ("2호선", "4호선")),
+    ("이수역", 37.4846, 126.9806, ("4호선", "7호선")),
+    ("서초역", 37.4837, 127.0324, ("2호선",)),
+    ("방배역", 37.4814, 126.9976, ("2호선",)),
+    ("서울대입구역", 37.4812, 126.9527, ("2호선",)),
+    ("신림역", 37.4842, 126.9298, ("2호선",)),
+    ("봉천역", 37.4823, 126.9414, ("2호선",)),
+    ("서울대벤처타운역", 37.4700, 126.9300, ()),
+    ("을지로입구역", 37.5660, 126.9826, ("2호선",)),
+    ("을지로3가역", 37.5663, 126.9919, ("2호선", "3호선")),
+    ("을지로4가역", 37.5666, 127.0010, ("2호선", "5호선")),
+    ("동대문역사문화공원역", 37.5656, 127.0089, ("2호선", "4호선", "5호선")),
+    ("충무로역", 37.5614, 126.9943, ("3호선", "4호선")),
+    ("신당역", 37.5656, 127.0195, ("2호선", "6호선")),
+    ("상왕십리역", 37.5644, 127.0294, ("2호선",)),
+    ("한남역", 37.5294, 127.0086, ()),
+    ("옥수역", 37.5406, 127.0174, ("3호선",)),
+    ("압구정역", 37.5273, 127.0285, ("3호선",)),
+    ("신사역", 37.5162, 127.0197, ("3호선",)),
+    ("강남역", 37.4981, 127.0276, ("2호선",)),
+    ("역삼역", 37.5001, 127.0364, ("2호선",)),
+    ("선릉역", 37.5045, 127.0489, ("2호선",)),
+    ("삼성역", 37.5088, 127.0630, ("2호선",)),
+    ("종합운동장역", 37.5113, 127.0738, ("2호선", "9호선")),
+    ("올림픽공원역", 37.5163, 127.1309, ("5호선", "9호선")),
+    ("방이역", 37.5087, 127.1264, ("5호선",)),
+    ("개롱역", 37.4947, 127.1348, ("5호선",)),
+    ("거여역", 37.4931, 127.1446, ("5호선",)),
+    ("마천역", 37.4950, 127.1528, ("5호선",)),
+    ("잠실나루역", 37.5206, 127.1037, ("2호선",)),
+    ("길동역", 37.5378, 127.1400, ("5호선",)),
+    ("굽은다리역", 37.5453, 127.1428, ("5호선",)),
+    ("명일역", 37.5519, 127.1439, ("5호선",)),
+    ("고덕역", 37.5550, 127.1541, ("5호선",)),
+    ("상일동역", 37.5567, 127.1658, ("5호선",)),
+    ("강일역", 37.5574, 127.1755, ("5호선",)),
+    ("둔촌동역", 37.5277, 127.1363, ("5호선",)),
+    ("홍대입구역", 37.5567, 126.9234, ("2호선",)),
+    ("합정역", 37.5496, 126.9139, ("2호선", "6호선")),
+    ("당산역", 37.5344, 126.9023, ("2호선", "9호선")),
+    ("영등포구청역", 37.5249, 126.8955, ("2호선", "5호선")),
+    ("문래역", 37.5179, 126.8947, ("2호선",)),
+    ("신도림역", 37.5087, 126.8912, ("1호선", "2호선")),
+    ("대림역", 37.4934, 126.8980, ("2호선", "7호선")),
+    ("구로디지털단지역", 37.4852, 126.9014, ("2호선",)),
+    ("신대방역", 37.4874, 126.9132, ("2호선",)),
+    ("낙성대역", 37.4767, 126.9630, ("2호선",)),
+    ("교대역", 37.4934, 127.0145, ("2호선", "3호선")),
+    ("대화역", 37.6761, 126.7876, ("3호선",)),
+    ("주엽역", 37.6701, 126.7613, ("3호선",)),
+    ("정발산역", 37.6594, 126.7730, ("3호선",)),
+    ("마두역", 37.6521, 126.7776, ("3호선",)),
+    ("백석역", 37.6431, 126.7879, ("3호선",)),
+    ("대곡역", 37.6316, 126.8110, ("3호선",)),
+    ("화정역", 37.6346, 126.8326, ("3호선",)),
+    ("원당역", 37.6532, 126.8431, ("3호선",)),
+    ("원흥역", 37.6507, 126.8726, ("3호선",)),
+    ("삼송역", 37.6531, 126.8956, ("3호선",)),
+    ("지축역", 37.6481, 126.9139, ("3호선",)),
+    ("구파발역", 37.6368, 126.9188, ("3호선",)),
+    ("연신내역", 37.6191, 126.9210, ("3호선", "6호선")),
+    ("불광역", 37.6102, 126.9298, ("3호선", "6호선")),
+    ("녹번역", 37.6009, 126.9357, ("3호선",)),
+    ("홍제역", 37.5890, 126.9438, ("3호선",)),
+    ("무악재역", 37.5822, 126.9501, ("3호선",)),
+    ("독립문역", 37.5745, 126.9578, ("3호선",)),
+    ("경복궁역", 37.5760, 126.9768, ("3호선",)),
+    ("안국역", 37.5765, 126.9854, ("3호선",)),
+    ("동대입구역", 37.5591, 127.0053, ("3호선",)),
+    ("약수역", 37.5543, 127.0106, ("3호선", "6호선")),
+    ("금호역", 37.5480, 127.0158, ("3호선",)),
+    ("당고개역", 37.6703, 127.0790, ("4호선",)),
+    ("상계역", 37.6608, 127.0735, ("4호선",)),
+    ("노원역", 37.6551, 127.0613, ("4호선", "7호선")),
+    ("창동역", 37.6531, 127.0476, ("1호선", "4호선")),
+    ("쌍문역", 37.6481, 127.0347, ("4호선",)),
+    ("수유역", 37.6378, 127.0255, ("4호선",)),
+    ("미아역", 37.6266, 127.0261, ("4호선",)),
+    ("미아사거리역", 37.6133, 127.0301, ("4호선",)),
+    ("길음역", 37.6034, 127.0253, ("4호선",)),
+    ("성신여대입구역", 37.5926, 127.0163, ("4호선",)),
+    ("한성대입구역", 37.5884, 127.0061, ("4호선",)),
+    ("혜화역", 37.5821, 126.9994, ("4호선",)),
+    ("명동역", 37.5636, 126.9826, ("4호선",)),
+    ("회현역", 37.5584, 126.9780, ("4호선",)),
+    ("숙대입구역", 37.5446, 126.9717, ("4호선",)),
+    ("삼각지역", 37.5341, 126.9731, ("4호선", "6호선")),
+    ("신용산역", 37.5291, 126.9679, ("4호선",)),
+    ("이촌역", 37.5223, 126.9743, ("4호선",)),
+    ("동작역", 37.4819, 126.9817, ("4호선", "9호선")),
+    ("총신대입구역", 37.4863, 126.9817, ("4호선", "7호선")),
+    ("남태령역", 37.4637, 126.9890, ("4호선",)),
+    ("선바위역", 37.4517, 126.9959, ("4호선",)),
+    ("경마공원역", 37.4439, 127.0079, ("4호선",)),
+    ("대공원역", 37.4356, 127.0065, ("4호선",)),
+    ("방화역", 37.5774, 126.8127, ("5호선",)),
+    ("개화산역", 37.5726, 126.8081, ("5호선",)),
+    ("김포공항역", 37.5623, 126.8011, ("5호선", "9호선")),
+    ("송정역", 37.5612, 126.8115, ("5호선",)),
+    ("마곡역", 37.5660, 126.8265, ("5호선",)),
+    ("발산역", 37.5519, 126.8365, ("5호선",)),
+    ("우장산역", 37.5486, 126.8363, ("5호선",)),
+    ("화곡역", 37.5415, 126.8404, ("5호선",)),
+    ("까치산역", 37.5322, 126.8461, ("5호선",)),
+    ("신정역", 37.5249, 126.8563, ("5호선",)),
+    ("목동역", 37.5261, 126.8649, ("5호선",)),
+    ("오목교역", 37.5244, 126.8753, ("5호선",)),
+    ("양평역", 37.5254, 126.8862, ("5호선",)),
+    ("영등포시장역", 37.5226, 126.9051, ("5호선",)),
+    ("신길역", 37.5174, 126.9174, ("1호선", "5호선")),
+    ("여의도역", 37.5212, 126.9242, ("5호선", "9호선")),
+    ("여의나루역", 37.5271, 126.9329, ("5호선",)),
+    ("마포역", 37.5396, 126.9456, ("5호선",)),
+    ("공덕역", 37.5446, 126.9515, ("5호선", "6호선")),
+    ("애오개역", 37.5527, 126.9565, ("5호선",)),
+    ("충정로역", 37.5599, 126.9634, ("2호선", "5호선")),
+    ("서대문역", 37.5658, 126.9666, ("5호선",)),
+    ("광화문역", 37.5714, 126.9764, ("5호선",)),
+    ("청구역", 37.5602, 127.0139, ("5호선", "6호선")),
+    ("신금호역", 37.5555, 127.0200, ("5호선",)),
+    ("행당역", 37.5573, 127.0297, ("5호선",)),
+    ("마장역", 37.5661, 127.0429, ("5호선",)),
+    ("답십리역", 37.5667, 127.0527, ("5호선",)),
+    ("장한평역", 37.5614, 127.0646, ("5호선",)),
+    ("군자역", 37.5571, 127.0795, ("5호선", "7호선")),
+    ("아차산역", 37.5517, 127.0896, ("5호선",)),
+    ("미사역", 37.5623, 127.1929, ("5호선",)),
+    ("응암역", 37.5985, 126.9156, ("6호선",)),
+    ("역촌역", 37.6061, 126.9227, ("6호선",)),
+    ("독바위역", 37.6186, 126.9331, ("6호선",)),
+    ("구산역", 37.6104, 126.9176, ("6호선",)),
+    ("새절역", 37.5911, 126.9136, ("6호선",)),
+    ("증산역", 37.5838, 126.9096, ("6호선",)),
+    ("디지털미디어시티역", 37.5762, 126.9013, ("6호선",)),
+    ("월드컵경기장역", 37.5683, 126.8973, ("6호선",)),
+    ("마포구청역", 37.5632, 126.9034, ("6호선",)),
+    ("망원역", 37.5560, 126.9100, ("6호선",)),
+    ("상수역", 37.5477, 126.9225, ("6호선",)),
+    ("광흥창역", 37.5474, 126.9319, ("6호선",)),
+    ("대흥역", 37.5477, 126.9420, ("6호선",)),
+    ("효창공원앞역", 37.5393, 126.9613, ("6호선",)),
+    ("녹사평역", 37.5347, 126.9865, ("6호선",)),
+    ("이태원역", 37.5345, 126.9943, ("6호선",)),
+    ("한강진역", 37.5395, 127.0012, ("6호선",)),
+    ("버티고개역", 37.5480, 127.0069, ("6호선",)),
+    ("동묘앞역", 37.5726, 127.0164, ("1호선", "6호선")),
+    ("창신역", 37.5797, 127.0152, ("6호선",)),
+    ("보문역", 37.5852, 127.0194, ("6호선",)),
+    ("안암역", 37.5863, 127.0291, ("6호선",)),
+    ("고려대역", 37.5905, 127.0363, ("6호선",)),
+    ("월곡역", 37.6019, 127.0415, ("6호선",)),
+    ("상월곡역", 37.6063, 127.0485, ("6호선",)),
+    ("돌곶이역", 37.6105, 127.0564, ("6호선",)),
+    ("석계역", 37.6148, 127.0658, ("1호선", "6호선")),
+    ("태릉입구역", 37.6179, 127.0751, ("6호선", "7호선")),
+    ("화랑대역", 37.6200, 127.0848, ("6호선",)),
+    ("봉화산역", 37.6173, 127.0914, ("6호선",)),
+    ("장암역", 37.7009, 127.0532, ("7호선",)),
+    ("도봉산역", 37.6896, 127.0462, ("1호선", "7호선")),
+    ("수락산역", 37.6779, 127.0553, ("7호선",)),
+    ("마들역", 37.6649, 127.0572, ("7호선",)),
+    ("중계역", 37.6448, 127.0643, ("7호선",)),
+    ("하계역", 37.6363, 127.0679, ("7호선",)),
+    ("공릉역", 37.6257, 127.0729, ("7호선",)),
+    ("먹골역", 37.6107, 127.0776, ("7호선",)),
+    ("중화역", 37.6025, 127.0793, ("7호선",)),
+    ("상봉역", 37.5963, 127.0850, ("7호선",)),
+    ("면목역", 37.5886, 127.0875, ("7호선",)),
+    ("사가정역", 37.5809, 127.0874, ("7호선",)),
+    ("용마산역", 37.5730, 127.0867, ("7호선",)),
+    ("중곡역", 37.5658, 127.0845, ("7호선",)),
+    ("어린이대공원역", 37.5480, 127.0746, ("7호선",)),
+    ("뚝섬유원지역", 37.5319, 127.0647, ("7호선",)),
+    ("청담역", 37.5194, 127.0473, ("7호선",)),
+    ("강남구청역", 37.5172, 127.0413, ("7호선",)),
+    ("학동역", 37.5142, 127.0316, ("7호선",)),
+    ("논현역", 37.5074, 127.0214, ("7호선",)),
+    ("반포역", 37.5081, 127.0115, ("7호선",)),
+    ("고속터미널역", 37.5047, 127.0051, ("3호선", "7호선", "9호선")),
+    ("내방역", 37.4876, 127.0154, ("7호선",)),
+    ("남성역", 37.4846, 126.9714, ("7호선",)),
+    ("숭실대입구역", 37.4960, 126.9534, ("7호선",)),
+    ("상도역", 37.5028, 126.9479, ("7호선",)),
+    ("장승배기역", 37.5049, 126.9391, ("7호선",)),
+    ("신대방삼거리역", 37.4997, 126.9281, ("7호선",)),
+    ("보라매역", 37.4999, 126.9204, ("7호선",)),
+    ("신풍역", 37.5001, 126.9099, ("7호선",)),
+    ("남구로역", 37.4850, 126.8875, ("7호선",)),
+    ("가산디지털단지역", 37.4812, 126.8826, ("1호선", "7호선")),
+    ("철산역", 37.4760, 126.8679, ("7호선",)),
+    ("광명사거리역", 37.4793, 126.8549, ("7호선",)),
+    ("천왕역", 37.4867, 126.8387, ("7호선",)),
+    ("온수역", 37.4923, 126.8240, ("1호선", "7호선")),
+    ("까치울역", 37.5062, 126.8109, ("7호선",)),
+    ("부천종합운동장역", 37.5053, 126.7973, ("7호선",)),
+    ("춘의역", 37.5037, 126.7870, ("7호선",)),
+    ("신중동역", 37.5031, 126.7759, ("7호선",)),
+    ("부천시청역", 37.5047, 126.7635, ("7호선",)),
+    ("상동역", 37.5058, 126.7530, ("7호선",)),
+    ("삼산체육관역", 37.5064, 126.7398, ("7호선",)),
+    ("굴포천역", 37.5067, 126.7312, ("7호선",)),
+    ("부평구청역", 37.5087, 126.7225, ("7호선",)),
+    ("산곡역", 37.5087, 126.7079, ("7호선",)),
+    ("석남역", 37.5061, 126.8110, ("7호선",)),
+    ("암사역", 37.5502, 127.1276, ("8호선",)),
+    ("몽촌토성역", 37.5173, 127.1123, ("8호선",)),
+    ("석촌역", 37.5051, 127.1069, ("8호선", "9호선")),
+    ("문정역", 37.4859, 127.1225, ("8호선",)),
+    ("장지역", 37.4786, 127.1267, ("8호선",)),
+    ("산성역", 37.4570, 127.1499, ("8호선",)),
+    ("남한산성입구역", 37.4516, 127.1598, ("8호선",)),
+    ("단대오거리역", 37.4452, 127.1569, ("8호선",)),
+    ("신흥역", 37.4405, 127.1476, ("8호선",)),
+    ("수진역", 37.4374, 127.1407, ("8호선",)),
+    ("모란역", 37.4340, 127.1298, ("8호선",)),
+    ("개화역", 37.5784, 126.7981, ("9호선",)),
+    ("공항시장역", 37.5634, 126.8106, ("9호선",)),
+    ("신방화역", 37.5674, 126.8166, ("9호선",)),
+    ("마곡나루역", 37.5669, 126.8270, ("9호선",)),
+    ("양천향교역", 37.5683, 126.8413, ("9호선",)),
+    ("가양역", 37.5615, 126.8546, ("9호선",)),
+    ("증미역", 37.5574, 126.8616, ("9호선",)),
+    ("등촌역", 37.5506, 126.8658, ("9호선",)),
+    ("염창역", 37.5469, 126.8747, ("9호선",)),
+    ("신목동역", 37.5447, 126.8831, ("9호선",)),
+    ("선유도역", 37.5380, 126.8935, ("9호선",)),
+    ("국회의사당역", 37.5281, 126.9178, ("9호선",)),
+    ("샛강역", 37.5174, 126.9284, ("9호선",)),
+    ("노량진역", 37.5134, 126.9424, ("1호선", "9호선")),
+    ("노들역", 37.5128, 126.9532, ("9호선",)),
+    ("흑석역", 37.5087, 126.9638, ("9호선",)),
+    ("구반포역", 37.5014, 126.9952, ("9호선",)),
+    ("신반포역", 37.5037, 127.0034, ("9호선",)),
+    ("사평역", 37.5042, 127.0150, ("9호선",)),
+    ("신논현역", 37.5046, 127.0254, ("9호선",)),
+    ("언주역", 37.5074, 127.0339, ("9호선",)),
+    ("선정릉역", 37.5049, 127.0489, ("9호선",)),
+    ("삼성중앙역", 37.5130, 127.0538, ("9호선",)),
+    ("봉은사역", 37.5142, 127.0585, ("9호선",)),
+    ("한성백제역", 37.5163, 127.1163, ("9호선",)),
+    ("둔촌오륜역", 37.5192, 127.1388, ("9호선",)),
+    ("중앙보훈병원역", 37.5284, 127.1484, ("9호선",)),
+)
+
+
+class StationRecord(NamedTuple):
+    """지하철역 레코드"""
+    id: int
+    name: str
+    lat: float
+    lon: float
+    lines: Tuple[str, ...]
+
+
+class StationTable:
+    """역 ID 순서 배열로 보관하는 지하철역 표 (이름 → ID, 노선 → 역 ID 인덱스)"""
+
+    def __init__(self, rows: Tuple[Tuple[str, float, float, Tuple[str, ...]], ...]):
+        """
+        Args:
+            rows: ((역 이름, 위도, 경도, (노선, ...)), ...) - 역 ID는 이 순서
+        """
+        names = [row[0] for row in rows]
+        self.names = np.array(names, dtype=object)
+        self.lats = np.ascontiguousarray([row[1] for row in rows], dtype=np.float64)
+        self.lons = np.ascontiguousarray([row[2] for row in rows], dtype=np.float64)
+        self._name_index: Dict[str, int] = {name: station_id for station_id, name in enumerate(names)}
+        if len(self._name_index) != len(names):
+            raise ValueError("역 이름이 중복되었습니다.")
+
+        # 노선 (호선 번호순) → 역 ID 배열 (역 ID 순서)
+        self.lines = sorted({line for row in rows for line in row[3]}, key=lambda line: (len(line), line))
+        line_members: Dict[str, list] = {line: [] for line in self.lines}
+        for station_id, row in enumerate(rows):
+            for line in row[3]:
+                line_members[line].append(station_id)
+        self._line_ids = {line: np.array(members, dtype=np.int32) for line, members in line_members.items()}
+
+        # 역별 노선 코드 (CSR: _line_codes[_line_offsets[i]:_line_offsets[i + 1]])
+        station_lines = [[] for _ in names]
+        for code, line in enumerate(self.lines):
+            for station_id in self._line_ids[line]:
+                station_lines[station_id].append(code)
+        self._line_offsets = np.cumsum([0] + [len(codes) for codes in station_lines])
+        self._line_codes = np.array([code for codes in station_lines for code in codes], dtype=np.int16)
+
+        # 프로세스 안에서 공유하는 배열이므로 읽기 전용
+        for array in (self.names, self.lats, self.lons, self._line_offsets, self._line_codes, *self._line_ids.values()):
+            array.setflags(write=False)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._name_index
+
+    def id_of(self, name: str) -> Optional[int]:
+        """역 이름 → 역 ID (없으면 None)"""
+        return self._name_index.get(name)
+
+    def lines_of(self, station_id: int) -> Tuple[str, ...]:
+        """역이 속한 노선 (호선 번호순, 1~9호선 외 노선만 다니는 역은 빈 튜플)"""
+        codes = self._line_codes[self._line_offsets[station_id]:self._line_offsets[station_id + 1]]
+        return tuple(self.lines[code] for code in codes)
+
+    def record(self, station_id: int) -> StationRecord:
+        """역 ID → 레코드"""
+        return StationRecord(
+            station_id,
+            self.names[station_id],
+            float(self.lats[station_id]),
+            float(self.lons[station_id]),
+            self.lines_of(station_id),
+        )
+
+    def get(self, name: str) -> Optional[StationRecord]:
+        """역 이름 → 레코드 (없으면 None)"""
+        station_id = self.id_of(name)
+        return None if station_id is None else self.record(station_id)
+
+    def line_ids(self, line: str) -> np.ndarray:
+        """노선의 역 ID 배열 (역 ID 순서, 없는 노선은 빈 배열)"""
+        return self._line_ids.get(line, np.empty(0, dtype=np.int32))
+
+
+# 지하철역 표 (import 시 1회 생성)
+STATIONS = StationTable(_STATION_ROWS)
+
+# 역 이름 → (위도, 경도) (이전 형식 호환)
+SUBWAY_STATIONS = {name: (float(lat), float(lon)) for name, lat, lon in zip(STATIONS.names, STATIONS.lats, STATIONS.lons)}
@@ -0,0 +1,32 @@
+"""
+테스트 공통 설정
+저장소 루트 모듈을 import할 수 있도록 경로를 추가하고, 저장된 메타데이터 CSV를 원본 API 응답 형식으로 되돌린 데이터를 제공합니다.
+"""
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+METADATA_CSV = os.path.join(ROOT, "seoul_apartments_metadata.csv")
+
+
+@pytest.fixture(scope="session")
+def raw_apartment_info() -> pd.DataFrame:
+    """seoul_apartments_metadata.csv의 원본_* 컬럼 → OpenAptInfo 응답 컬럼"""
+    if not os.path.exists(METADATA_CSV):
+        pytest.skip("seoul_apartments_metadata.csv가 없습니다.")
+    df = pd.read_csv(METADATA_CSV)
+    raw_columns = [col for col in df.columns if col.startswith("원본_")]
+    return df[raw_columns].rename(columns=lambda col: col[len("원본_"):])
+
+
+@pytest.fixture
+def crawler():
+    from crawler import SeoulApartmentCrawler
+
+    return SeoulApartmentCrawler()
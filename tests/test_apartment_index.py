@@ -0,0 +1,91 @@
+"""
+ApartmentSpatialIndex 테스트 (전수 haversine 계산과 비교)
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from apartment_index import ApartmentSpatialIndex
+from utils import haversine_km
+
+
+@pytest.fixture(scope="module")
+def frame():
+    rng = np.random.default_rng(21)
+    n = 400
+    lats = rng.uniform(37.45, 37.65, n)
+    lons = rng.uniform(126.9, 127.1, n)
+    lats[[3, 50]] = np.nan
+    lons[[7]] = np.nan
+    lats[[11]], lons[[11]] = 0, 0
+    lons[[12]] = 0
+    return pd.DataFrame({"위도": lats, "경도": lons})
+
+
+def _valid(frame):
+    lats, lons = frame["위도"].to_numpy(), frame["경도"].to_numpy()
+    return np.isfinite(lats) & np.isfinite(lons) & (lats != 0) & (lons != 0)
+
+
+def _distances(frame, lat, lon):
+    distances = haversine_km(frame["위도"].to_numpy(), frame["경도"].to_numpy(), lat, lon)
+    return np.where(_valid(frame), distances, np.inf)
+
+
+def test_excludes_missing_and_zero_coordinates(frame):
+    index = ApartmentSpatialIndex(frame)
+    assert len(index) == int(_valid(frame).sum()) == len(frame) - 5
+    for pos in (3, 7, 11, 12, 50):
+        assert pos not in set(index.positions)
+
+
+@pytest.mark.parametrize("km", [0.3, 1.0, 5.0])
+def test_within_radius_matches_brute_force(frame, km):
+    index = ApartmentSpatialIndex(frame)
+    rng = np.random.default_rng(int(km * 10))
+    for lat, lon in zip(rng.uniform(37.45, 37.65, 20), rng.uniform(126.9, 127.1, 20)):
+        distances = _distances(frame, lat, lon)
+        result = index.within_radius(lat, lon, km)
+        # 반경 경계에서 부동소수점 오차로 갈릴 수 있는 점은 비교에서 제외
+        boundary = np.abs(distances - km) < 1e-9
+        assert set(result) - set(np.flatnonzero(boundary)) == set(np.flatnonzero((distances <= km) & ~boundary))
+        assert list(result) == sorted(result)
+
+
+def test_within_bbox_matches_brute_force(frame):
+    index = ApartmentSpatialIndex(frame)
+    lats, lons = frame["위도"].to_numpy(), frame["경도"].to_numpy()
+    for south, west, north, east in [
+        (37.5, 126.95, 37.6, 127.05),
+        (37.45, 126.9, 37.65, 127.1),
+        (37.55, 127.0, 37.55, 127.0),
+        (35.0, 129.0, 35.2, 129.2),  # 점이 하나도 없는 영역
+        (-1.0, -1.0, 1.0, 1.0),  # (0, 0) 좌표 행은 제외
+    ]:
+        with np.errstate(invalid="ignore"):
+            expected = np.flatnonzero(_valid(frame) & (lats >= south) & (lats <= north) & (lons >= west) & (lons <= east))
+        assert list(index.within_bbox(south, west, north, east)) == list(expected)
+    assert len(index.within_bbox(35.0, 129.0, 35.2, 129.2)) == 0
+
+
+@pytest.mark.parametrize("k", [1, 5, 1000])
+def test_k_nearest_matches_brute_force(frame, k):
+    index = ApartmentSpatialIndex(frame)
+    lat, lon = 37.55, 127.0
+    positions, distances = index.k_nearest(lat, lon, k)
+    brute = _distances(frame, lat, lon)
+    expected = np.argsort(brute, kind="stable")[:min(k, len(index))]
+
+    assert len(positions) == len(expected)
+    assert set(positions) == set(expected)
+    np.testing.assert_allclose(distances, brute[expected], rtol=0, atol=1e-9)
+    assert np.all(np.diff(distances) >= 0)
+
+
+def test_empty_index():
+    index = ApartmentSpatialIndex(pd.DataFrame({"위도": [np.nan, 0.0], "경도": [127.0, 127.0]}))
+    assert len(index) == 0
+    assert len(index.within_radius(37.5, 127.0, 1.0)) == 0
+    assert len(index.within_bbox(37.0, 126.0, 38.0, 128.0)) == 0
+    positions, distances = index.k_nearest(37.5, 127.0, 3)
+    assert len(positions) == len(distances) == 0
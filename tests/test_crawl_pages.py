@@ -0,0 +1,118 @@
+"""
+_crawl_all_pages 페이지 범위 계산/재조립 테스트 (_fetch_seoul_page 스텁)
+"""
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from config import SEOUL_API_DAILY_QUOTA, SEOUL_API_PAGE_SIZE
+
+
+@pytest.fixture
+def paged_crawler(crawler):
+    """전체 total건을 인덱스 순서로 돌려주는 스텁 (뒤 페이지일수록 먼저 응답)"""
+    state = {"total": 0, "calls": [], "completed": [], "fail": set(), "report_total": True}
+    lock = threading.Lock()
+
+    def fake_fetch(service_name, start_index, end_index, label, unit):
+        with lock:
+            state["calls"].append((start_index, end_index))
+        if start_index > 1:
+            time.sleep(max(0.0, 0.05 - start_index / 100000))
+        end = min(end_index, state["total"])
+        if (start_index, end_index) in state["fail"] or start_index > end:
+            df = pd.DataFrame()
+        else:
+            df = pd.DataFrame({"IDX": range(start_index, end + 1)})
+        with lock:
+            state["completed"].append(start_index)
+        return df, state["total"] if state["report_total"] else 0
+
+    crawler._fetch_seoul_page = fake_fetch
+    crawler.state = state
+    return crawler
+
+
+def _indexes(pages):
+    return pd.concat(pages, ignore_index=True)["IDX"].tolist() if pages else []
+
+
+def _fetch(crawler):
+    return lambda start, end: crawler._fetch_seoul_page("OpenAptInfo", start, end, "테스트", "건")
+
+
+def test_pages_reassembled_in_index_order(paged_crawler):
+    paged_crawler.state["total"] = 3500
+    pages = paged_crawler._crawl_all_pages(_fetch(paged_crawler), max_records=10000, concurrent=True)
+
+    assert _indexes(pages) == list(range(1, 3501))
+    assert paged_crawler.last_total_count == 3500
+    assert sorted(paged_crawler.state["calls"]) == [(1, 1000), (1001, 2000), (2001, 3000), (3001, 3500)]
+    # 실제로 뒤 페이지가 먼저 도착했어야 순서 재조립을 검증한 것
+    assert paged_crawler.state["completed"][1:] != sorted(paged_crawler.state["completed"][1:])
+
+
+def test_max_records_caps_last_page(paged_crawler):
+    paged_crawler.state["total"] = 3500
+    pages = paged_crawler._crawl_all_pages(_fetch(paged_crawler), max_records=2500)
+
+    assert _indexes(pages) == list(range(1, 2501))
+    assert sorted(paged_crawler.state["calls"]) == [(1, 1000), (1001, 2000), (2001, 2500)]
+
+
+@pytest.mark.parametrize("total, max_records, expected_calls", [
+    (1000, 10000, [(1, 1000)]),
+    (2000, 10000, [(1, 1000), (1001, 2000)]),
+    (2001, 10000, [(1, 1000), (1001, 2000), (2001, 2001)]),
+    (5000, 700, [(1, 700)]),
+    (300, 10000, [(1, 1000)]),
+])
+def test_page_ranges_from_total_count(paged_crawler, total, max_records, expected_calls):
+    paged_crawler.state["total"] = total
+    pages = paged_crawler._crawl_all_pages(_fetch(paged_crawler), max_records=max_records)
+
+    assert sorted(paged_crawler.state["calls"]) == expected_calls
+    assert _indexes(pages) == list(range(1, min(total, max_records) + 1))
+
+
+def test_failed_page_skipped_others_in_order(paged_crawler):
+    paged_crawler.state["total"] = 4000
+    paged_crawler.state["fail"] = {(2001, 3000)}
+    pages = paged_crawler._crawl_all_pages(_fetch(paged_crawler), max_records=10000)
+
+    assert _indexes(pages) == [*range(1, 2001), *range(3001, 4001)]
+
+
+def test_remaining_quota_limits_pages(paged_crawler):
+    paged_crawler.state["total"] = 5000
+    paged_crawler.request_count = SEOUL_API_DAILY_QUOTA - 2
+    pages = paged_crawler._crawl_all_pages(_fetch(paged_crawler), max_records=10000)
+
+    assert sorted(paged_crawler.state["calls"]) == [(1, 1000), (1001, 2000), (2001, 3000)]
+    assert _indexes(pages) == list(range(1, 3001))
+
+
+def test_sequential_matches_concurrent(paged_crawler):
+    paged_crawler.state["total"] = 3500
+    pages = paged_crawler._crawl_all_pages(_fetch(paged_crawler), max_records=10000, concurrent=False)
+
+    assert _indexes(pages) == list(range(1, 3501))
+    assert paged_crawler.state["calls"] == [(1, 1000), (1001, 2000), (2001, 3000), (3001, 3500)]
+
+
+def test_unknown_total_reads_until_short_page(paged_crawler):
+    paged_crawler.state["total"] = 2 * SEOUL_API_PAGE_SIZE + 10
+    paged_crawler.state["report_total"] = False
+    pages = paged_crawler._crawl_all_pages(_fetch(paged_crawler), max_records=10000)
+
+    assert _indexes(pages) == list(range(1, 2 * SEOUL_API_PAGE_SIZE + 11))
+    assert paged_crawler.state["calls"] == [(1, 1000), (1001, 2000), (2001, 3000)]
+
+
+def test_crawl_all_concatenates_in_order(paged_crawler):
+    paged_crawler.state["total"] = 2500
+    df = paged_crawler.crawl_seoul_apartment_info_all(max_records=10000)
+
+    assert df["IDX"].tolist() == list(range(1, 2501))
@@ -0,0 +1,38 @@
+"""
+목록 탭 다운로드 캐시 테스트
+"""
+import numpy as np
+import pandas as pd
+
+from export import ExportCache, export_cache_key
+
+
+def test_builder_runs_only_on_miss():
+    cache = ExportCache(max_entries=2)
+    calls = []
+
+    def build():
+        calls.append(1)
+        return pd.DataFrame({"아파트명": ["a", "b"]})
+
+    first = cache.get_or_build("key", build, "csv")
+    second = cache.get_or_build("key", build, "csv")
+    assert first == second
+    assert len(calls) == 1
+
+    cache.get_or_build("key", build, "csv.gz")
+    assert len(calls) == 2
+
+
+def test_accepts_dataframe():
+    cache = ExportCache(max_entries=2)
+    payload = cache.get_or_build("key", pd.DataFrame({"아파트명": ["a"]}), "csv")
+    assert "아파트명".encode("utf-8") in payload
+
+
+def test_export_key_depends_on_dataset_and_order():
+    positions = np.array([3, 1, 2])
+    key = export_cache_key(positions, "v1")
+    assert key == export_cache_key([3, 1, 2], "v1")
+    assert key != export_cache_key(positions, "v2")
+    assert key != export_cache_key(np.sort(positions), "v1")
@@ -0,0 +1,164 @@
+"""
+FilterEngine / FacetTable 테스트 (이전 불리언 마스크 필터와 비교)
+"""
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataset_schema import apply_schema
+from filter_engine import FacetTable, FilterEngine
+
+ALL = "전체"
+
+
+def _hand_built() -> pd.DataFrame:
+    """자치구 두 곳에 같은 동 이름, 숫자 결측, 빈 문자열/결측 범주가 섞인 데이터"""
+    return pd.DataFrame({
+        "자치구": ["강남구", "강남구", "강남구", "관악구", "관악구", "마포구", None, "", "마포구"],
+        "동": ["신사동", "역삼동", None, "신사동", "봉천동", "", "합정동", "합정동", "합정동"],
+        "건축연도": [1990, np.nan, 2005, 1985, 2020, 2001, 1999, np.nan, 2010],
+        "세대수": [300, 1200, np.nan, 50, 800, 450, 100, 700, np.nan],
+        "복도계단식": ["계단식", "복도식", None, "계단식", "", "혼합식", "계단식", None, "복도식"],
+        "가장가까운지하철역": ["신사역", "역삼역", "역삼역", None, "봉천역", "합정역", " ", "합정역", "합정역"],
+        "지하철역거리_km": [0.3, 0.8, np.nan, 1.5, 0.2, np.nan, 0.4, 0.9, 2.0],
+    })
+
+
+@pytest.fixture(scope="module")
+def metadata_frame(raw_apartment_info):
+    from conftest import METADATA_CSV
+    from utils import extract_dong
+
+    df = pd.read_csv(METADATA_CSV)
+    df["동"] = df["주소"].apply(extract_dong)
+    return df
+
+
+def _mask_filter(df, district, dong, year_range, household_range, hallway, distance_range, subway):
+    """이전 사이드바 필터 (df.copy() 후 마스크 연쇄, 범위 None이면 해당 슬라이더 없음)"""
+    filtered = df.copy()
+    if district != ALL:
+        filtered = filtered[filtered["자치구"] == district]
+    if dong != ALL:
+        filtered = filtered[filtered["동"] == dong]
+    for col, bounds in (("건축연도", year_range), ("세대수", household_range), ("지하철역거리_km", distance_range)):
+        if bounds is not None:
+            filtered = filtered[filtered[col].notna() & (filtered[col] >= bounds[0]) & (filtered[col] <= bounds[1])]
+    if hallway != ALL:
+        filtered = filtered[filtered["복도계단식"] == hallway]
+    if subway != ALL:
+        filtered = filtered[filtered["가장가까운지하철역"] == subway]
+    return filtered
+
+
+def _engine_filter(engine, district, dong, year_range, household_range, hallway, distance_range, subway):
+    def value(selected):
+        return selected if selected != ALL else None
+
+    return engine.positions(
+        equals={"자치구": value(district), "동": value(dong), "복도계단식": value(hallway), "가장가까운지하철역": value(subway)},
+        ranges={"건축연도": year_range, "세대수": household_range, "지하철역거리_km": distance_range},
+    )
+
+
+def _reference_facet(df, district, dong):
+    """이전 사이드바의 연쇄 옵션/슬라이더 범위 계산"""
+    if district != ALL:
+        base = df[df["자치구"] == district]
+        if dong != ALL:
+            base = base[base["동"] == dong]
+    else:
+        base = df.copy()
+
+    def value_range(col):
+        data = base[col].dropna()
+        return (float(data.min()), float(data.max())) if len(data) > 0 else None
+
+    return {
+        "복도계단식": sorted(str(x) for x in base["복도계단식"].dropna().unique().tolist() if pd.notna(x)),
+        "가장가까운지하철역": sorted(
+            str(x) for x in base["가장가까운지하철역"].dropna().unique().tolist() if pd.notna(x) and str(x).strip()
+        ),
+        "건축연도": value_range("건축연도"),
+        "세대수": value_range("세대수"),
+        "지하철역거리_km": value_range("지하철역거리_km"),
+    }
+
+
+def _option_values(df, col):
+    return [ALL] + sorted(str(x) for x in df[col].dropna().unique().tolist() if str(x).strip())
+
+
+@pytest.mark.parametrize("with_schema", [False, True])
+def test_hand_built_combinations_match_masks(with_schema):
+    df = _hand_built()
+    engine = FilterEngine(apply_schema(df) if with_schema else df)
+    range_sets = [(None, None, None), ((1990, 2010), (100, 800), (0.3, 0.9)), ((1999, 1999), None, (0.9, 2.0))]
+    for district, dong, (year_range, household_range, distance_range), hallway, subway in itertools.product(
+        _option_values(df, "자치구") + ["없는구"],
+        _option_values(df, "동"),
+        range_sets,
+        [ALL, "계단식", ""],
+        [ALL, "합정역"],
+    ):
+        args = (district, dong, year_range, household_range, hallway, distance_range, subway)
+        expected = _mask_filter(df, *args)
+        assert list(_engine_filter(engine, *args)) == list(expected.index), args
+
+
+def test_empty_range_and_single_value_range():
+    df = _hand_built()
+    engine = FilterEngine(df)
+    assert len(_engine_filter(engine, ALL, ALL, (3000, 4000), None, ALL, None, ALL)) == 0
+    assert list(_engine_filter(engine, ALL, ALL, (2005, 2005), None, ALL, None, ALL)) == [2]
+
+
+def test_metadata_random_combinations_match_masks(metadata_frame):
+    df = metadata_frame
+    engine = FilterEngine(apply_schema(df))
+    rng = np.random.default_rng(5)
+    districts = _option_values(df, "자치구")
+    for _ in range(150):
+        district = districts[rng.integers(len(districts))]
+        base = df if district == ALL else df[df["자치구"] == district]
+        dongs = _option_values(base, "동")
+        dong = dongs[rng.integers(len(dongs))] if rng.random() < 0.7 else ALL
+        hallways = _option_values(df, "복도계단식")
+        subways = _option_values(base, "가장가까운지하철역")
+
+        def random_range(col, integer):
+            if rng.random() < 0.3:
+                return None
+            low, high = np.sort(rng.choice(df[col].dropna().to_numpy(), 2))
+            return (int(low), int(high)) if integer else (float(low), float(high))
+
+        args = (
+            district,
+            dong,
+            random_range("건축연도", True),
+            random_range("세대수", True),
+            hallways[rng.integers(len(hallways))] if rng.random() < 0.3 else ALL,
+            random_range("지하철역거리_km", False),
+            subways[rng.integers(len(subways))] if rng.random() < 0.3 else ALL,
+        )
+        expected = _mask_filter(df, *args)
+        assert list(_engine_filter(engine, *args)) == list(expected.index), args
+
+
+@pytest.mark.parametrize("source", ["hand_built", "metadata"])
+def test_facet_table_matches_cascading_options(source, request):
+    df = _hand_built() if source == "hand_built" else request.getfixturevalue("metadata_frame")
+    table = FacetTable(FilterEngine(apply_schema(df)))
+
+    assert [ALL] + table.districts == _option_values(df, "자치구")
+    assert [ALL] + table.dongs(ALL) == _option_values(df, "동")
+    for district in table.districts:
+        district_df = df[df["자치구"] == district]
+        assert [ALL] + table.dongs(district) == _option_values(district_df, "동")
+        for dong in [ALL] + table.dongs(district):
+            assert table.get(district, dong) == _reference_facet(df, district, dong), (district, dong)
+    # 자치구가 "전체"면 동 선택과 무관하게 전체 범위
+    assert table.get(ALL, ALL) == _reference_facet(df, ALL, ALL)
+    assert table.get(ALL, table.dongs(ALL)[0]) == _reference_facet(df, ALL, ALL)
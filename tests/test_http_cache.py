@@ -0,0 +1,151 @@
+"""
+Open API 응답 캐시 테스트
+캐시를 API 대신 사용해 크롤러의 페이지 수집을 네트워크 없이 검증합니다.
+"""
+import os
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from http_cache import ResponseCache
+
+SERVICE = "OpenAptInfo"
+
+
+def _page(rows, total):
+    return {SERVICE: {"list_total_count": total, "row": rows}}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(str(tmp_path / "http"), ttl_seconds=60, max_bytes=10 * 1024 * 1024)
+
+
+@pytest.fixture
+def cached_crawler(crawler, cache, raw_apartment_info):
+    """저장된 메타데이터 원본 컬럼을 1,000건 단위 페이지로 캐시에 넣은 크롤러 (API 호출은 실패하도록)"""
+    rows = raw_apartment_info.astype(object).where(raw_apartment_info.notna(), None).to_dict("records")
+    for start in range(0, len(rows), 1000):
+        page = rows[start:start + 1000]
+        cache.set(ResponseCache.make_key(SERVICE, start + 1, start + len(page)), _page(page, len(rows)))
+    crawler.response_cache = cache
+    crawler.seoul_api_key = "TEST_KEY"
+
+    def fail(url, **kwargs):
+        raise AssertionError(f"API 호출 없이 캐시만 사용해야 합니다: {url}")
+
+    crawler._http_get = fail
+    return crawler
+
+
+def test_key_excludes_api_key(cache):
+    key = ResponseCache.make_key(SERVICE, 1, 1000)
+    assert key == "OpenAptInfo/1/1000"
+    cache.set(key, _page([{"APT_CD": "A1"}], 1))
+    assert cache.get(key) == _page([{"APT_CD": "A1"}], 1)
+    assert all(name.startswith(f"{SERVICE}-") and name.endswith(".json.gz") for name in os.listdir(cache.cache_dir))
+
+
+def test_ttl_and_offline(cache):
+    key = ResponseCache.make_key(SERVICE, 1, 1000)
+    cache.set(key, _page([], 0))
+    path = cache._path(key)
+    old = time.time() - 120
+    os.utime(path, (old, old))
+    assert cache.get(key) is None
+    assert cache.get(key, allow_expired=True) == _page([], 0)
+
+
+def test_lru_eviction(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl_seconds=0, max_bytes=1)
+    cache.set("OpenAptInfo/1/1000", _page([{"APT_CD": "A1"}], 1))
+    cache.set("OpenAptInfo/1001/2000", _page([{"APT_CD": "A2"}], 1))
+    assert cache.stats()["entries"] <= 1
+
+
+def test_counters_are_thread_safe(cache):
+    cache.set("OpenAptInfo/1/1000", _page([], 0))
+
+    def work():
+        for _ in range(200):
+            cache.get("OpenAptInfo/1/1000")
+            cache.get("OpenAptInfo/1001/2000")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = cache.stats()
+    assert stats["hits"] == 1600
+    assert stats["misses"] == 1600
+
+
+def test_crawl_from_cache(cached_crawler, raw_apartment_info):
+    """캐시를 API 대신 사용한 전체 수집 (동시 요청 포함)"""
+    df = cached_crawler.crawl_seoul_apartment_info_all(max_records=len(raw_apartment_info), concurrent=True)
+    assert len(df) == len(raw_apartment_info)
+    assert list(df["APT_CD"]) == list(raw_apartment_info["APT_CD"])
+    assert cached_crawler.request_count == 0
+
+
+def test_offline_mode_uses_expired_entries(cached_crawler, cache, raw_apartment_info):
+    old = time.time() - 3600
+    for name in os.listdir(cache.cache_dir):
+        os.utime(os.path.join(cache.cache_dir, name), (old, old))
+    cached_crawler.offline = True
+    df = cached_crawler.crawl_seoul_apartment_info_all(max_records=len(raw_apartment_info))
+    assert len(df) == len(raw_apartment_info)
+
+
+class _FakeResponse:
+    status_code = 200
+
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+def test_revalidate_bypasses_cache(cached_crawler, cache):
+    """새로고침/동기화(revalidate_cache)는 캐시를 읽지 않고 API 응답으로 캐시를 갱신"""
+    fresh = _page([{"APT_CD": "NEW"}], 1)
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        return _FakeResponse(fresh)
+
+    cached_crawler._http_get = fake_get
+    cached_crawler.rate_limiter.wait = lambda: None
+    cached_crawler.revalidate_cache = True
+    df = cached_crawler.crawl_seoul_apartment_info(1, 1000)
+    assert len(calls) == 1
+    assert list(df["APT_CD"]) == ["NEW"]
+    assert cache.get(ResponseCache.make_key(SERVICE, 1, 1000)) == fresh
+
+
+def test_sync_revalidates_listing(cached_crawler, raw_apartment_info):
+    """증분 동기화는 캐시된 목록을 재사용하지 않음"""
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        return _FakeResponse(_page([], 0))
+
+    cached_crawler._http_get = fake_get
+    cached_crawler.rate_limiter.wait = lambda: None
+    stored = pd.DataFrame({"원본_APT_CD": ["A1"]})
+    cached_crawler.sync_seoul_apartment_info(stored)
+    assert calls
+    assert cached_crawler.revalidate_cache is False
+
+
+def test_cache_is_opt_in():
+    import config
+
+    if os.environ.get("HTTP_CACHE_ENABLED") is None:
+        assert config.HTTP_CACHE_ENABLED is False
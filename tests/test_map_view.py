@@ -0,0 +1,39 @@
+"""
+지도 HTML 캐시 테스트
+"""
+import pandas as pd
+
+import map_view
+from map_view import MapHtmlCache, map_cache_key
+
+
+def test_renders_once_per_key_and_evicts_oldest(monkeypatch):
+    calls = []
+
+    def fake_render(df, tiles=None, positions=None):
+        calls.append(len(df))
+        return f"<html>{len(df)}</html>", "markers"
+
+    monkeypatch.setattr(map_view, "render_map_html", fake_render)
+    cache = MapHtmlCache(max_entries=2)
+    df = pd.DataFrame({"위도": [37.5, 37.6], "경도": [127.0, 127.1]})
+    key_a, key_b, key_c = (map_cache_key(positions, "v1") for positions in ([0], [1], [0, 1]))
+
+    assert cache.get_or_render(key_a, df.iloc[[0]]) == ("<html>1</html>", "markers")
+    cache.get_or_render(key_a, df.iloc[[0]])
+    cache.get_or_render(key_b, df.iloc[[1]])
+    assert calls == [1, 1]
+
+    cache.get_or_render(key_a, df.iloc[[0]])  # a를 최근 사용으로
+    cache.get_or_render(key_c, df)  # 가장 오래된 b 삭제
+    assert len(cache) == 2
+    cache.get_or_render(key_a, df.iloc[[0]])
+    cache.get_or_render(key_b, df.iloc[[1]])
+    assert calls == [1, 1, 2, 1]
+
+
+def test_renders_real_map():
+    cache = MapHtmlCache(max_entries=1)
+    df = pd.DataFrame({"위도": [37.5, 37.6], "경도": [127.0, 127.1], "아파트명": ["가", "나"]})
+    html, mode = cache.get_or_render(map_cache_key([0, 1], "v1"), df)
+    assert "<html" in html.lower() and mode
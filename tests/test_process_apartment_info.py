@@ -0,0 +1,150 @@
+"""
+process_seoul_apartment_info_data 테스트
+"""
+import numpy as np
+import pandas as pd
+
+
+def test_filtered_input_keeps_row_count(crawler, raw_apartment_info):
+    """0부터 시작하지 않는 인덱스(증분 동기화의 변경 단지만 전달)에서도 행이 늘지 않아야 함"""
+    subset = raw_apartment_info.iloc[[5, 10, 20]]
+    full = crawler.process_seoul_apartment_info_data(raw_apartment_info)
+    processed = crawler.process_seoul_apartment_info_data(subset)
+
+    assert len(processed) == 3
+    assert list(processed["원본_APT_CD"]) == list(subset["APT_CD"])
+    assert processed["원본_APT_CD"].notna().all()
+    expected = full.iloc[[5, 10, 20]].reset_index(drop=True)
+    pd.testing.assert_series_equal(processed["지오해시"], expected["지오해시"])
+    assert processed["지오해시"].notna().sum() == expected["지오해시"].notna().sum() > 0
+
+
+def _reference_process(df: pd.DataFrame) -> pd.DataFrame:
+    """이전 행 단위 구현(iterrows)의 파생 컬럼 (동등성 비교 기준)"""
+    from utils import calculate_distance_to_subway, calculate_pyeong
+
+    def to_int(value):
+        try:
+            return int(value) if pd.notna(value) else None
+        except (TypeError, ValueError):
+            return None
+
+    def to_float(value):
+        try:
+            return float(value) if pd.notna(value) else None
+        except (TypeError, ValueError):
+            return None
+
+    rows = []
+    for _, row in df.iterrows():
+        completion_date = row.get('USE_APRV_YMD', None)
+        build_year = None
+        if completion_date and pd.notna(completion_date):
+            try:
+                date_str = str(completion_date)
+                if len(date_str) >= 4:
+                    build_year = int(date_str[:4])
+            except ValueError:
+                pass
+
+        households = to_int(row.get('TNOHSH', None))
+
+        road_type = row.get('ROAD_TYPE', '') or ''
+        hallway_type = None
+        if road_type:
+            if '복도' in str(road_type):
+                hallway_type = "복도식"
+            elif '계단' in str(road_type):
+                hallway_type = "계단식"
+            elif '혼합' in str(road_type):
+                hallway_type = "혼합식"
+            else:
+                hallway_type = str(road_type)
+
+        area_sqm = to_float(row.get('RSDT_XUAR', None))
+        pyeong = calculate_pyeong(area_sqm) if area_sqm else None
+
+        lat = row.get('YCRD', None)
+        lon = row.get('XCRD', None)
+        nearest_station, distance_km = None, None
+        if lat and lon and pd.notna(lat) and pd.notna(lon):
+            nearest_station, distance_km = calculate_distance_to_subway(float(lat), float(lon))
+
+        avg_area, avg_pyeong = None, None
+        if area_sqm and households and households > 0:
+            avg_area = round(area_sqm / households, 2)
+            avg_pyeong = calculate_pyeong(avg_area)
+
+        parking_count = to_int(row.get('PRK_CNTOM', None))
+        parking_per_household = None
+        if parking_count and households and households > 0:
+            parking_per_household = round(parking_count / households, 2)
+
+        rows.append({
+            "자치구": row.get('SGG_ADDR', '') or '',
+            "주소": row.get('APT_RDN_ADDR', '') or '',
+            "아파트명": row.get('APT_NM', '') or '',
+            "건축연도": build_year,
+            "세대수": households,
+            "복도계단식": hallway_type,
+            "전용면적_제곱미터": area_sqm,
+            "평형": pyeong,
+            "세대당평균전용면적_제곱미터": avg_area,
+            "세대당평균평형": avg_pyeong,
+            "전용면적60㎡이하_세대수": to_float(row.get('XUAR_HH_STTS60', None)),
+            "전용면적60_85㎡_세대수": to_float(row.get('XUAR_HH_STTS85', None)),
+            "전용면적85_135㎡_세대수": to_float(row.get('XUAR_HH_STTS135', None)),
+            "주차대수": parking_count,
+            "세대당주차면수": parking_per_household,
+            "위도": lat,
+            "경도": lon,
+            "가장가까운지하철역": nearest_station,
+            "지하철역거리_km": distance_km,
+            "건설사": row.get('BLDR', '') or '',
+            "시행사": row.get('DVLR', '') or '',
+            "난방방식": row.get('MN_MTHD', '') or '',
+            "홈페이지": row.get('HMPG', '') or '',
+        })
+    return pd.DataFrame(rows)
+
+
+def _normalized(series: pd.Series) -> list:
+    """dtype 차이(object/float/int)를 무시한 비교용 값 목록 (결측은 None)"""
+    return [None if pd.isna(value) else value for value in series.astype(object)]
+
+
+def test_matches_row_wise_implementation(crawler, raw_apartment_info):
+    """
+    행 단위 구현과 동등성 (seoul_apartments_metadata.csv 전체)
+    의도한 차이: 복도유형(ROAD_TYPE) 결측은 문자열 'nan' 대신 None
+    """
+    expected = _reference_process(raw_apartment_info)
+    processed = crawler.process_seoul_apartment_info_data(raw_apartment_info)
+    assert len(processed) == len(expected)
+
+    road_type_missing = raw_apartment_info['ROAD_TYPE'].isna().to_numpy()
+    assert road_type_missing.any()
+    assert (expected.loc[road_type_missing, "복도계단식"] == "nan").all()
+    assert processed.loc[road_type_missing, "복도계단식"].isna().all()
+    expected.loc[road_type_missing, "복도계단식"] = None
+
+    for col in expected.columns:
+        assert _normalized(processed[col]) == _normalized(expected[col]), col
+
+    # 원본_* 컬럼은 원본 값 그대로
+    for col in raw_apartment_info.columns:
+        assert _normalized(processed[f"원본_{col}"]) == _normalized(raw_apartment_info[col]), col
+
+
+def test_missing_text_fields_stay_missing(crawler):
+    """문자열 필드: None/빈 값은 '', NaN은 결측 그대로 (행 단위 구현의 `or ''`와 동일)"""
+    raw = pd.DataFrame({
+        "APT_NM": ["a", "b", "c"],
+        "BLDR": pd.Series([None, "", np.nan], dtype=object),
+        "ROAD_TYPE": pd.Series(["계단식", np.nan, ""], dtype=object),
+    })
+    processed = crawler.process_seoul_apartment_info_data(raw)
+    assert processed["건설사"].iloc[0] == ""
+    assert processed["건설사"].iloc[1] == ""
+    assert pd.isna(processed["건설사"].iloc[2])
+    assert _normalized(processed["복도계단식"]) == ["계단식", None, None]
@@ -0,0 +1,116 @@
+"""
+process_seoul_real_estate_data 테스트
+"""
+import numpy as np
+import pandas as pd
+
+from config import SEOUL_DISTRICT_CODES
+
+
+def _transactions(n=3000, seed=3):
+    """같은 건물이 반복되는 실거래가 API 형식 데이터 (좌표 결측/0/문자열 포함)"""
+    rng = np.random.default_rng(seed)
+    codes = list(SEOUL_DISTRICT_CODES.items())
+    buildings = []
+    for i in range(120):
+        code, name = codes[i % len(codes)]
+        buildings.append({
+            "SGG_CD": code,
+            "SGG_NM": name,
+            "BJDONG_NM": f"{i % 7}동",
+            "BLDG_NM": f"아파트{i}",
+            "BUILD_YEAR": str(1985 + i % 38),
+            "LAT": round(float(rng.uniform(37.45, 37.68)), 6),
+            "LNG": round(float(rng.uniform(126.85, 127.15)), 6),
+        })
+    buildings[0].update(LAT=None, LNG=None)
+    buildings[1].update(LAT=0, LNG=0)
+    buildings[2].update(LAT=str(buildings[2]["LAT"]), LNG=str(buildings[2]["LNG"]))
+    buildings[3].update(BUILD_YEAR=None)
+
+    rows = []
+    for pick in rng.integers(0, len(buildings), n):
+        row = dict(buildings[pick])
+        area = float(rng.choice([59.9, 84.97, 114.5]))
+        row.update(
+            RENT_AREA=area if rng.random() > 0.1 else None,
+            RENT_GBN=str(area),
+            RENT_GTN=int(rng.integers(10000, 200000)),
+            RENT_DEPOSIT=None,
+            RENT_FEE=None,
+            CNTRCT_DE="20240101",
+        )
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def _reference_process(df: pd.DataFrame) -> pd.DataFrame:
+    """이전 행 단위 구현(iterrows)의 결과 (동등성 비교 기준)"""
+    from utils import calculate_distance_to_subway, calculate_pyeong, extract_district
+
+    rows = []
+    for _, row in df.iterrows():
+        district = extract_district(str(row.get('SGG_CD', '')) + str(row.get('BJDONG_NM', '')))
+        if not district:
+            district = extract_district(str(row.get('SGG_NM', '')) + str(row.get('BJDONG_NM', '')))
+        build_year = row.get('BUILD_YEAR', None)
+        try:
+            build_year = int(build_year) if pd.notna(build_year) else None
+        except (TypeError, ValueError):
+            build_year = None
+        area_sqm = row.get('RENT_AREA', None) or row.get('RENT_GBN', None)
+        try:
+            area_sqm = float(area_sqm) if pd.notna(area_sqm) else None
+        except (TypeError, ValueError):
+            area_sqm = None
+        lat = row.get('LAT', None)
+        lon = row.get('LNG', None) or row.get('LON', None)
+        nearest_station, distance_km = None, None
+        if lat and lon:
+            try:
+                nearest_station, distance_km = calculate_distance_to_subway(float(lat), float(lon))
+            except (TypeError, ValueError):
+                pass
+        rows.append({
+            "자치구": district or row.get('SGG_NM', ''),
+            "주소": f"서울특별시 {row.get('SGG_NM', '')} {row.get('BJDONG_NM', '')} {row.get('BLDG_NM', '')}".strip(),
+            "건축연도": build_year,
+            "전용면적_제곱미터": area_sqm,
+            "평형": calculate_pyeong(area_sqm) if area_sqm else None,
+            "위도": lat,
+            "경도": lon,
+            "가장가까운지하철역": nearest_station,
+            "지하철역거리_km": distance_km,
+            "물건금액": row.get('RENT_GTN', None),
+        })
+    return pd.DataFrame(rows)
+
+
+def test_matches_row_wise_reference(crawler):
+    df = _transactions()
+    processed = crawler.process_seoul_real_estate_data(df)
+    expected = _reference_process(df)
+
+    assert len(processed) == len(df)
+    for col in ["자치구", "주소", "가장가까운지하철역"]:
+        assert processed[col].where(processed[col].notna(), None).tolist() == expected[col].tolist(), col
+    for col in ["건축연도", "전용면적_제곱미터", "평형", "지하철역거리_km", "물건금액"]:
+        np.testing.assert_array_equal(
+            processed[col].to_numpy(dtype=float), pd.to_numeric(expected[col]).to_numpy(dtype=float), err_msg=col
+        )
+    assert processed["위도"].tolist() == expected["위도"].tolist()
+    assert processed["경도"].tolist() == expected["경도"].tolist()
+    # 좌표가 없거나 0인 건물은 역 정보 없음
+    missing = df["LAT"].isna() | (df["LAT"] == 0)
+    assert missing.any() and processed.loc[missing.to_numpy(), "가장가까운지하철역"].isna().all()
+
+
+def test_repeated_coordinates_match_per_row(crawler):
+    """고유 좌표별 계산 결과가 좌표를 행마다 계산한 결과와 같아야 함 (접근성 지표 포함)"""
+    from utils import calculate_subway_accessibility_batch
+
+    df = _transactions(n=500, seed=11)
+    processed = crawler.process_seoul_real_estate_data(df)
+    per_row = calculate_subway_accessibility_batch(df["LAT"].to_numpy(), df["LNG"].to_numpy())
+    for col in per_row.columns:
+        pd.testing.assert_series_equal(processed[col], per_row[col], check_names=False)
@@ -0,0 +1,68 @@
+import os
+import time
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+import shared_dataset
+from shared_dataset import dataset_file, open_dataset, publish, read_pointer
+
+
+def _sample():
+    return pd.DataFrame({
+        "아파트명": pd.Series(["가", None, "다"], dtype=object),
+        "세대수": [100, 200, 300],
+    })
+
+
+def test_open_dataset_maps_strings_to_arrow(tmp_path):
+    pointer = publish(_sample(), data_dir=str(tmp_path))
+    df = open_dataset(pointer["version"], data_dir=str(tmp_path))
+
+    assert isinstance(df["아파트명"].dtype, pd.StringDtype)
+    assert df["아파트명"].dtype.storage == "pyarrow"
+    # 결측값은 NaN (object/pandas 3 str과 같은 비교 의미)
+    assert df["아파트명"].isna().tolist() == [False, True, False]
+    assert (df["아파트명"] == "가").tolist() == [True, False, False]
+    assert df["세대수"].tolist() == [100, 200, 300]
+
+
+def _age(path, seconds):
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def test_superseded_version_kept_during_grace_period(tmp_path, monkeypatch):
+    data_dir = str(tmp_path)
+    monkeypatch.setattr(shared_dataset, "SHARED_DATASET_KEEP_VERSIONS", 1)
+    monkeypatch.setattr(shared_dataset, "SHARED_DATASET_GRACE_SECONDS", 60)
+
+    first = publish(_sample(), data_dir=data_dir)
+    _age(dataset_file(data_dir, first["version"]), 3600)
+    second = publish(_sample(), data_dir=data_dir)
+
+    # 오래전에 게시된 버전이라도 방금 대체됐으면 포인터를 먼저 읽은 세션이 열 수 있어야 함
+    assert os.path.exists(dataset_file(data_dir, first["version"]))
+    assert len(open_dataset(first["version"], data_dir=data_dir)) == 3
+    assert read_pointer(data_dir)["version"] == second["version"]
+
+
+def test_versions_removed_after_grace_period(tmp_path, monkeypatch):
+    data_dir = str(tmp_path)
+    monkeypatch.setattr(shared_dataset, "SHARED_DATASET_KEEP_VERSIONS", 1)
+    monkeypatch.setattr(shared_dataset, "SHARED_DATASET_GRACE_SECONDS", 60)
+
+    first = publish(_sample(), data_dir=data_dir)
+    second = publish(_sample(), data_dir=data_dir)
+    _age(dataset_file(data_dir, first["version"]), 7200)
+    _age(dataset_file(data_dir, second["version"]), 3600)
+    third = publish(_sample(), data_dir=data_dir)
+
+    assert not os.path.exists(dataset_file(data_dir, first["version"]))
+    # 두 번째 버전은 방금 대체됐으므로 유지
+    assert os.path.exists(dataset_file(data_dir, second["version"]))
+    assert os.path.exists(dataset_file(data_dir, third["version"]))
+    with pytest.raises(FileNotFoundError):
+        open_dataset(first["version"], data_dir=data_dir)
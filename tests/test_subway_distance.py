@@ -0,0 +1,54 @@
+"""
+지하철역 최근접 거리 일괄 계산 테스트
+"""
+import numpy as np
+import pandas as pd
+from geopy.distance import geodesic
+
+from utils import (
+    _STATION_LATS,
+    _STATION_LONS,
+    _vincenty_km,
+    calculate_distance_to_subway,
+    calculate_distance_to_subway_batch,
+)
+
+
+def _sample_points():
+    rng = np.random.default_rng(7)
+    lats = rng.uniform(37.4, 37.7, 3000)
+    lons = rng.uniform(126.8, 127.2, 3000)
+    # 역 좌표 그대로, 이웃한 두 역의 중점 (후보가 둘 이상인 행), 서울 밖 좌표
+    lats = np.concatenate([lats, _STATION_LATS, (_STATION_LATS[:-1] + _STATION_LATS[1:]) / 2, [35.1]])
+    lons = np.concatenate([lons, _STATION_LONS, (_STATION_LONS[:-1] + _STATION_LONS[1:]) / 2, [129.0]])
+    return lats, lons
+
+
+def test_vincenty_matches_geodesic():
+    lats, lons = _sample_points()
+    expected = [geodesic((lat, lon), (_STATION_LATS[0], _STATION_LONS[0])).km for lat, lon in zip(lats, lons)]
+    np.testing.assert_allclose(_vincenty_km(lats, lons, _STATION_LATS[0], _STATION_LONS[0]), expected, rtol=0, atol=1e-6)
+
+
+def test_batch_matches_scalar():
+    lats, lons = _sample_points()
+    result = calculate_distance_to_subway_batch(lats, lons, chunk_size=500)
+    expected = [calculate_distance_to_subway(lat, lon) for lat, lon in zip(lats, lons)]
+    assert list(result["가장가까운지하철역"]) == [name for name, _ in expected]
+    assert list(result["지하철역거리_km"]) == [distance for _, distance in expected]
+
+
+def test_batch_skips_missing_coordinates():
+    result = calculate_distance_to_subway_batch(
+        [37.5, None, 0, "x", np.nan], [127.0, 127.0, 127.0, 127.0, 127.0]
+    )
+    assert result["가장가까운지하철역"].notna().tolist() == [True, False, False, False, False]
+    assert pd.isna(result["지하철역거리_km"].iloc[1:]).all()
+
+
+def test_approximate_batch_close_to_exact():
+    lats, lons = _sample_points()
+    exact = calculate_distance_to_subway_batch(lats, lons)
+    approx = calculate_distance_to_subway_batch(lats, lons, exact=False)
+    assert (approx["가장가까운지하철역"] == exact["가장가까운지하철역"]).mean() > 0.99
+    np.testing.assert_allclose(approx["지하철역거리_km"], exact["지하철역거리_km"], rtol=0.006, atol=0.01)
@@ -0,0 +1,39 @@
+"""
+지하철역 표 테스트
+"""
+import numpy as np
+
+from subway_stations import STATIONS, SUBWAY_STATIONS
+
+
+def test_transfer_station_lines():
+    assert STATIONS.get("잠실역").lines == ("2호선", "8호선")
+    assert STATIONS.get("강남역").lines == ("2호선",)
+    assert STATIONS.get("고속터미널역").lines == ("3호선", "7호선", "9호선")
+    assert STATIONS.get("동대문역사문화공원역").lines == ("2호선", "4호선", "5호선")
+    assert STATIONS.get("서울대벤처타운역").lines == ()
+
+
+def test_line_membership():
+    def names(line):
+        return set(STATIONS.names[STATIONS.line_ids(line)])
+
+    line1, line2 = names("1호선"), names("2호선")
+    assert {"사당역", "수서역", "서울대입구역"}.isdisjoint(line1)
+    assert {"신사역", "압구정역", "한남역", "마천역", "거여역"}.isdisjoint(line2)
+    assert {"강남역", "잠실역", "신도림역", "홍대입구역"} <= line2
+    assert {"마천역", "거여역", "올림픽공원역"} <= names("5호선")
+    for line in STATIONS.lines:
+        for station_id in STATIONS.line_ids(line):
+            assert line in STATIONS.lines_of(station_id)
+    assert len(STATIONS.line_ids("경의중앙선")) == 0
+
+
+def test_arrays_and_compat():
+    assert len(STATIONS) == len(SUBWAY_STATIONS) == len(set(STATIONS.names))
+    assert STATIONS.lats.dtype == np.float64 and STATIONS.lats.flags["C_CONTIGUOUS"]
+    assert not STATIONS.lats.flags["WRITEABLE"]
+    for station_id, (name, coords) in enumerate(SUBWAY_STATIONS.items()):
+        assert STATIONS.id_of(name) == station_id
+        assert (STATIONS.lats[station_id], STATIONS.lons[station_id]) == coords
+    assert STATIONS.get("없는역") is None
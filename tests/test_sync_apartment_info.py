@@ -0,0 +1,131 @@
+"""
+sync_seoul_apartment_info 증분 동기화 테스트 (목록 수집은 스텁)
+"""
+import json
+
+import pandas as pd
+import pytest
+
+from config import SUBWAY_ACCESS_COLUMNS
+
+OLD_MODIFIED = "2025-01-01 00:00:00.0"
+NEW_MODIFIED = "2025-02-01 00:00:00.0"
+
+
+@pytest.fixture
+def listing(raw_apartment_info):
+    """최신 목록 (20개 단지, 모두 사용 중, 수정일자는 OLD_MODIFIED)"""
+    raw = raw_apartment_info.iloc[:20].reset_index(drop=True).copy()
+    raw["MDFCN_YMD"] = OLD_MODIFIED
+    raw["USE_YN"] = "Y"
+    return raw
+
+
+@pytest.fixture
+def stored(crawler, listing):
+    """저장된 데이터 (앞 18개 단지)"""
+    return crawler.process_seoul_apartment_info_data(listing.iloc[:18])
+
+
+def _sync(crawler, stored, raw, tmp_path, total_count=None, state=None):
+    def fake_crawl_all(max_records=50000):
+        crawler.last_total_count = len(raw) if total_count is None else total_count
+        return raw.reset_index(drop=True)
+
+    crawler.crawl_seoul_apartment_info_all = fake_crawl_all
+    state_file = tmp_path / "sync_state.json"
+    if state is not None:
+        state_file.write_text(json.dumps(state), encoding="utf-8")
+    return crawler.sync_seoul_apartment_info(stored, state_file=str(state_file))
+
+
+def _keys(df):
+    return list(df["원본_APT_CD"])
+
+
+def test_new_complexes_are_added(crawler, stored, listing, tmp_path):
+    merged, summary = _sync(crawler, stored, listing, tmp_path)
+
+    assert summary["mode"] == "incremental"
+    assert (summary["new"], summary["updated"], summary["deleted"], summary["unchanged"]) == (2, 0, 0, 18)
+    assert _keys(merged) == _keys(stored) + list(listing["APT_CD"].iloc[18:])
+    pd.testing.assert_frame_equal(merged.iloc[:18], stored[merged.columns], check_dtype=False)
+
+
+def test_modified_complex_is_replaced(crawler, stored, listing, tmp_path):
+    raw = listing.iloc[:18].copy()
+    raw.loc[3, "MDFCN_YMD"] = NEW_MODIFIED
+    raw.loc[3, "APT_NM"] = "새이름아파트"
+    merged, summary = _sync(crawler, stored, raw, tmp_path)
+
+    assert (summary["new"], summary["updated"], summary["deleted"]) == (0, 1, 0)
+    assert summary["watermark"] == str(pd.Timestamp(NEW_MODIFIED))
+    row = merged[merged["원본_APT_CD"] == raw.loc[3, "APT_CD"]]
+    assert len(row) == 1 and row["아파트명"].iloc[0] == "새이름아파트"
+    assert len(merged) == 18
+
+
+def test_state_watermark_earlier_than_stored_data(crawler, stored, listing, tmp_path):
+    """상태 파일 워터마크가 저장 데이터보다 이르면 그 이후 수정분을 다시 반영"""
+    raw = listing.iloc[:18].copy()
+    raw.loc[[1, 2], "MDFCN_YMD"] = "2024-12-01 00:00:00.0"
+    _, summary = _sync(crawler, stored, raw, tmp_path, state={"watermark": "2024-06-01 00:00:00"})
+
+    assert summary["updated"] == 18
+    _, summary = _sync(crawler, stored, raw, tmp_path, state={"watermark": "2024-12-15 00:00:00"})
+    assert summary["updated"] == 16
+
+
+def test_unused_complex_is_deleted(crawler, stored, listing, tmp_path):
+    raw = listing.iloc[:18].copy()
+    raw.loc[5, "USE_YN"] = "N"
+    raw.loc[5, "MDFCN_YMD"] = NEW_MODIFIED
+    merged, summary = _sync(crawler, stored, raw, tmp_path)
+
+    assert (summary["new"], summary["updated"], summary["deleted"]) == (0, 0, 1)
+    assert raw.loc[5, "APT_CD"] not in set(merged["원본_APT_CD"])
+    assert len(merged) == 17
+
+
+def test_complex_missing_from_full_list_is_deleted(crawler, stored, listing, tmp_path):
+    raw = listing.iloc[:18].drop(index=7)
+    merged, summary = _sync(crawler, stored, raw, tmp_path)
+
+    assert summary["deleted"] == 1
+    assert listing.loc[7, "APT_CD"] not in set(merged["원본_APT_CD"])
+    assert len(merged) == 17
+
+
+def test_partial_list_deletes_nothing(crawler, stored, listing, tmp_path):
+    """목록을 일부만 받았으면 (last_total_count > 받은 행 수) 목록에 없는 단지를 지우지 않음"""
+    raw = listing.iloc[:18].drop(index=7)
+    merged, summary = _sync(crawler, stored, raw, tmp_path, total_count=len(raw) + 100)
+
+    assert summary["deleted"] == 0
+    assert _keys(merged) == _keys(stored)
+
+
+def test_columns_order_and_accessibility_backfill(crawler, stored, listing, tmp_path):
+    """이전 버전으로 저장된 데이터(접근성 지표 없음, 컬럼 순서 다름)도 저장 순서를 유지하고 지표를 채움"""
+    old = stored.drop(columns=SUBWAY_ACCESS_COLUMNS)
+    old = old[list(reversed(old.columns))]
+    merged, _ = _sync(crawler, old, listing, tmp_path)
+
+    assert list(merged.columns[:len(old.columns)]) == list(old.columns)
+    has_coords = merged["위도"].notna()
+    for col in SUBWAY_ACCESS_COLUMNS:
+        assert merged.loc[has_coords, col].notna().all(), col
+    pd.testing.assert_frame_equal(
+        merged[SUBWAY_ACCESS_COLUMNS].iloc[:18].reset_index(drop=True),
+        stored[SUBWAY_ACCESS_COLUMNS].reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+def test_empty_store_runs_full_conversion(crawler, listing, tmp_path):
+    raw = listing.copy()
+    raw.loc[0, "USE_YN"] = "N"
+    merged, summary = _sync(crawler, pd.DataFrame(), raw, tmp_path)
+
+    assert summary["mode"] == "full"
+    assert summary["new"] == len(merged) == 19
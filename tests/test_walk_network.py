@@ -0,0 +1,95 @@
+"""
+도보 네트워크 거리 테스트 (작은 합성 그래프)
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("scipy")
+
+from subway_stations import STATIONS
+from utils import haversine_km
+from walk_network import WALK_DISTANCE_COLUMN, WALK_STATION_COLUMN, WalkNetwork, add_walking_distance
+
+SNAP_KM = 0.05
+
+
+@pytest.fixture(scope="module")
+def network_frames():
+    """
+    강남역(n0) - n2 - n3 - 역삼역(n1) 경로, n3 - n4 길이 0 간선, 역과 이어지지 않는 n5 - n6
+
+    n0 - n2 간선은 중복(100m, 50m, 반대 방향 70m)이고 n2에는 자기 자신 간선이 있음.
+    """
+    gangnam, yeoksam = STATIONS.get("강남역"), STATIONS.get("역삼역")
+    a = np.array([gangnam.lat, gangnam.lon])
+    b = np.array([yeoksam.lat, yeoksam.lon])
+    n2, n3 = a + (b - a) / 3, a + 2 * (b - a) / 3
+    coords = [a, b, n2, n3, n3 + [1e-5, 0], [37.5200, 127.0600], [37.5205, 127.0600]]
+    nodes = pd.DataFrame({
+        "osmid": [100, 101, 102, 103, 104, 105, 106],
+        "y": [c[0] for c in coords],
+        "x": [c[1] for c in coords],
+    })
+    edges = pd.DataFrame({
+        "u": [100, 100, 102, 102, 102, 103, 103, 105, 105, 104],
+        "v": [102, 102, 100, 102, 103, 101, 104, 106, 999, 105],
+        "length": [100, 50, 70, 5, 300, 200, 0, 60, 10, -5],
+    })
+    return nodes, edges
+
+
+@pytest.fixture(scope="module")
+def network(network_frames):
+    nodes, edges = network_frames
+    return WalkNetwork.from_frames(nodes, edges, snap_max_km=SNAP_KM)
+
+
+def test_only_two_stations_snap(network, network_frames):
+    nodes, _ = network_frames
+    snap = haversine_km(STATIONS.lats[:, None], STATIONS.lons[:, None], nodes["y"].to_numpy()[None, :], nodes["x"].to_numpy()[None, :])
+    assert set(STATIONS.names[snap.min(axis=1) <= SNAP_KM]) == {"강남역", "역삼역"}
+
+
+def test_invalid_edges_dropped(network):
+    # 없는 노드(999)로 가는 간선, 음수 길이 간선 제외
+    assert len(network.edge_km) == 8
+
+
+def test_node_labels(network):
+    result = network.station_distances(network.node_index.lats, network.node_index.lons)
+    assert list(result[WALK_STATION_COLUMN].iloc[:5]) == ["강남역", "역삼역", "강남역", "역삼역", "역삼역"]
+    # n5, n6: 어느 역과도 이어지지 않음
+    assert result[WALK_STATION_COLUMN].iloc[5:].isna().all()
+    # n2: 중복 간선 중 최단(50m), n3: 역삼역 쪽 200m가 강남역 쪽 350m보다 가까움, n4: 길이 0 간선으로 n3과 같은 거리
+    np.testing.assert_array_equal(result[WALK_DISTANCE_COLUMN].to_numpy()[:5], [0.0, 0.0, 0.05, 0.2, 0.2])
+    assert result[WALK_DISTANCE_COLUMN].iloc[5:].isna().all()
+
+
+def test_snap_distance_added_and_out_of_graph_excluded(network):
+    n2_lat, n2_lon = network.node_index.lats[2], network.node_index.lons[2]
+    lats = [n2_lat + 0.0002, n2_lat + 0.01, np.nan, 0, "x"]
+    lons = [n2_lon, n2_lon, n2_lon, n2_lon, n2_lon]
+    result = network.station_distances(lats, lons)
+
+    snap = float(haversine_km(lats[0], lons[0], n2_lat, n2_lon))
+    assert snap < SNAP_KM
+    assert result[WALK_STATION_COLUMN].iloc[0] == "강남역"
+    assert result[WALK_DISTANCE_COLUMN].iloc[0] == round(snap + 0.05, 2)
+    # 그래프에서 snap_max_km보다 먼 단지, 좌표가 없는 단지는 결측
+    assert result[WALK_STATION_COLUMN].iloc[1:].isna().all()
+    assert result[WALK_DISTANCE_COLUMN].iloc[1:].isna().all()
+
+
+def test_add_walking_distance_keeps_rows(network):
+    df = pd.DataFrame({
+        "아파트명": ["가", "나"],
+        "위도": [network.node_index.lats[3], network.node_index.lats[5]],
+        "경도": [network.node_index.lons[3], network.node_index.lons[5]],
+    }, index=[10, 20])
+    result = add_walking_distance(df, network)
+
+    assert list(result.index) == [10, 20]
+    assert result[WALK_STATION_COLUMN].iloc[0] == "역삼역" and pd.isna(result[WALK_STATION_COLUMN].iloc[1])
+    assert result[WALK_DISTANCE_COLUMN].iloc[0] == 0.2 and np.isnan(result[WALK_DISTANCE_COLUMN].iloc[1])
+    assert WALK_STATION_COLUMN not in df.columns
@@ -1,8 +1,93 @@
 """
 유틸리티 함수들
 """
-from geopy.distance import geodesic
-from subway_stations import SUBWAY_STATIONS
+import math
+
+import numpy as np
+import pandas as pd
+from geographiclib.geodesic import Geodesic
+from geopy.distance import ELLIPSOIDS
+from config import SUBWAY_COUNT_COLUMNS, SUBWAY_HUB_COLUMNS, SUBWAY_RANK_COLUMNS
+from geo_index import GeoIndex, EARTH_RADIUS_KM
+from subway_stations import STATIONS
+
+# 지하철역 공간 인덱스 (import 시 1회 생성, 순서는 역 ID 순서)
+_STATION_NAMES = STATIONS.names
+_STATION_LATS = STATIONS.lats
+_STATION_LONS = STATIONS.lons
+_STATION_INDEX = GeoIndex(_STATION_LATS, _STATION_LONS)
+
+# geopy.distance.geodesic과 동일한 WGS-84 타원체 (km 단위, Point 변환 오버헤드 없이 직접 호출)
+_WGS84_KM = Geodesic(ELLIPSOIDS['WGS-84'][0], ELLIPSOIDS['WGS-84'][2])
+
+# 구면(대원) 거리와 타원체(geodesic) 거리의 상대 오차 여유
+# (WGS84 기준 실제 오차는 ±0.6% 이내이므로 후보 누락 없이 geodesic 결과와 동일)
+_GEODESIC_TOLERANCE = 0.02
+
+# 일괄 계산 시 아파트마다 공간 인덱스에서 가져올 후보 역 수
+_BATCH_CANDIDATES = 4
+# Vincenty 식과 geographiclib 거리 차이 여유 (km, 실제 차이는 1mm 미만)
+_VINCENTY_TOLERANCE_KM = 1e-6
+
+
+def _nearest_station_candidates(lat, lon, k=1):
+    """
+    geodesic 거리 기준 상위 k개 역이 될 수 있는 후보 역 인덱스 검색
+
+    Args:
+        lat: 위도
+        lon: 경도
+        k: 찾을 역 개수
+
+    Returns:
+        list: 후보 역 인덱스 (역 ID 순서)
+    """
+    total = len(_STATION_INDEX)
+    k = min(k, total)
+    query_k = min(total, k + 4)
+    while True:
+        distances, indices = _STATION_INDEX.query(lat, lon, k=query_k)
+        distances, indices = distances[0], indices[0]
+        bound = distances[k - 1] * (1 + _GEODESIC_TOLERANCE) + 1e-9
+        if query_k >= total or distances[-1] > bound:
+            return sorted(int(i) for i in indices[distances <= bound])
+        query_k = min(total, query_k * 2)
+
+
+def _geodesic_to_stations(lat, lon, station_indices):
+    """후보 역들까지의 geodesic 거리(km) 리스트 (geopy.distance.geodesic과 동일한 값)"""
+    return [
+        _WGS84_KM.Inverse(lat, lon, _STATION_LATS[i], _STATION_LONS[i], Geodesic.DISTANCE)['s12']
+        for i in station_indices
+    ]
+
+
+def find_nearest_stations(lat, lon, k=3):
+    """
+    아파트 위치에서 가까운 지하철역 k개와 직선 거리 계산 (km)
+
+    Args:
+        lat: 위도
+        lon: 경도
+        k: 찾을 역 개수
+
+    Returns:
+        list: [(역 이름, 거리(km)), ...] 가까운 순
+    """
+    if not lat or not lon:
+        return []
+
+    try:
+        lat, lon = float(lat), float(lon)
+        if not (math.isfinite(lat) and math.isfinite(lon)):
+            return []
+        candidates = _nearest_station_candidates(lat, lon, k)
+        distances = _geodesic_to_stations(lat, lon, candidates)
+        ranked = sorted(zip(distances, candidates), key=lambda item: item[0])[:k]
+        return [(_STATION_NAMES[i], round(distance, 2)) for distance, i in ranked]
+    except Exception as e:
+        print(f"거리 계산 오류: {e}")
+        return []
 
 
 def calculate_distance_to_subway(lat, lon):
@@ -20,15 +105,20 @@ def calculate_distance_to_subway(lat, lon):
         return None, None
     
     try:
-        apt_location = (lat, lon)
+        lat, lon = float(lat), float(lon)
+        if not (math.isfinite(lat) and math.isfinite(lon)):
+            raise ValueError(f"좌표가 유효하지 않습니다: ({lat}, {lon})")
+        
+        # 공간 인덱스로 후보 역만 추린 뒤 geodesic 거리로 최종 선택
+        candidates = _nearest_station_candidates(lat, lon, k=1)
+        distances = _geodesic_to_stations(lat, lon, candidates)
         min_distance = float('inf')
         nearest_station = None
         
-        for station_name, station_coords in SUBWAY_STATIONS.items():
-            distance = geodesic(apt_location, station_coords).kilometers
+        for station_index, distance in zip(candidates, distances):
             if distance < min_distance:
                 min_distance = distance
-                nearest_station = station_name
+                nearest_station = _STATION_NAMES[station_index]
         
         return nearest_station, round(min_distance, 2)
     except Exception as e:
@@ -36,6 +126,243 @@ def calculate_distance_to_subway(lat, lon):
         return None, None
 
 
+def haversine_km(lat1, lon1, lat2, lon2):
+    """
+    두 좌표(배열) 사이의 대원 거리 계산 (km, NumPy 브로드캐스팅 지원)
+    
+    Args:
+        lat1, lon1: 출발 위도/경도
+        lat2, lon2: 도착 위도/경도
+    
+    Returns:
+        np.ndarray: 거리(km)
+    """
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=float)) for v in (lat1, lon1, lat2, lon2))
+    a = (
+        np.sin((lat2 - lat1) / 2.0) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2.0) ** 2
+    )
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _vincenty_km(lat1, lon1, lat2, lon2, max_iterations=100):
+    """
+    WGS-84 타원체 geodesic 거리 (km, Vincenty 역해법, NumPy 브로드캐스팅 지원)
+
+    geographiclib(geopy.distance.geodesic)와의 차이는 1mm 미만이며,
+    수렴하지 않는 점(거의 대척점)은 NaN을 반환합니다.
+
+    Args:
+        lat1, lon1: 출발 위도/경도
+        lat2, lon2: 도착 위도/경도
+        max_iterations: 최대 반복 횟수
+
+    Returns:
+        np.ndarray: 거리(km)
+    """
+    a, b, f = ELLIPSOIDS['WGS-84']
+    lat1, lon1, lat2, lon2 = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (lat1, lon1, lat2, lon2)))
+    u1 = np.arctan((1 - f) * np.tan(np.radians(lat1)))
+    u2 = np.arctan((1 - f) * np.tan(np.radians(lat2)))
+    sin_u1, cos_u1, sin_u2, cos_u2 = np.sin(u1), np.cos(u1), np.sin(u2), np.cos(u2)
+    big_l = np.radians(lon2 - lon1)
+
+    lam = big_l
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for _ in range(max_iterations):
+            sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+            sin_sigma = np.hypot(cos_u2 * sin_lam, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam)
+            cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+            sin_alpha = np.where(sin_sigma > 0, cos_u1 * cos_u2 * sin_lam / sin_sigma, 0.0)
+            cos2_alpha = 1 - sin_alpha ** 2
+            cos_2sigma_m = np.where(cos2_alpha != 0, cos_sigma - 2 * sin_u1 * sin_u2 / cos2_alpha, 0.0)
+            c = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+            lam_prev = lam
+            lam = big_l + (1 - c) * f * sin_alpha * (
+                sigma + c * sin_sigma * (cos_2sigma_m + c * cos_sigma * (-1 + 2 * cos_2sigma_m ** 2))
+            )
+            if not np.any(np.abs(lam - lam_prev) > 1e-12):
+                break
+
+        u_sq = cos2_alpha * (a * a - b * b) / (b * b)
+        big_a = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
+        big_b = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+        delta_sigma = big_b * sin_sigma * (cos_2sigma_m + big_b / 4 * (
+            cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)
+            - big_b / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)
+        ))
+        distance = b * big_a * (sigma - delta_sigma)
+    return np.where(np.abs(lam - lam_prev) > 1e-12, np.nan, distance)
+
+
+def calculate_distance_to_subway_batch(lats, lons, chunk_size=2048, exact=True):
+    """
+    여러 아파트의 가장 가까운 지하철역과 직선 거리를 한 번에 계산 (km)
+    
+    지하철역 공간 인덱스(KD-tree)로 아파트마다 가까운 역 _BATCH_CANDIDATES개를 찾습니다.
+    exact=True이면 대원 거리 기준 후보 역(보통 1~2개)의 geodesic 거리를 Vincenty 식으로
+    일괄 계산해 calculate_distance_to_subway와 동일한 결과를 반환합니다.
+    후보가 _BATCH_CANDIDATES개를 넘거나, 두 역의 거리가 1mm 이내이거나, 반올림 경계에 걸린
+    드문 행만 geographiclib로 한 행씩 다시 계산합니다.
+    exact=False이면 대원 거리 기준 최근접 역과 대원 거리를 사용합니다 (geodesic과 최대 약 0.5% 차이).
+    
+    Args:
+        lats: 위도 배열 (숫자 변환 불가/0/결측은 계산 제외)
+        lons: 경도 배열
+        chunk_size: 한 번에 계산할 아파트 수
+        exact: geodesic 거리로 최종 보정할지 여부
+    
+    Returns:
+        pd.DataFrame: 가장가까운지하철역, 지하철역거리_km 컬럼 (입력 순서)
+    """
+    lats = pd.to_numeric(pd.Series(np.asarray(lats, dtype=object).ravel()), errors="coerce").to_numpy(dtype=float)
+    lons = pd.to_numeric(pd.Series(np.asarray(lons, dtype=object).ravel()), errors="coerce").to_numpy(dtype=float)
+    
+    station_names = np.asarray(_STATION_NAMES, dtype=object)
+    nearest = np.full(len(lats), None, dtype=object)
+    distances = np.full(len(lats), np.nan)
+    valid = np.flatnonzero(np.isfinite(lats) & np.isfinite(lons) & (lats != 0) & (lons != 0))
+    
+    for start in range(0, len(valid), chunk_size):
+        rows = valid[start:start + chunk_size]
+        row_lats, row_lons = lats[rows], lons[rows]
+        great_circle, candidates = _STATION_INDEX.query(row_lats, row_lons, k=_BATCH_CANDIDATES)
+        
+        if not exact:
+            nearest[rows] = station_names[candidates[:, 0]]
+            distances[rows] = round_series(great_circle[:, 0], 2).to_numpy()
+            continue
+        
+        bounds = great_circle[:, 0] * (1 + _GEODESIC_TOLERANCE) + 1e-9
+        geodesic = np.where(
+            great_circle <= bounds[:, None],
+            _vincenty_km(row_lats[:, None], row_lons[:, None], _STATION_LATS[candidates], _STATION_LONS[candidates]),
+            np.inf,
+        )
+        best_pos = geodesic.argmin(axis=1)
+        best = geodesic[np.arange(len(rows)), best_pos]
+        runner_up = np.partition(geodesic, 1, axis=1)[:, 1] if geodesic.shape[1] > 1 else np.full(len(rows), np.inf)
+        scaled = best * 100.0
+        
+        # Vincenty 결과로 확정할 수 없는 행은 geographiclib로 다시 계산
+        with np.errstate(invalid="ignore"):
+            recheck = (
+                (great_circle[:, -1] <= bounds)
+                | ~np.isfinite(best)
+                | (runner_up - best < _VINCENTY_TOLERANCE_KM)
+                | (np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < _VINCENTY_TOLERANCE_KM * 100.0)
+            )
+        nearest[rows] = station_names[candidates[np.arange(len(rows)), best_pos]]
+        distances[rows] = round_series(best, 2).to_numpy()
+        for row in rows[recheck]:
+            station_indices = _nearest_station_candidates(lats[row], lons[row], k=1)
+            row_distances = _geodesic_to_stations(lats[row], lons[row], station_indices)
+            min_pos = int(np.argmin(row_distances))
+            nearest[row] = _STATION_NAMES[station_indices[min_pos]]
+            distances[row] = round(row_distances[min_pos], 2)
+    
+    return pd.DataFrame({"가장가까운지하철역": nearest, "지하철역거리_km": distances})
+
+
+def calculate_subway_accessibility_batch(
+    lats,
+    lons,
+    count_columns=SUBWAY_COUNT_COLUMNS,
+    rank_columns=SUBWAY_RANK_COLUMNS,
+    hub_columns=SUBWAY_HUB_COLUMNS,
+):
+    """
+    여러 아파트의 지하철 접근성 지표를 한 번에 계산
+
+    - 반경 내 역 수: 지하철역 공간 인덱스(KD-tree)로 반경 검색 개수만 계산
+    - n번째로 가까운 역까지 거리: 공간 인덱스 k-최근접 검색 (대원 거리)
+    - 주요 거점역까지 거리: 아파트 x 거점역 haversine 거리 행렬
+    거리는 km 단위로 소수 둘째 자리까지 반올림합니다.
+
+    Args:
+        lats: 위도 배열 (숫자 변환 불가/0/결측은 계산 제외)
+        lons: 경도 배열
+        count_columns: {반경(m): 컬럼명}
+        rank_columns: {순위(2 이상): 컬럼명}
+        hub_columns: {역 이름: 컬럼명}
+
+    Returns:
+        pd.DataFrame: 접근성 지표 컬럼 (입력 순서, 좌표가 없는 행은 결측)
+    """
+    lats = pd.to_numeric(pd.Series(np.asarray(lats, dtype=object).ravel()), errors="coerce").to_numpy(dtype=float)
+    lons = pd.to_numeric(pd.Series(np.asarray(lons, dtype=object).ravel()), errors="coerce").to_numpy(dtype=float)
+    valid = np.flatnonzero(np.isfinite(lats) & np.isfinite(lons) & (lats != 0) & (lons != 0))
+    valid_lats, valid_lons = lats[valid], lons[valid]
+
+    def distance_column(values):
+        column = np.full(len(lats), np.nan)
+        column[valid] = round_series(values, 2).to_numpy()
+        return column
+
+    result = {}
+    for radius_m, col in count_columns.items():
+        counts = np.full(len(lats), np.nan)
+        counts[valid] = _STATION_INDEX.count_within(valid_lats, valid_lons, radius_m / 1000)
+        result[col] = pd.array(counts, dtype="Int16")
+
+    max_rank = max(rank_columns, default=0)
+    if max_rank > 0:
+        distances, _ = _STATION_INDEX.query(valid_lats, valid_lons, k=max_rank)
+        for rank, col in rank_columns.items():
+            result[col] = distance_column(distances[:, rank - 1]) if rank <= distances.shape[1] else np.full(len(lats), np.nan)
+
+    hubs = [name for name in hub_columns if name in STATIONS]
+    for name in hub_columns:
+        if name not in STATIONS:
+            print(f"⚠️ 거점역 좌표가 없습니다: {name}")
+            result[hub_columns[name]] = np.full(len(lats), np.nan)
+    if hubs:
+        hub_ids = [STATIONS.id_of(name) for name in hubs]
+        matrix = haversine_km(
+            valid_lats[:, None], valid_lons[:, None], _STATION_LATS[None, hub_ids], _STATION_LONS[None, hub_ids]
+        )
+        for pos, name in enumerate(hubs):
+            result[hub_columns[name]] = distance_column(matrix[:, pos])
+
+    return pd.DataFrame({col: result[col] for col in [*count_columns.values(), *rank_columns.values(), *hub_columns.values()]})
+
+
+def add_subway_accessibility(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    위도/경도 컬럼으로 지하철 접근성 지표 컬럼 채우기
+    컬럼이 없거나 값이 비어 있는 행만 모아 calculate_subway_accessibility_batch로 한 번에 계산합니다.
+    (이전에 저장된 데이터셋, 증분 동기화로 합친 데이터셋 보완용)
+
+    Args:
+        df: 위도/경도 컬럼이 있는 데이터프레임
+
+    Returns:
+        pd.DataFrame: 지표 컬럼이 채워진 데이터프레임 (채울 행이 없으면 그대로 반환)
+    """
+    access_columns = [*SUBWAY_COUNT_COLUMNS.values(), *SUBWAY_RANK_COLUMNS.values(), *SUBWAY_HUB_COLUMNS.values()]
+    if df.empty or "위도" not in df.columns or "경도" not in df.columns:
+        return df
+    missing = np.zeros(len(df), dtype=bool)
+    for col in access_columns:
+        missing |= df[col].isna().to_numpy() if col in df.columns else True
+    rows = np.flatnonzero(missing)
+    if len(rows) == 0:
+        return df
+
+    access_df = calculate_subway_accessibility_batch(df["위도"].to_numpy()[rows], df["경도"].to_numpy()[rows])
+    df = df.copy()
+    for col in access_columns:
+        values = (
+            pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=float, na_value=np.nan, copy=True)
+            if col in df.columns else np.full(len(df), np.nan)
+        )
+        computed = access_df[col].to_numpy(dtype=float, na_value=np.nan)
+        values[rows] = np.where(np.isnan(values[rows]), computed, values[rows])
+        df[col] = pd.Series(values, index=df.index).astype(access_df[col].dtype)
+    return df
+
+
 def extract_district(address):
     """
     주소에서 자치구 추출
@@ -62,6 +389,24 @@ def extract_district(address):
     return None
 
 
+def extract_district_series(addresses):
+    """
+    주소 컬럼에서 자치구 일괄 추출 (extract_district의 벡터 버전)
+    
+    고유한 주소 문자열마다 한 번씩만 extract_district를 적용한 조회 테이블로
+    매핑하므로, 같은 주소가 반복되는 대용량 데이터에서도 빠르게 동작합니다.
+    
+    Args:
+        addresses: 주소 문자열 Series/배열
+    
+    Returns:
+        pd.Series: 자치구명 (찾지 못하면 None)
+    """
+    codes, uniques = pd.factorize(pd.Series(addresses, dtype=object))
+    lookup = np.array([extract_district(address) for address in uniques] + [None], dtype=object)
+    return pd.Series(lookup[codes], dtype=object)
+
+
 def extract_dong(address):
     """
     주소에서 동 추출 (도로명 주소에서 동 정보 추출 시도)
@@ -116,3 +461,63 @@ def calculate_pyeong(area_sqm):
     except:
         return None
 
+
+def calculate_pyeong_series(area_sqm):
+    """
+    제곱미터 컬럼을 평형 컬럼으로 일괄 변환 (calculate_pyeong의 벡터 버전)
+    
+    Args:
+        area_sqm: 제곱미터 Series/배열
+    
+    Returns:
+        pd.Series: 평형 (소수점 첫째자리, 변환 불가/결측은 NaN)
+    """
+    area_sqm = pd.to_numeric(pd.Series(area_sqm), errors="coerce").astype(float)
+    return round_series(area_sqm / 3.3058, 1)
+
+
+def round_series(values, ndigits):
+    """
+    Series/배열을 파이썬 내장 round()와 동일한 결과로 일괄 반올림
+    
+    NumPy의 round는 10^ndigits를 곱한 뒤 반올림하므로 x.xx5 근처 값에서
+    round()와 결과가 달라질 수 있습니다. 경계 근처 값만 round()로 다시 계산합니다.
+    
+    Args:
+        values: 숫자 Series/배열
+        ndigits: 소수점 자리수
+    
+    Returns:
+        pd.Series: 반올림된 값
+    """
+    values = pd.Series(values, dtype=float)
+    rounded = values.round(ndigits)
+    with np.errstate(invalid="ignore"):
+        scaled = values.to_numpy() * 10.0 ** ndigits
+        near_half = np.flatnonzero(np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6)
+    for pos in near_half:
+        rounded.iat[pos] = round(float(values.iat[pos]), ndigits)
+    return rounded
+
+
+def preprocess_apartment_df(df: pd.DataFrame) -> pd.DataFrame:
+    """CSV/API에서 읽은 df에 동일한 전처리(동 추가, 임대·오피스텔 제외 등) 적용."""
+    if df.empty:
+        return df
+    df = df.copy()
+    if "동" not in df.columns:
+        if "원본_EMD_ADDR" in df.columns:
+            df["동"] = df["원본_EMD_ADDR"].apply(
+                lambda x: str(x).strip() if pd.notna(x) and str(x).strip() and str(x).strip() != "nan" else None
+            )
+        else:
+            df["동"] = df["주소"].apply(extract_dong)
+    if "아파트명" in df.columns:
+        df = df[~df["아파트명"].astype(str).str.contains("임대", na=False)]
+    if "원본_CMPX_CLSF" in df.columns:
+        df = df[df["원본_CMPX_CLSF"].astype(str).str.contains("아파트", na=False)]
+    if "아파트명" in df.columns:
+        df = df[~df["아파트명"].astype(str).str.contains("오피스텔", na=False, case=False)]
+    if "동" in df.columns:
+        df["동"] = df["동"].replace("답십리1동", "답십리동")
+    return df
@@ -0,0 +1,202 @@
+"""
+도보 네트워크 거리
+도로/보행로 그래프(예: 오프라인 OSM 추출본)에서 모든 지하철역을 출발점으로 다중 출발 Dijkstra를 한 번 실행해
+그래프 노드마다 가장 가까운 역과 도보 거리를 기록해 둡니다.
+단지는 가장 가까운 노드에 붙여(GeoIndex) 노드 값을 그대로 읽으므로 단지별 경로 탐색이 없습니다.
+(그래프 파일이나 scipy가 없으면 사용하지 않음)
+"""
+import os
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from config import WALK_NETWORK_EDGES_FILE, WALK_NETWORK_NODES_FILE, WALK_SNAP_MAX_KM
+from geo_index import GeoIndex
+from storage import find_dataset, load_dataset
+from subway_stations import STATIONS
+
+try:
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import dijkstra
+    USE_SCIPY = True
+except ImportError:
+    USE_SCIPY = False
+
+WALK_STATION_COLUMN = "도보지하철역"
+WALK_DISTANCE_COLUMN = "지하철역도보거리_km"
+
+# OSMnx graph_to_gdfs 컬럼명 → 이 모듈의 컬럼명
+_COLUMN_ALIASES = {"osmid": "node_id", "y": "lat", "x": "lon", "length": "length_m"}
+
+
+class WalkNetwork:
+    """도보 그래프와 노드별 최근접 역 라벨 (역 라벨은 처음 사용할 때 한 번 계산)"""
+
+    def __init__(self, node_lats, node_lons, edge_u, edge_v, edge_m, snap_max_km: float = WALK_SNAP_MAX_KM):
+        """
+        Args:
+            node_lats: 노드 위도 배열
+            node_lons: 노드 경도 배열
+            edge_u: 간선 시작 노드 위치 (노드 배열 순서)
+            edge_v: 간선 끝 노드 위치
+            edge_m: 간선 길이 (m, 양방향으로 사용)
+            snap_max_km: 그래프 노드에 붙일 최대 거리 (km)
+        """
+        self.node_index = GeoIndex(node_lats, node_lons)
+        self.edge_u = np.asarray(edge_u, dtype=np.int64)
+        self.edge_v = np.asarray(edge_v, dtype=np.int64)
+        self.edge_km = np.asarray(edge_m, dtype=float) / 1000
+        self.snap_max_km = snap_max_km
+        self._node_km = None
+        self._node_station = None
+
+    def __len__(self):
+        return len(self.node_index)
+
+    @classmethod
+    def from_frames(cls, nodes: pd.DataFrame, edges: pd.DataFrame, **kwargs) -> "WalkNetwork":
+        """
+        노드/간선 표로 생성 (노드 ID가 없는 간선, 길이가 없거나 음수인 간선은 제외)
+
+        Args:
+            nodes: node_id, lat, lon 컬럼
+            edges: u, v, length_m 컬럼 (u, v는 node_id)
+
+        Returns:
+            WalkNetwork: 도보 그래프
+        """
+        nodes = nodes.rename(columns=_COLUMN_ALIASES)
+        edges = edges.rename(columns=_COLUMN_ALIASES)
+        node_ids = pd.Index(nodes["node_id"])
+        u = node_ids.get_indexer(edges["u"])
+        v = node_ids.get_indexer(edges["v"])
+        length_m = pd.to_numeric(edges["length_m"], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        keep = (u >= 0) & (v >= 0) & (length_m >= 0)
+        return cls(
+            pd.to_numeric(nodes["lat"], errors="coerce").to_numpy(dtype=float),
+            pd.to_numeric(nodes["lon"], errors="coerce").to_numpy(dtype=float),
+            u[keep],
+            v[keep],
+            length_m[keep],
+            **kwargs,
+        )
+
+    def _label_stations(self):
+        """
+        모든 역에서 다중 출발 Dijkstra 1회 실행 → 노드별 (최근접 역 ID, 도보 거리 km)
+        역마다 가상 노드를 두고 가장 가까운 그래프 노드와 직선 거리 간선으로 잇습니다.
+        """
+        n_nodes = len(self)
+        snap_km, snap_node = self.node_index.query(STATIONS.lats, STATIONS.lons, k=1)
+        snap_km, snap_node = snap_km[:, 0], snap_node[:, 0]
+        stations = np.flatnonzero(snap_km <= self.snap_max_km)
+        station_nodes = n_nodes + np.arange(len(stations))
+
+        # 희소 행렬은 중복 간선 길이를 더하므로 노드 쌍별 최단 간선만 사용 (자기 자신 간선 제외)
+        low, high = np.minimum(self.edge_u, self.edge_v), np.maximum(self.edge_u, self.edge_v)
+        order = np.lexsort((self.edge_km, high, low))
+        order = order[low[order] != high[order]]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = (low[order][1:] != low[order][:-1]) | (high[order][1:] != high[order][:-1])
+        edges = order[first]
+
+        rows = np.concatenate([low[edges], station_nodes])
+        cols = np.concatenate([high[edges], snap_node[stations]])
+        # 길이 0 간선은 희소 행렬에서 빠지므로 아주 작은 값으로 보존
+        weights = np.maximum(np.concatenate([self.edge_km[edges], snap_km[stations]]), 1e-9)
+        size = n_nodes + len(stations)
+        graph = coo_matrix((weights, (rows, cols)), shape=(size, size)).tocsr()
+
+        node_km = np.full(n_nodes, np.inf)
+        node_station = np.full(n_nodes, -1, dtype=np.int64)
+        if len(stations):
+            distances, _, sources = dijkstra(
+                graph, directed=False, indices=station_nodes, min_only=True, return_predecessors=True
+            )
+            reached = sources[:n_nodes] >= 0
+            node_km[reached] = distances[:n_nodes][reached]
+            node_station[reached] = stations[sources[:n_nodes][reached] - n_nodes]
+        self._node_km = node_km
+        self._node_station = node_station
+
+    def station_distances(self, lats, lons) -> pd.DataFrame:
+        """
+        여러 단지의 가장 가까운 역(도보 기준)과 도보 거리 계산
+
+        Args:
+            lats: 위도 배열 (숫자 변환 불가/0/결측은 계산 제외)
+            lons: 경도 배열
+
+        Returns:
+            pd.DataFrame: 도보지하철역, 지하철역도보거리_km 컬럼 (입력 순서, 그래프 밖이거나 역에 닿지 않으면 결측)
+        """
+        if self._node_km is None:
+            self._label_stations()
+        lats = pd.to_numeric(pd.Series(np.asarray(lats, dtype=object).ravel()), errors="coerce").to_numpy(dtype=float)
+        lons = pd.to_numeric(pd.Series(np.asarray(lons, dtype=object).ravel()), errors="coerce").to_numpy(dtype=float)
+
+        nearest = np.full(len(lats), None, dtype=object)
+        distances = np.full(len(lats), np.nan)
+        valid = np.flatnonzero(np.isfinite(lats) & np.isfinite(lons) & (lats != 0) & (lons != 0))
+        if len(valid) and len(self):
+            snap_km, snap_node = self.node_index.query(lats[valid], lons[valid], k=1)
+            snap_km, snap_node = snap_km[:, 0], snap_node[:, 0]
+            station = self._node_station[snap_node]
+            ok = (snap_km <= self.snap_max_km) & (station >= 0)
+            rows = valid[ok]
+            nearest[rows] = STATIONS.names[station[ok]]
+            distances[rows] = np.round(snap_km[ok] + self._node_km[snap_node[ok]], 2)
+        return pd.DataFrame({WALK_STATION_COLUMN: nearest, WALK_DISTANCE_COLUMN: distances})
+
+
+def load_walk_network(
+    nodes_file: str = WALK_NETWORK_NODES_FILE,
+    edges_file: str = WALK_NETWORK_EDGES_FILE,
+) -> Optional[WalkNetwork]:
+    """
+    도보 그래프 파일 로드
+
+    Args:
+        nodes_file: 노드 파일 경로 (확장자 무관)
+        edges_file: 간선 파일 경로 (확장자 무관)
+
+    Returns:
+        Optional[WalkNetwork]: 도보 그래프 (파일이나 scipy가 없거나 읽기 실패 시 None)
+    """
+    nodes_path, edges_path = find_dataset(nodes_file), find_dataset(edges_file)
+    if not nodes_path or not edges_path:
+        return None
+    if not USE_SCIPY:
+        print("⚠️ scipy가 없어 도보 거리 계산을 건너뜁니다.")
+        return None
+    try:
+        network = WalkNetwork.from_frames(load_dataset(nodes_path), load_dataset(edges_path))
+    except (OSError, KeyError, ValueError) as e:
+        print(f"⚠️ 도보 그래프 로드 실패 ({os.path.basename(nodes_path)}, {os.path.basename(edges_path)}): {e}")
+        return None
+    print(f"🚶 도보 그래프 로드: 노드 {len(network):,}개, 간선 {len(network.edge_km):,}개")
+    return network
+
+
+def add_walking_distance(df: pd.DataFrame, network: Optional[WalkNetwork] = None) -> pd.DataFrame:
+    """
+    도보지하철역/지하철역도보거리_km 컬럼 추가 (그래프가 없으면 그대로 반환)
+
+    Args:
+        df: 위도/경도 컬럼이 있는 데이터프레임
+        network: 도보 그래프 (None이면 설정된 그래프 파일 로드)
+
+    Returns:
+        pd.DataFrame: 도보 거리 컬럼이 추가된 데이터프레임
+    """
+    if df.empty or "위도" not in df.columns or "경도" not in df.columns:
+        return df
+    network = load_walk_network() if network is None else network
+    if network is None:
+        return df
+    walk_df = network.station_distances(df["위도"].to_numpy(), df["경도"].to_numpy())
+    df = df.copy()
+    df[WALK_STATION_COLUMN] = walk_df[WALK_STATION_COLUMN].to_numpy()
+    df[WALK_DISTANCE_COLUMN] = walk_df[WALK_DISTANCE_COLUMN].to_numpy()
+    return df